@@ -0,0 +1,49 @@
+"""Add tier to poll_interval_configs for adaptive polling
+
+Revision ID: 3f8a1c2d9e47
+Revises: d950c121c96d
+Create Date: 2026-10-16 22:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8a1c2d9e47'
+down_revision = 'd950c121c96d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # poll_interval_configs is created by create_all at startup, so it may not exist yet
+    from sqlalchemy import inspect
+    from alembic import context
+
+    conn = context.get_bind()
+    inspector = inspect(conn)
+
+    if 'poll_interval_configs' not in inspector.get_table_names():
+        return
+
+    columns = [column['name'] for column in inspector.get_columns('poll_interval_configs')]
+    if 'tier' not in columns:
+        with op.batch_alter_table('poll_interval_configs') as batch_op:
+            batch_op.add_column(sa.Column('tier', sa.String(length=20), nullable=True))
+
+
+def downgrade() -> None:
+    from sqlalchemy import inspect
+    from alembic import context
+
+    conn = context.get_bind()
+    inspector = inspect(conn)
+
+    if 'poll_interval_configs' not in inspector.get_table_names():
+        return
+
+    columns = [column['name'] for column in inspector.get_columns('poll_interval_configs')]
+    if 'tier' in columns:
+        with op.batch_alter_table('poll_interval_configs') as batch_op:
+            batch_op.drop_column('tier')
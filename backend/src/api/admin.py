@@ -2,7 +2,7 @@
 Admin API endpoints for user management and system administration.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
@@ -1586,6 +1586,476 @@ async def get_market_data_providers(
     ]
 
 
+class PriceCacheStats(BaseModel):
+    size: int
+    maxSize: int
+    ttlSeconds: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hitRate: float
+
+
+@router.get("/market-data/price-cache", response_model=PriceCacheStats)
+async def get_price_cache_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> PriceCacheStats:
+    """Get hit/miss and eviction counters for the in-process price cache."""
+    from src.services.price_cache import get_price_cache
+
+    stats = get_price_cache().get_stats()
+
+    return PriceCacheStats(
+        size=stats["size"],
+        maxSize=stats["max_size"],
+        ttlSeconds=stats["ttl_seconds"],
+        hits=stats["hits"],
+        misses=stats["misses"],
+        evictions=stats["evictions"],
+        expirations=stats["expirations"],
+        invalidations=stats["invalidations"],
+        hitRate=stats["hit_rate"]
+    )
+
+
+class ActivityLogBufferStats(BaseModel):
+    isRunning: bool
+    buffered: int
+    maxBufferSize: int
+    enqueued: int
+    written: int
+    dropped: int
+    failed: int
+    flushes: int
+    lastFlushAt: Optional[str] = None
+    lastFlushMs: Optional[float] = None
+
+
+@router.get("/market-data/activity-buffer", response_model=ActivityLogBufferStats)
+async def get_activity_log_buffer_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> ActivityLogBufferStats:
+    """Get write-behind provider activity buffer statistics, including dropped rows."""
+    from src.services.activity_log_buffer import get_activity_log_buffer
+
+    stats = get_activity_log_buffer().get_stats()
+
+    return ActivityLogBufferStats(
+        isRunning=stats["is_running"],
+        buffered=stats["buffered"],
+        maxBufferSize=stats["max_buffer_size"],
+        enqueued=stats["enqueued"],
+        written=stats["written"],
+        dropped=stats["dropped"],
+        failed=stats["failed"],
+        flushes=stats["flushes"],
+        lastFlushAt=to_iso_string(stats["last_flush_at"]) if stats["last_flush_at"] else None,
+        lastFlushMs=stats["last_flush_ms"]
+    )
+
+
+class ProviderRateLimitStatus(BaseModel):
+    providerId: str
+    rateLimitPerMinute: Optional[int] = None
+    rateLimitPerDay: Optional[int] = None
+    availableNow: Optional[int] = None
+    remainingToday: Optional[int] = None
+    usedToday: int
+    throttled: int
+    rejected: int
+
+
+@router.get("/market-data/rate-limits", response_model=List[ProviderRateLimitStatus])
+async def get_provider_rate_limits(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+) -> List[ProviderRateLimitStatus]:
+    """Get remaining rate limit quota for each market data provider."""
+    from src.models.market_data_provider import MarketDataProvider as DBMarketDataProvider
+    from src.services.provider_rate_limiter import get_provider_rate_limiter
+
+    limiter = get_provider_rate_limiter()
+    providers = db.query(DBMarketDataProvider).order_by(DBMarketDataProvider.priority).all()
+
+    statuses = []
+    for provider in providers:
+        quota = limiter.get_remaining_quota(provider)
+        statuses.append(ProviderRateLimitStatus(
+            providerId=provider.name,
+            rateLimitPerMinute=quota["rate_limit_per_minute"],
+            rateLimitPerDay=quota["rate_limit_per_day"],
+            availableNow=quota["available_now"],
+            remainingToday=quota["remaining_today"],
+            usedToday=quota["used_today"],
+            throttled=quota["throttled"],
+            rejected=quota["rejected"]
+        ))
+
+    return statuses
+
+
+class ProviderExecutorStats(BaseModel):
+    maxWorkers: int
+    timeoutSeconds: float
+    queueDepth: int
+    active: int
+    completed: int
+    failed: int
+    timeouts: int
+    avgLatencyMs: Optional[float] = None
+    p95LatencyMs: Optional[float] = None
+    avgQueueWaitMs: Optional[float] = None
+
+
+@router.get("/market-data/provider-executor", response_model=ProviderExecutorStats)
+async def get_provider_executor_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> ProviderExecutorStats:
+    """Get queue depth and latency metrics for the provider I/O thread pool."""
+    from src.services.provider_executor import get_provider_executor
+
+    stats = get_provider_executor().get_stats()
+
+    return ProviderExecutorStats(
+        maxWorkers=stats["max_workers"],
+        timeoutSeconds=stats["timeout_seconds"],
+        queueDepth=stats["queue_depth"],
+        active=stats["active"],
+        completed=stats["completed"],
+        failed=stats["failed"],
+        timeouts=stats["timeouts"],
+        avgLatencyMs=stats["avg_latency_ms"],
+        p95LatencyMs=stats["p95_latency_ms"],
+        avgQueueWaitMs=stats["avg_queue_wait_ms"]
+    )
+
+
+class PriceBroadcastStats(BaseModel):
+    subscriptions: int
+    symbols: int
+    portfolios: int
+    published: int
+    valuationsPublished: int
+    delivered: int
+    pending: int
+    dropped: int
+
+
+@router.get("/market-data/price-stream", response_model=PriceBroadcastStats)
+async def get_price_broadcast_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> PriceBroadcastStats:
+    """Get fan-out statistics for prices pushed to streaming clients."""
+    from src.services.price_broadcast_hub import get_price_broadcast_hub
+
+    stats = get_price_broadcast_hub().get_stats()
+
+    return PriceBroadcastStats(
+        subscriptions=stats["subscriptions"],
+        symbols=stats["symbols"],
+        portfolios=stats["portfolios"],
+        published=stats["published"],
+        valuationsPublished=stats["valuations_published"],
+        delivered=stats["delivered"],
+        pending=stats["pending"],
+        dropped=stats["dropped"]
+    )
+
+
+class EventBusStats(BaseModel):
+    backend: str
+    workerId: str
+    isRunning: bool
+    published: int
+    publishFailures: int
+    received: int
+    handlerErrors: int
+    reconnects: Optional[int] = None
+
+
+@router.get("/market-data/event-bus", response_model=EventBusStats)
+async def get_event_bus_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> EventBusStats:
+    """Get statistics for events exchanged with other workers."""
+    from src.services.event_bus import get_event_bus
+
+    stats = get_event_bus().get_stats()
+
+    return EventBusStats(
+        backend=stats["backend"],
+        workerId=stats["worker_id"],
+        isRunning=stats["is_running"],
+        published=stats["published"],
+        publishFailures=stats["publish_failures"],
+        received=stats["received"],
+        handlerErrors=stats["handler_errors"],
+        reconnects=stats.get("reconnects")
+    )
+
+
+class SSEConnectionInfo(BaseModel):
+    connectionId: str
+    userId: str
+    connectionType: str
+    subscribedSymbols: List[str]
+    portfolioIds: List[str]
+    connectedAt: str
+    lastHeartbeat: Optional[str] = None
+    messagesSent: int
+
+
+class SSEConnectionsResponse(BaseModel):
+    active: int
+    pendingWrites: int
+    opened: int
+    closed: int
+    adminDisconnects: int
+    rowsWritten: int
+    flushes: int
+    lastFlushAt: Optional[str] = None
+    connections: List[SSEConnectionInfo]
+
+
+class SSEDisconnectResponse(BaseModel):
+    success: bool
+    message: str
+
+
+@router.get("/market-data/sse-connections", response_model=SSEConnectionsResponse)
+async def get_sse_connections(
+    current_user: User = Depends(get_current_admin_user)
+) -> SSEConnectionsResponse:
+    """Get open SSE connections from the in-memory registry."""
+    from src.services.sse_connection_registry import get_sse_connection_registry
+
+    registry = get_sse_connection_registry()
+    stats = registry.get_stats()
+
+    return SSEConnectionsResponse(
+        active=stats["active"],
+        pendingWrites=stats["pending_writes"],
+        opened=stats["opened"],
+        closed=stats["closed"],
+        adminDisconnects=stats["admin_disconnects"],
+        rowsWritten=stats["rows_written"],
+        flushes=stats["flushes"],
+        lastFlushAt=to_iso_string(stats["last_flush_at"]) if stats["last_flush_at"] else None,
+        connections=[
+            SSEConnectionInfo(
+                connectionId=state.connection_id,
+                userId=str(state.user_id),
+                connectionType=state.connection_type,
+                subscribedSymbols=state.subscribed_symbols,
+                portfolioIds=state.portfolio_ids,
+                connectedAt=to_iso_string(state.connected_at),
+                lastHeartbeat=to_iso_string(state.last_heartbeat) if state.last_heartbeat else None,
+                messagesSent=state.messages_sent
+            )
+            for state in registry.get_connections()
+        ]
+    )
+
+
+@router.post("/market-data/sse-connections/{connection_id}/disconnect", response_model=SSEDisconnectResponse)
+async def disconnect_sse_connection(
+    connection_id: str,
+    current_user: User = Depends(get_current_admin_user)
+) -> SSEDisconnectResponse:
+    """Close an open SSE connection."""
+    from fastapi import HTTPException
+    from src.services.sse_connection_registry import get_sse_connection_registry
+
+    if not get_sse_connection_registry().disconnect(connection_id):
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "not_found", "message": f"SSE connection '{connection_id}' not found"}
+        )
+
+    logger.info(f"SSE connection {connection_id} disconnected by admin {current_user.email}")
+    return SSEDisconnectResponse(success=True, message="SSE connection disconnected")
+
+
+class HttpClientPoolStats(BaseModel):
+    isOpen: bool
+    limit: int
+    limitPerHost: int
+    requests: int
+    connectionsCreated: int
+    connectionsReused: int
+    reuseRate: Optional[float] = None
+    errors: int
+    sessionsCreated: int
+
+
+@router.get("/market-data/http-pool", response_model=HttpClientPoolStats)
+async def get_http_client_pool_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> HttpClientPoolStats:
+    """Get connection reuse statistics for the shared provider HTTP client."""
+    from src.services.http_client_pool import get_http_client_pool
+
+    stats = get_http_client_pool().get_stats()
+
+    return HttpClientPoolStats(
+        isOpen=stats["is_open"],
+        limit=stats["limit"],
+        limitPerHost=stats["limit_per_host"],
+        requests=stats["requests"],
+        connectionsCreated=stats["connections_created"],
+        connectionsReused=stats["connections_reused"],
+        reuseRate=stats["reuse_rate"],
+        errors=stats["errors"],
+        sessionsCreated=stats["sessions_created"]
+    )
+
+
+class UniverseRefreshStats(BaseModel):
+    universeSize: int
+    fresh: int
+    stale: int
+    neverRefreshed: int
+    coverage: Optional[float] = None
+    oldestAgeSeconds: Optional[float] = None
+    cycles: int
+    batchesFetched: int
+    batchesFailed: int
+    lastCycleAt: Optional[str] = None
+    lastCycleMs: Optional[float] = None
+
+
+@router.get("/market-data/refresh-coverage", response_model=UniverseRefreshStats)
+async def get_universe_refresh_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> UniverseRefreshStats:
+    """Get how much of the monitored universe the scheduled refresh keeps fresh."""
+    from src.services.universe_refresh_scheduler import get_universe_refresh_scheduler
+
+    stats = get_universe_refresh_scheduler().get_stats()
+
+    return UniverseRefreshStats(
+        universeSize=stats["universe_size"],
+        fresh=stats["fresh"],
+        stale=stats["stale"],
+        neverRefreshed=stats["never_refreshed"],
+        coverage=stats["coverage"],
+        oldestAgeSeconds=stats["oldest_age_seconds"],
+        cycles=stats["cycles"],
+        batchesFetched=stats["batches_fetched"],
+        batchesFailed=stats["batches_failed"],
+        lastCycleAt=to_iso_string(stats["last_cycle_at"]) if stats["last_cycle_at"] else None,
+        lastCycleMs=stats["last_cycle_ms"]
+    )
+
+
+class SchedulerEngineStats(BaseModel):
+    running: bool
+    paused: bool
+    cycleInFlight: bool
+    cycles: int
+    coalescedRuns: int
+    jobsRun: int
+    jobsFailed: int
+    retries: int
+    timeouts: int
+    inFlight: int
+    peakInFlight: int
+    lastCycleAt: Optional[str] = None
+    lastCycleMs: Optional[float] = None
+
+
+@router.get("/market-data/scheduler-engine", response_model=SchedulerEngineStats)
+async def get_scheduler_engine_stats(
+    current_user: User = Depends(get_current_admin_user)
+) -> SchedulerEngineStats:
+    """Get job concurrency, retry and timeout statistics for scheduled fetches."""
+    from src.services.scheduler_engine import get_scheduler_engine
+
+    stats = get_scheduler_engine().get_stats()
+
+    return SchedulerEngineStats(
+        running=stats["running"],
+        paused=stats["paused"],
+        cycleInFlight=stats["cycle_in_flight"],
+        cycles=stats["cycles"],
+        coalescedRuns=stats["coalesced_runs"],
+        jobsRun=stats["jobs_run"],
+        jobsFailed=stats["jobs_failed"],
+        retries=stats["retries"],
+        timeouts=stats["timeouts"],
+        inFlight=stats["in_flight"],
+        peakInFlight=stats["peak_in_flight"],
+        lastCycleAt=to_iso_string(stats["last_cycle_at"]) if stats["last_cycle_at"] else None,
+        lastCycleMs=stats["last_cycle_ms"]
+    )
+
+
+class PollingPlanPreview(BaseModel):
+    universeSize: int
+    due: int
+    nextPollSeconds: float
+    tierIntervalsMinutes: Dict[str, int]
+    tierCounts: Dict[str, int]
+    dueSymbols: List[str]
+
+
+@router.get("/market-data/polling-plan", response_model=PollingPlanPreview)
+async def get_polling_plan(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+) -> PollingPlanPreview:
+    """Preview which monitored symbols are due for refresh and their polling tiers."""
+    from src.services.market_data_service import MarketDataService
+    from src.services.polling_planner import POLL_TIERS, get_polling_planner
+
+    planner = get_polling_planner()
+    universe = MarketDataService(db).get_monitored_universe(minutes_lookback=60)
+    scores = planner.score(db, universe)
+    plan = planner.plan(db, universe, batch_size=1)
+
+    tier_counts = {tier: 0 for tier in POLL_TIERS}
+    for score in scores:
+        tier_counts[score.tier] += 1
+
+    return PollingPlanPreview(
+        universeSize=len(scores),
+        due=len(plan.symbols),
+        nextPollSeconds=plan.next_poll_seconds,
+        tierIntervalsMinutes=planner.get_tier_intervals(db),
+        tierCounts=tier_counts,
+        dueSymbols=plan.symbols
+    )
+
+
+class ExchangeMarketStatus(BaseModel):
+    exchange: str
+    isOpen: bool
+    timezone: str
+    lastClose: str
+    nextOpen: Optional[str] = None
+
+
+@router.get("/market-data/market-hours", response_model=List[ExchangeMarketStatus])
+async def get_market_hours(
+    current_user: User = Depends(get_current_admin_user)
+) -> List[ExchangeMarketStatus]:
+    """Get whether each exchange is open and its next session transition."""
+    from src.services.trading_calendar import get_trading_calendar
+
+    return [
+        ExchangeMarketStatus(
+            exchange=exchange,
+            isOpen=status["is_open"],
+            timezone=status["timezone"],
+            lastClose=to_iso_string(status["last_close"]),
+            nextOpen=to_iso_string(status["next_open"]) if status["next_open"] else None
+        )
+        for exchange, status in get_trading_calendar().get_status().items()
+    ]
+
+
 # Scheduler Control Models
 class SchedulerStatus(BaseModel):
     schedulerName: str
@@ -2073,5 +2543,8 @@ async def get_live_queue_metrics(
         "activePortfolios": live_metrics["active_portfolios"],
         "rateLimitHits": live_metrics["rate_limit_hits"],
         "isProcessing": live_metrics["is_processing"],
-        "totalSymbolsQueued": live_metrics["total_symbols_queued"]
+        "totalSymbolsQueued": live_metrics["total_symbols_queued"],
+        "debounceSeconds": live_metrics["debounce_seconds"],
+        "batchSize": live_metrics["batch_size"],
+        "deferredUpdates": live_metrics["deferred_updates"]
     }
\ No newline at end of file
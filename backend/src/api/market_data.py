@@ -5,37 +5,69 @@ Provides endpoints for fetching current prices, bulk price updates,
 and Server-Sent Events streaming for real-time updates.
 """
 
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import asyncio
 import json
+import time
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from src.core.dependencies import get_current_user_flexible, get_current_admin_user
-from src.database import get_db
+from src.database import get_async_db, get_db, get_db_bind
 from src.utils.datetime_utils import utc_now, to_iso_string
 from src.models.user import User
 from src.models.stock import Stock
 from src.models.portfolio import Portfolio
 from src.models.holding import Holding
-from src.models.sse_connection import SSEConnection
 from src.models.market_data_usage_metrics import MarketDataUsageMetrics
 from src.models.market_data_provider import ProviderActivity
 from src.services.market_data_service import MarketDataService
 from src.services.trend_calculation_service import TrendCalculationService
 from src.services.activity_service import log_provider_activity
+from src.services.dynamic_portfolio_service import DynamicPortfolioService
+from src.services.price_broadcast_hub import PortfolioValuationUpdate, get_price_broadcast_hub
+from src.services.price_snapshot_service import PriceSnapshotService
+from src.services.sse_payload_encoder import PriceStreamEncoder
+from src.services.sse_connection_registry import get_sse_connection_registry
 from src.core.logging import get_logger
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, select
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1/market-data", tags=["market-data"])
 
+SSE_HEARTBEAT_SECONDS = 30
+
+
+def _portfolio_update_event(valuation: PortfolioValuationUpdate) -> Dict:
+    """Build an SSE portfolio_update event for a recomputed portfolio valuation."""
+    # Money values are strings to keep their precision
+    data = {
+        "portfolio_id": valuation.portfolio_id,
+        "total_value": str(valuation.total_value),
+        "daily_change": str(valuation.daily_change),
+        "daily_change_percent": str(valuation.daily_change_percent),
+        "unrealized_gain_loss": str(valuation.unrealized_gain_loss),
+        "last_updated": to_iso_string(valuation.last_updated) if valuation.last_updated else None,
+        "changed_holdings": [
+            {
+                "symbol": holding.symbol,
+                "quantity": str(holding.quantity),
+                "current_price": str(holding.current_price),
+                "current_value": str(holding.current_value),
+                "unrealized_gain_loss": str(holding.unrealized_gain_loss),
+                "unrealized_gain_loss_percent": str(holding.unrealized_gain_loss_percent)
+            }
+            for holding in valuation.changed_holdings
+        ]
+    }
+    return {"type": "portfolio_update", "data": data}
+
 
 # Pydantic models
 class TrendData(BaseModel):
@@ -217,30 +249,50 @@ def build_price_response(
     return PriceResponse(**base_data)
 
 
+def _master_price_responses(db: Session, symbols: List[str]) -> Dict[str, PriceResponse]:
+    """
+    Build price responses for the symbols present in the master table.
+
+    Runs through AsyncSession.run_sync so the reads do not block the event loop.
+    """
+    master_prices = MarketDataService(db).get_current_prices_from_master(symbols)
+    trend_service = TrendCalculationService(db)
+
+    responses = {}
+    for symbol, master_price_data in master_prices.items():
+        try:
+            responses[symbol] = build_price_response(
+                symbol=symbol,
+                price_record=None,
+                price_data=master_price_data,
+                cached=True,
+                trend_service=trend_service
+            )
+        except Exception as e:
+            logger.warning(f"Failed to build price response for {symbol}: {e}")
+    return responses
+
+
 @router.get("/prices/{symbol}", response_model=PriceResponse)
 async def get_price(
     symbol: str,
     current_user: User = Depends(get_current_user_flexible),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db)
 ):
     """Get current price for a specific symbol with comprehensive market data and trend information."""
 
     symbol = symbol.upper()
+    # The sync session is only used to fetch and store prices missing from the master table
     service = MarketDataService(db)
     trend_service = TrendCalculationService(db)
 
     try:
         # First check master table for current price
-        master_price_data = service.get_current_price_from_master(symbol)
+        master_prices = await async_db.run_sync(_master_price_responses, [symbol])
 
-        if master_price_data:
-            return build_price_response(
-                symbol=symbol,
-                price_record=None,
-                price_data=master_price_data,
-                cached=True,
-                trend_service=trend_service
-            )
+        if symbol in master_prices:
+            return master_prices[symbol]
 
         # Fallback: Fetch fresh data if not in master table
         price_data = await service.fetch_price(symbol)
@@ -275,7 +327,8 @@ async def get_price(
 async def get_bulk_prices(
     symbols: List[str] = Query(..., description="List of stock symbols"),
     current_user: User = Depends(get_current_user_flexible),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db)
 ):
     """Get current prices for multiple symbols with comprehensive market data and trends."""
 
@@ -286,28 +339,22 @@ async def get_bulk_prices(
         )
 
     symbols = [s.upper() for s in symbols]
+    # The sync session is only used to fetch and store prices missing from the master table
     service = MarketDataService(db)
     trend_service = TrendCalculationService(db)
 
     try:
-        # Fetch each symbol individually for simplicity
         prices = {}
         cached_count = 0
         fresh_count = 0
 
+        # Resolve every symbol already in the master table in one batch
+        master_prices = await async_db.run_sync(_master_price_responses, symbols)
+
         for symbol in symbols:
             try:
-                # Check master table first
-                master_price_data = service.get_current_price_from_master(symbol)
-
-                if master_price_data:
-                    prices[symbol] = build_price_response(
-                        symbol=symbol,
-                        price_record=None,
-                        price_data=master_price_data,
-                        cached=True,
-                        trend_service=trend_service
-                    )
+                if symbol in master_prices:
+                    prices[symbol] = master_prices[symbol]
                     cached_count += 1
                 else:
                     # Fallback: Fetch fresh data
@@ -438,71 +485,122 @@ async def refresh_prices(
 async def stream_market_data(
     symbols: Optional[List[str]] = Query(None, description="Symbols to subscribe to"),
     portfolio_ids: Optional[List[str]] = Query(None, description="Portfolio IDs to track"),
+    delta: bool = Query(False, description="Send only changed price fields, with periodic full snapshots"),
+    compact: bool = Query(False, description="Use short keys, integer prices and epoch timestamps"),
     current_user: User = Depends(get_current_user_flexible),
-    db: Session = Depends(get_db)
+    bind: Engine = Depends(get_db_bind),
+    async_db: AsyncSession = Depends(get_async_db)
 ):
     """Server-Sent Events stream for real-time market data updates."""
 
     connection_id = str(uuid.uuid4())
 
-    # Register SSE connection
-    sse_connection = SSEConnection(
+    # Only the user's own active portfolios can be streamed
+    requested_portfolio_ids = []
+    for portfolio_id in portfolio_ids or []:
+        try:
+            requested_portfolio_ids.append(uuid.UUID(portfolio_id))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid portfolio ID: {portfolio_id}"
+            )
+
+    owned_portfolio_ids = []
+    if requested_portfolio_ids:
+        owned_portfolio_ids = list((await async_db.execute(
+            select(Portfolio.id).where(
+                Portfolio.id.in_(requested_portfolio_ids),
+                Portfolio.owner_id == current_user.id,
+                Portfolio.is_active.is_(True)
+            )
+        )).scalars().all())
+
+    # Subscribe before reading current values so no stored price or valuation is missed
+    hub = get_price_broadcast_hub()
+    subscription = hub.subscribe(symbols or [], portfolio_ids=[str(pid) for pid in owned_portfolio_ids])
+
+    # Read current values once, before streaming, so the stream holds no session;
+    # after that updates are pushed as they happen
+    def read_initial_values(session: Session):
+        snapshots = PriceSnapshotService(session).get_snapshots(symbols) if symbols else {}
+        portfolio_service = DynamicPortfolioService(session)
+        valuations = [portfolio_service.calculate_valuation_update(pid) for pid in owned_portfolio_ids]
+        return snapshots, [valuation for valuation in valuations if valuation is not None]
+
+    try:
+        initial_snapshots, initial_valuations = await async_db.run_sync(read_initial_values)
+    except Exception:
+        hub.unsubscribe(subscription)
+        raise
+
+    # Register SSE connection; the registry writes it to sse_connections in batches
+    # through short-lived sessions on the sync engine
+    registry = get_sse_connection_registry()
+    registry.register(
+        bind,
         connection_id=connection_id,
         user_id=current_user.id,
-        subscribed_symbols=symbols or [],
-        portfolio_ids=portfolio_ids or [],
+        subscribed_symbols=symbols,
+        portfolio_ids=[str(pid) for pid in owned_portfolio_ids],
         connection_type="market_data",
-        is_active=True,
-        last_heartbeat=datetime.utcnow()
+        on_disconnect=subscription.close
     )
 
-    db.add(sse_connection)
-    db.commit()
-
     logger.info(f"SSE connection established: {connection_id} for user {current_user.id}")
 
+    encoder = PriceStreamEncoder(delta=delta, compact=compact)
+
     async def event_generator():
         try:
             # Send initial connection event
-            yield f"data: {json.dumps({'type': 'connection', 'connection_id': connection_id, 'status': 'connected'})}\n\n"
-
-            # Send heartbeat every 30 seconds and price updates every 15 minutes
+            yield encoder.dumps({
+                "type": "connection",
+                "connection_id": connection_id,
+                "status": "connected",
+                "format": encoder.describe()
+            })
+            messages_sent = 1
+
+            # Send current values once; after that updates are pushed as they happen
+            initial_prices = encoder.encode_prices(initial_snapshots) if initial_snapshots else None
+            if initial_prices:
+                yield initial_prices
+                messages_sent += 1
+            for valuation in initial_valuations:
+                yield encoder.dumps(_portfolio_update_event(valuation))
+                messages_sent += 1
+            registry.record_sent(connection_id, messages_sent)
+
+            # Send heartbeat every 30 seconds, price updates as soon as they arrive
+            next_heartbeat = 0.0
             while True:
                 try:
-                    # Check if connection is still active in database
-                    conn = db.query(SSEConnection).filter(SSEConnection.connection_id == connection_id).first()
-                    if not conn or not conn.is_active:
+                    # Admin disconnects close the subscription, which wakes the wait below
+                    if not registry.is_active(connection_id):
                         logger.info(f"SSE connection {connection_id} marked as inactive")
                         break
 
-                    # Update heartbeat
-                    conn.last_heartbeat = datetime.utcnow()
-                    db.commit()
-
-                    # Send heartbeat
-                    yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': to_iso_string(utc_now())})}\n\n"
-
-                    # Send price updates from master table
-                    if symbols:
-                        service = MarketDataService(db)
-                        try:
-                            price_updates = {}
-                            for symbol in symbols[:10]:  # Limit to avoid overload
-                                master_price_data = service.get_current_price_from_master(symbol)
-                                if master_price_data:
-                                    price_updates[symbol] = {
-                                        "price": float(master_price_data["price"]),
-                                        "volume": master_price_data.get("volume"),
-                                        "fetched_at": to_iso_string(master_price_data["fetched_at"])
-                                    }
-
-                            if price_updates:
-                                yield f"data: {json.dumps({'type': 'price_update', 'data': price_updates})}\n\n"
-                        finally:
-                            await service.close_session()
-
-                    # Wait for next update cycle
-                    await asyncio.sleep(30)
+                    now = time.monotonic()
+                    if now >= next_heartbeat:
+                        registry.heartbeat(connection_id)
+                        yield encoder.dumps({"type": "heartbeat", "timestamp": to_iso_string(utc_now())})
+                        registry.record_sent(connection_id)
+                        next_heartbeat = now + SSE_HEARTBEAT_SECONDS
+
+                        # Let delta clients resynchronise periodically
+                        if encoder.full_snapshot_due():
+                            yield encoder.encode_full_snapshot()
+                            registry.record_sent(connection_id)
+
+                    updates = await subscription.get(timeout=max(0.0, next_heartbeat - time.monotonic()))
+                    price_update = encoder.encode_prices(updates.prices) if updates.prices else None
+                    if price_update:
+                        yield price_update
+                        registry.record_sent(connection_id)
+                    for valuation in updates.portfolios.values():
+                        yield encoder.dumps(_portfolio_update_event(valuation))
+                        registry.record_sent(connection_id)
 
                 except Exception as e:
                     logger.error(f"Error in SSE stream for {connection_id}: {e}")
@@ -512,16 +610,9 @@ async def stream_market_data(
         except Exception as e:
             logger.error(f"SSE stream error for {connection_id}: {e}")
         finally:
-            # Mark connection as disconnected
-            try:
-                conn = db.query(SSEConnection).filter(SSEConnection.connection_id == connection_id).first()
-                if conn:
-                    conn.is_active = False
-                    conn.disconnected_at = datetime.utcnow()
-                    db.commit()
-                logger.info(f"SSE connection {connection_id} disconnected")
-            except Exception as e:
-                logger.error(f"Error closing SSE connection {connection_id}: {e}")
+            hub.unsubscribe(subscription)
+            registry.unregister(connection_id)
+            logger.info(f"SSE connection {connection_id} disconnected")
 
     return StreamingResponse(
         event_generator(),
@@ -693,7 +784,7 @@ async def control_scheduler(
     """Control scheduler (pause/restart) - admin only."""
 
     try:
-        from src.main import background_task, restart_background_task, pause_background_task
+        from src.main import restart_background_task, pause_background_task
 
         if request.action == "pause":
             success = await pause_background_task()
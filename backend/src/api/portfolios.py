@@ -7,12 +7,13 @@ from uuid import UUID
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, select
 
 from src.core.dependencies import get_current_active_user, get_current_user_flexible
-from src.database import get_db
-from src.models import Portfolio, Holding, User, Stock, NewsNotice, RealtimeSymbol
+from src.database import get_async_db, get_db
+from src.models import Portfolio, Holding, User, Stock, NewsNotice
 from src.schemas.portfolio import (
     PortfolioCreate,
     PortfolioDeleteConfirmation,
@@ -22,36 +23,25 @@ from src.schemas.portfolio import (
 from src.schemas.holding import HoldingResponse
 from src.schemas.news_notice import NewsNoticeResponse
 from src.services.dynamic_portfolio_service import DynamicPortfolioService
+from src.services.price_snapshot_service import PriceSnapshotService
 from src.services.audit_service import AuditService
+from src.services.symbol_portfolio_index import get_symbol_portfolio_index
 
 router = APIRouter(prefix="/api/v1/portfolios", tags=["Portfolios"])
 
 
 @router.get("", response_model=list[PortfolioResponse])
 async def list_portfolios(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[User, Depends(get_current_user_flexible)]
 ) -> list[PortfolioResponse]:
     """List current user's portfolios."""
-    portfolios = db.query(Portfolio).filter(
-        Portfolio.owner_id == current_user.id,
-        Portfolio.is_active.is_(True)
-    ).all()
-
-    # Use dynamic portfolio service to calculate current values
-    dynamic_service = DynamicPortfolioService(db)
+    owner_id = current_user.id
 
-    portfolio_responses = []
-    for portfolio in portfolios:
-        # Get dynamic portfolio with calculated values
-        dynamic_portfolio = dynamic_service.get_dynamic_portfolio(portfolio.id)
-        if dynamic_portfolio:
-            portfolio_responses.append(dynamic_portfolio)
-        else:
-            # Fallback to static values if dynamic calculation fails
-            portfolio_responses.append(PortfolioResponse.model_validate(portfolio))
-
-    return portfolio_responses
+    # Value all portfolios together so they share one price snapshot
+    return await db.run_sync(
+        lambda session: DynamicPortfolioService(session).get_dynamic_portfolios_for_owner(owner_id)
+    )
 
 
 @router.post("", response_model=PortfolioResponse, status_code=status.HTTP_201_CREATED)
@@ -94,15 +84,17 @@ async def create_portfolio(
 @router.get("/{portfolio_id}", response_model=PortfolioResponse)
 async def get_portfolio(
     portfolio_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     current_user: Annotated[User, Depends(get_current_user_flexible)]
 ) -> PortfolioResponse:
     """Get portfolio details for current user."""
-    portfolio = db.query(Portfolio).filter(
-        Portfolio.id == portfolio_id,
-        Portfolio.owner_id == current_user.id,
-        Portfolio.is_active.is_(True)
-    ).first()
+    portfolio = (await db.execute(
+        select(Portfolio).where(
+            Portfolio.id == portfolio_id,
+            Portfolio.owner_id == current_user.id,
+            Portfolio.is_active.is_(True)
+        )
+    )).scalar_one_or_none()
 
     if not portfolio:
         raise HTTPException(
@@ -111,8 +103,9 @@ async def get_portfolio(
         )
 
     # Use dynamic portfolio service to calculate current values
-    dynamic_service = DynamicPortfolioService(db)
-    dynamic_portfolio = dynamic_service.get_dynamic_portfolio(portfolio.id)
+    dynamic_portfolio = await db.run_sync(
+        lambda session: DynamicPortfolioService(session).get_dynamic_portfolio(portfolio_id)
+    )
 
     if dynamic_portfolio:
         return dynamic_portfolio
@@ -196,6 +189,7 @@ async def delete_portfolio(
     # Soft delete
     portfolio.is_active = False
     db.commit()
+    get_symbol_portfolio_index().remove_portfolio(portfolio_id)
 
 
 @router.post("/{portfolio_id}/delete", status_code=status.HTTP_200_OK)
@@ -232,6 +226,7 @@ async def delete_portfolio_with_confirmation(
     # Soft delete
     portfolio.is_active = False
     db.commit()
+    get_symbol_portfolio_index().remove_portfolio(portfolio_id)
 
     # Audit logging
     try:
@@ -306,6 +301,7 @@ async def hard_delete_portfolio_with_confirmation(
     # Hard delete - cascade will handle holdings and transactions
     db.delete(portfolio)
     db.commit()  # Commit both deletion and audit log
+    get_symbol_portfolio_index().remove_portfolio(portfolio_id)
 
     return {"message": "Portfolio permanently deleted"}
 
@@ -313,37 +309,48 @@ async def hard_delete_portfolio_with_confirmation(
 @router.get("/{portfolio_id}/holdings", response_model=list[HoldingResponse])
 async def get_portfolio_holdings(
     portfolio_id: UUID,
-    db: Annotated[Session, Depends(get_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)]
 ) -> list[HoldingResponse]:
     """Get portfolio holdings."""
-    portfolio = db.query(Portfolio).filter(
-        Portfolio.id == portfolio_id,
-        Portfolio.is_active.is_(True)
-    ).first()
-    
-    if not portfolio:
+    portfolio_exists = (await db.execute(
+        select(Portfolio.id).where(
+            Portfolio.id == portfolio_id,
+            Portfolio.is_active.is_(True)
+        )
+    )).scalar_one_or_none()
+
+    if not portfolio_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found"
         )
-    
+
     # Get holdings with fresh timestamps from master table
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
 
-    holdings = db.query(Holding).join(Stock).filter(Holding.portfolio_id == portfolio_id).all()
+    holdings = (await db.execute(
+        select(Holding).join(Stock).options(selectinload(Holding.stock)).where(Holding.portfolio_id == portfolio_id)
+    )).scalars().all()
+
+    # Get fresh prices and timestamps for every holding in one batch
+    symbols = [holding.stock.symbol for holding in holdings]
+    snapshots = await db.run_sync(lambda session: PriceSnapshotService(session).get_snapshots(symbols))
+
+    # Count recent news for every holding's stock in one query
+    news_counts = dict((await db.execute(
+        select(NewsNotice.stock_id, func.count(NewsNotice.id)).where(
+            NewsNotice.stock_id.in_([holding.stock_id for holding in holdings]),
+            NewsNotice.published_date >= thirty_days_ago
+        ).group_by(NewsNotice.stock_id)
+    )).all()) if holdings else {}
 
-    # Calculate recent news count and get fresh timestamps for each holding
+    # Add recent news count and fresh timestamps to each holding
     holdings_with_fresh_data = []
     for holding in holdings:
-        recent_news_count = db.query(func.count(NewsNotice.id)).filter(
-            NewsNotice.stock_id == holding.stock_id,
-            NewsNotice.published_date >= thirty_days_ago
-        ).scalar() or 0
+        recent_news_count = news_counts.get(holding.stock_id, 0)
 
-        # Get fresh price and timestamp from RealtimeSymbol master table
-        realtime_data = db.query(RealtimeSymbol).filter(
-            RealtimeSymbol.symbol == holding.stock.symbol
-        ).first()
+        # Fresh price and timestamp from RealtimeSymbol master table
+        realtime_data = snapshots.get(holding.stock.symbol)
 
         # Convert to dict and add fresh data
         holding_dict = HoldingResponse.model_validate(holding).model_dump()
@@ -351,7 +358,7 @@ async def get_portfolio_holdings(
 
         # Update stock data with fresh timestamps and prices from master table
         if realtime_data:
-            holding_dict['stock']['current_price'] = float(realtime_data.current_price)
+            holding_dict['stock']['current_price'] = float(realtime_data.price)
             holding_dict['stock']['last_price_update'] = realtime_data.last_updated
 
         holdings_with_fresh_data.append(HoldingResponse.model_validate(holding_dict))
@@ -363,14 +370,16 @@ async def get_portfolio_holdings(
 async def get_holding_detail(
     portfolio_id: UUID,
     holding_id: UUID,
-    db: Annotated[Session, Depends(get_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)]
 ) -> HoldingResponse:
     """Get specific holding details."""
-    holding = db.query(Holding).join(Stock).filter(
-        Holding.portfolio_id == portfolio_id,
-        Holding.id == holding_id
-    ).first()
-    
+    holding = (await db.execute(
+        select(Holding).join(Stock).options(selectinload(Holding.stock)).where(
+            Holding.portfolio_id == portfolio_id,
+            Holding.id == holding_id
+        )
+    )).scalar_one_or_none()
+
     if not holding:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -2,9 +2,12 @@
 Database configuration and session management.
 """
 
-from collections.abc import Generator
+import os
+from collections.abc import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 # SQLite database URL
@@ -20,6 +23,21 @@ engine = create_engine(
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the same database, used by hot read paths so queries do not
+# block the event loop; scripts and migrations keep using the sync engine
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./portfolio.db"
+
+# Set PM_SQL_ECHO=1 to log the async engine's SQL; it serves hot request paths,
+# so it is quiet by default
+SQL_ECHO_ENV = "PM_SQL_ECHO"
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=os.getenv(SQL_ECHO_ENV, "").lower() in ("1", "true", "yes"),
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Create Base class for models  
 class Base(DeclarativeBase):
     # Allow legacy annotations temporarily
@@ -35,3 +53,21 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_db_bind() -> Engine:
+    """
+    Dependency function to get the sync engine without opening a session.
+
+    For work that outlives the request handler and opens its own short-lived
+    sessions, such as the SSE connection registry's batched writes.
+    """
+    return engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get an async database session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -5,7 +5,6 @@ FastAPI application entry point for Portfolio Management System.
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-import asyncio
 from contextlib import asynccontextmanager
 
 from src.api.auth import router as auth_router
@@ -29,164 +28,17 @@ from src.core.exceptions import (
 )
 from src.core.logging import setup_logging, set_request_id, get_logger
 from src.database import engine, Base, get_db
-from src.services.market_data_service import MarketDataService
 from src.services.activity_service import log_provider_activity
-from src.services.scheduler_service import get_scheduler_service
+from src.services.scheduler_engine import get_scheduler_engine, shutdown_scheduler_engine
 
 # Setup logging
 setup_logging(level="INFO")
 logger = get_logger(__name__)
 
-# Background task for periodic market data updates
-async def periodic_price_updates():
-    """Background task that periodically fetches prices to generate live activity."""
-    cycle_count = 0
-
-    while True:
-        try:
-            # Check if paused
-            if scheduler_paused:
-                logger.info("Scheduler is paused, waiting...")
-                await asyncio.sleep(30)  # Check every 30 seconds if still paused
-                continue
-
-            # Wait before first execution
-            await asyncio.sleep(60)  # Start after 1 minute
-
-            # Double-check pause status after wait
-            if scheduler_paused:
-                continue
-
-            logger.info(f"Starting periodic price update task - cycle {cycle_count + 1}")
-
-            # Get database session
-            db = next(get_db())
-
-            try:
-                # Get scheduler service and record execution start
-                scheduler_service = get_scheduler_service(db)
-                scheduler_service.record_execution_start()
-
-                # Create market data service
-                service = MarketDataService(db)
-
-                # Get symbols dynamically based on actual usage
-                # Check what providers are available and their bulk limits
-                enabled_providers = service.get_enabled_providers()
-                provider_bulk_limit = 10  # Conservative default
-
-                for provider in enabled_providers:
-                    if provider.name == "yfinance":
-                        provider_bulk_limit = 50  # yfinance bulk limit
-                        break
-                    elif provider.name == "alpha_vantage" and provider.api_key:
-                        provider_bulk_limit = 100  # Alpha Vantage bulk limit
-                        break
-
-                # Get actively monitored symbols from portfolios and recent requests
-                symbols_to_fetch = service.get_actively_monitored_symbols(
-                    provider_bulk_limit=provider_bulk_limit,
-                    minutes_lookback=60
-                )
-
-                # If no symbols found from dynamic discovery, fall back to a small sample
-                if not symbols_to_fetch:
-                    fallback_symbols = ["CBA", "BHP", "WBC", "CSL"]
-                    symbols_to_fetch = fallback_symbols[:provider_bulk_limit]
-                    logger.info(f"No actively monitored symbols found, using fallback: {symbols_to_fetch}")
-                else:
-                    logger.info(f"Dynamic symbol discovery found {len(symbols_to_fetch)} symbols: {symbols_to_fetch}")
-
-                logger.info(f"Selected symbols for cycle {cycle_count + 1} (limit {provider_bulk_limit}): {symbols_to_fetch}")
-
-                # Occasionally add some variety with system-level activities
-                if cycle_count % 3 == 0:  # Every 3rd cycle
-                    log_provider_activity(
-                        db_session=db,
-                        provider_id="system",
-                        activity_type="HEALTH_CHECK",
-                        description="System health check completed",
-                        status="success",
-                        metadata={
-                            "uptime_minutes": cycle_count * 15,
-                            "providers_available": len(service.get_enabled_providers()),
-                            "system_status": "healthy"
-                        }
-                    )
-
-                # Use simplified provider interface - providers handle bulk logic internally
-                logger.info(f"Fetching prices for {len(symbols_to_fetch)} symbols using provider adapters")
-                try:
-                    results = await service.fetch_multiple_prices(symbols_to_fetch)
-                    successful_fetches = len([result for result in results.values() if result is not None])
-                    logger.info(f"Fetch completed: {successful_fetches}/{len(symbols_to_fetch)} successful")
-
-                    # After successful price updates, update portfolio calculations
-                    if successful_fetches > 0:
-                        logger.info("Updating portfolio calculations with fresh market data")
-                        try:
-                            from src.services.real_time_portfolio_service import RealTimePortfolioService
-                            portfolio_service = RealTimePortfolioService(db)
-
-                            # Update portfolios that have holdings in the fetched symbols
-                            successfully_fetched_symbols = [symbol for symbol, result in results.items() if result is not None]
-                            updated_portfolios = portfolio_service.bulk_update_portfolios_for_symbols(successfully_fetched_symbols)
-                            logger.info(f"Updated {len(updated_portfolios)} portfolios with fresh market data for symbols: {successfully_fetched_symbols}")
-
-                        except Exception as portfolio_error:
-                            logger.error(f"Error updating portfolio calculations: {portfolio_error}")
-
-                    # Record successful execution in scheduler service
-                    scheduler_service.record_execution_success(symbols_processed=successful_fetches)
-
-                except Exception as e:
-                    logger.error(f"Error in fetch for periodic task: {e}")
-                    successful_fetches = 0
-
-                    # Record failure in scheduler service
-                    scheduler_service.record_execution_failure(f"Fetch error: {str(e)}")
-
-                # Log bulk operation summary every few cycles
-                if cycle_count % 2 == 1:  # Every other cycle
-                    log_provider_activity(
-                        db_session=db,
-                        provider_id="system",
-                        activity_type="BATCH_SUMMARY",
-                        description=f"Batch update completed: {successful_fetches}/{len(symbols_to_fetch)} symbols updated",
-                        status="success" if successful_fetches > 0 else "warning",
-                        metadata={
-                            "cycle_number": cycle_count + 1,
-                            "symbols_processed": symbols_to_fetch,
-                            "success_count": successful_fetches,
-                            "dynamic_discovery": "enabled",
-                            "provider_bulk_limit": provider_bulk_limit,
-                            "sources": "portfolio_holdings_and_recent_requests"
-                        }
-                    )
-
-                await service.close_session()
-                cycle_count += 1
-
-                logger.info(f"Completed periodic price update task - cycle {cycle_count}")
-
-            except Exception as e:
-                logger.error(f"Error in periodic price update task: {e}")
-            finally:
-                db.close()
-
-            # Wait for next cycle (15 minutes)
-            await asyncio.sleep(900)
-
-        except Exception as e:
-            logger.error(f"Fatal error in periodic task: {e}")
-            await asyncio.sleep(60)  # Wait before retrying
-
-
 async def pause_background_task() -> bool:
     """Pause the background scheduler task."""
-    global scheduler_paused
     try:
-        scheduler_paused = True
+        get_scheduler_engine().pause()
         logger.info("Background scheduler paused by admin control")
         return True
     except Exception as e:
@@ -196,21 +48,17 @@ async def pause_background_task() -> bool:
 
 async def restart_background_task() -> bool:
     """Restart/resume the background scheduler task."""
-    global background_task, scheduler_paused
     try:
-        scheduler_paused = False
+        engine = get_scheduler_engine()
 
         # If the task is dead, restart it
-        if background_task is None or background_task.done():
+        if not engine.is_running:
             logger.info("Restarting background scheduler task...")
-            background_task = asyncio.create_task(periodic_price_updates())
+            engine.start()
             logger.info("Background scheduler task restarted")
 
             # Log system restart activity
             try:
-                from src.database import get_db
-                from src.services.activity_service import log_provider_activity
-
                 db = next(get_db())
                 log_provider_activity(
                     db_session=db,
@@ -227,6 +75,7 @@ async def restart_background_task() -> bool:
             except Exception as log_e:
                 logger.error(f"Failed to log system restart activity: {log_e}")
         else:
+            engine.resume()
             logger.info("Background scheduler resumed from pause")
 
         return True
@@ -234,14 +83,9 @@ async def restart_background_task() -> bool:
         logger.error(f"Error restarting scheduler: {e}")
         return False
 
-# Background task handle and control
-background_task = None
-scheduler_paused = False
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
-    global background_task
 
     # Create database tables
     logger.info("Creating database tables...")
@@ -266,9 +110,45 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize portfolio update queue: {e}")
         # Don't raise - let the app start but queue will be unavailable
 
-    # Start background task
+    # Track SSE connections in memory, writing them in batches
+    try:
+        from src.services.sse_connection_registry import initialize_sse_connection_registry
+        await initialize_sse_connection_registry()
+    except Exception as e:
+        logger.error(f"Failed to start SSE connection registry: {e}")
+
+    # Share stored prices and portfolio updates with other workers
+    try:
+        from src.services.event_bus import initialize_event_bus
+        await initialize_event_bus()
+    except Exception as e:
+        logger.error(f"Failed to start event bus: {e}")
+        # Don't raise - this worker still serves its own updates
+
+    # Start buffered provider activity logging
+    try:
+        from src.services.activity_log_buffer import initialize_activity_log_buffer
+        await initialize_activity_log_buffer()
+    except Exception as e:
+        logger.error(f"Failed to start activity log buffer: {e}")
+        # Don't raise - activities are written synchronously when the buffer is not running
+
+    # Build symbol -> portfolio index used for update fan-out
+    logger.info("Building symbol portfolio index...")
+    try:
+        from src.services.symbol_portfolio_index import get_symbol_portfolio_index
+        db = next(get_db())
+        try:
+            get_symbol_portfolio_index().build(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Failed to build symbol portfolio index: {e}")
+        # Don't raise - the index is built lazily on first use
+
+    # Start the scheduler engine, the only trigger for scheduled fetches
     logger.info("Starting background tasks...")
-    background_task = asyncio.create_task(periodic_price_updates())
+    get_scheduler_engine().start()
 
     yield
 
@@ -281,14 +161,48 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to shutdown portfolio update queue: {e}")
 
-    # Cleanup background task
-    if background_task:
-        logger.info("Stopping background tasks...")
-        background_task.cancel()
-        try:
-            await background_task
-        except asyncio.CancelledError:
-            pass
+    # Stop scheduled fetches
+    logger.info("Stopping background tasks...")
+    await shutdown_scheduler_engine()
+
+    # Release provider I/O worker threads
+    from src.services.provider_executor import shutdown_provider_executor
+    shutdown_provider_executor()
+
+    # Close pooled provider HTTP connections
+    try:
+        from src.services.http_client_pool import shutdown_http_client_pool
+        await shutdown_http_client_pool()
+    except Exception as e:
+        logger.error(f"Failed to close HTTP client pool: {e}")
+
+    # Stop exchanging events with other workers
+    try:
+        from src.services.event_bus import shutdown_event_bus
+        await shutdown_event_bus()
+    except Exception as e:
+        logger.error(f"Failed to stop event bus: {e}")
+
+    # Close pooled async database connections
+    try:
+        from src.database import async_engine
+        await async_engine.dispose()
+    except Exception as e:
+        logger.error(f"Failed to dispose async database engine: {e}")
+
+    # Write the final state of every SSE connection
+    try:
+        from src.services.sse_connection_registry import shutdown_sse_connection_registry
+        await shutdown_sse_connection_registry()
+    except Exception as e:
+        logger.error(f"Failed to flush SSE connection registry: {e}")
+
+    # Flush buffered provider activities last so nothing logged during shutdown is lost
+    try:
+        from src.services.activity_log_buffer import shutdown_activity_log_buffer
+        await shutdown_activity_log_buffer()
+    except Exception as e:
+        logger.error(f"Failed to flush activity log buffer: {e}")
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -23,6 +23,7 @@ class PollIntervalConfig(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     interval_minutes = Column(Integer, nullable=False)
+    tier = Column(String(20), nullable=True)  # high / normal / low polling tier; NULL applies to normal
     reason = Column(Text, nullable=False)
     created_at = Column(DateTime, default=now, nullable=False)
     created_by = Column(String(100), nullable=False)
@@ -30,4 +31,4 @@ class PollIntervalConfig(Base):
     expired_at = Column(DateTime, nullable=True)
 
     def __repr__(self) -> str:
-        return f"<PollIntervalConfig(id={self.id}, interval={self.interval_minutes}min, active={self.is_active})>"
\ No newline at end of file
+        return f"<PollIntervalConfig(id={self.id}, tier={self.tier}, interval={self.interval_minutes}min, active={self.is_active})>"
\ No newline at end of file
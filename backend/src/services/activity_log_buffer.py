@@ -0,0 +1,227 @@
+"""
+Write-behind buffer for provider activity logs.
+
+The market data fetch path logs a ProviderActivity row for nearly every symbol.
+Committing each one individually dominates the scheduler cycle, so activities
+are queued in memory and written in batches when the buffer reaches a size
+threshold or a flush interval elapses, and once more on shutdown.
+"""
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+from threading import Lock
+from typing import Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.core.logging import LoggerMixin
+from src.models.market_data_provider import ProviderActivity
+from src.utils.datetime_utils import now
+
+
+class ActivityLogBuffer(LoggerMixin):
+    """
+    Buffers ProviderActivity rows and writes them in batches.
+
+    Features:
+    - Size threshold: a flush is scheduled once flush_batch_size rows are waiting
+    - Time threshold: waiting rows are flushed every flush_interval_seconds
+    - Bounded memory: rows beyond max_buffer_size are dropped and counted
+    - Rows are written to the same database as the session that logged them
+    """
+
+    def __init__(
+        self,
+        max_buffer_size: int = 5000,
+        flush_batch_size: int = 200,
+        flush_interval_seconds: float = 2.0
+    ):
+        """
+        Initialize the activity log buffer.
+
+        Args:
+            max_buffer_size: Maximum rows held in memory before new rows are dropped
+            flush_batch_size: Number of waiting rows that triggers an early flush
+            flush_interval_seconds: Maximum time a row waits before being written
+        """
+        self.max_buffer_size = max_buffer_size
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._buffer: Deque[Tuple[Engine, Dict]] = deque()
+        self._buffer_lock = Lock()
+        self._flush_lock = Lock()
+
+        # Background flushing
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Counters
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._flushes = 0
+        self._last_flush_at: Optional[datetime] = None
+        self._last_flush_ms: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flush task is active."""
+        return self._flush_task is not None and not self._flush_task.done()
+
+    async def start(self):
+        """Start the background flush task."""
+        if not self.is_running:
+            self._loop = asyncio.get_running_loop()
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+            self.log_info("Activity log buffer started")
+
+    async def stop(self):
+        """Stop the background flush task and write everything still buffered."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        self._flush_event = None
+        self._loop = None
+
+        written = self.flush()
+        self.log_info("Activity log buffer stopped", flushed_on_shutdown=written, dropped=self._dropped)
+
+    def enqueue(self, db_session: Session, row: Dict) -> bool:
+        """
+        Queue one provider activity row for writing.
+
+        Args:
+            db_session: Session of the caller; the row is written to its database
+            row: ProviderActivity column values
+
+        Returns:
+            True if buffered, False if dropped because the buffer is full
+        """
+        row.setdefault("timestamp", now())
+
+        with self._buffer_lock:
+            if len(self._buffer) >= self.max_buffer_size:
+                self._dropped += 1
+                return False
+
+            self._buffer.append((db_session.get_bind(), row))
+            self._enqueued += 1
+            should_flush = len(self._buffer) >= self.flush_batch_size
+
+        if should_flush:
+            self._request_flush()
+        return True
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows, one executemany insert and commit per database.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                pending = list(self._buffer)
+                self._buffer.clear()
+
+            if not pending:
+                return 0
+
+            start = time.monotonic()
+            rows_by_engine: Dict[Engine, List[Dict]] = defaultdict(list)
+            for engine, row in pending:
+                rows_by_engine[engine].append(row)
+
+            written = 0
+            for engine, rows in rows_by_engine.items():
+                try:
+                    with Session(bind=engine) as session:
+                        session.execute(insert(ProviderActivity), rows)
+                        session.commit()
+                    written += len(rows)
+                except Exception as e:
+                    self._failed += len(rows)
+                    self.log_error("Failed to write buffered provider activities", rows=len(rows), error=str(e))
+
+            self._written += written
+            self._flushes += 1
+            self._last_flush_at = now()
+            self._last_flush_ms = round((time.monotonic() - start) * 1000, 2)
+            return written
+
+    def get_stats(self) -> Dict:
+        """Get buffer statistics for monitoring."""
+        with self._buffer_lock:
+            buffered = len(self._buffer)
+
+        return {
+            "is_running": self.is_running,
+            "buffered": buffered,
+            "max_buffer_size": self.max_buffer_size,
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "flushes": self._flushes,
+            "last_flush_at": self._last_flush_at,
+            "last_flush_ms": self._last_flush_ms
+        }
+
+    def _request_flush(self):
+        """Wake the background task to flush early (safe from any thread)."""
+        if self._loop is None or self._flush_event is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._flush_event.set)
+        except RuntimeError:
+            # Loop already closed; the shutdown flush picks the rows up
+            pass
+
+    async def _flush_periodically(self):
+        """Flush on the interval or as soon as the size threshold is reached."""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                self.log_error("Error flushing activity log buffer", error=str(e))
+
+
+# Global instance for the application
+_activity_log_buffer: Optional[ActivityLogBuffer] = None
+
+
+def get_activity_log_buffer() -> ActivityLogBuffer:
+    """Get the global activity log buffer instance."""
+    global _activity_log_buffer
+    if _activity_log_buffer is None:
+        _activity_log_buffer = ActivityLogBuffer()
+    return _activity_log_buffer
+
+
+async def initialize_activity_log_buffer():
+    """Start background flushing for the global activity log buffer."""
+    await get_activity_log_buffer().start()
+
+
+async def shutdown_activity_log_buffer():
+    """Stop the global activity log buffer, flushing anything still queued."""
+    if _activity_log_buffer is not None:
+        await _activity_log_buffer.stop()
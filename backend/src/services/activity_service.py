@@ -111,6 +111,51 @@ def log_provider_activity(
     return activity
 
 
+def queue_provider_activity(
+    db_session: Session,
+    provider_id: str,
+    activity_type: str,
+    description: str,
+    status: str,
+    metadata: Optional[dict] = None,
+    timestamp: Optional[datetime] = None
+) -> None:
+    """
+    Log a provider activity through the write-behind buffer.
+
+    Intended for hot paths such as per-symbol fetch logging. When the buffer's
+    background flusher is not running (e.g. in tests or scripts) the activity
+    is written immediately via log_provider_activity instead.
+
+    Args:
+        db_session: Database session (the activity is written to its database)
+        provider_id: ID of the market data provider
+        activity_type: Type of activity (API_CALL, RATE_LIMIT, API_ERROR, etc.)
+        description: Human-readable description of the activity
+        status: Status of the activity (success, error, warning)
+        metadata: Optional additional context data
+        timestamp: Optional custom timestamp (defaults to current time)
+    """
+    from src.services.activity_log_buffer import get_activity_log_buffer
+
+    buffer = get_activity_log_buffer()
+    if not buffer.is_running:
+        log_provider_activity(db_session, provider_id, activity_type, description, status, metadata, timestamp)
+        return
+
+    row = {
+        "provider_id": provider_id,
+        "activity_type": activity_type,
+        "description": description,
+        "status": status,
+        "activity_metadata": serialize_metadata_for_json(metadata or {})
+    }
+    if timestamp is not None:
+        row["timestamp"] = timestamp
+
+    buffer.enqueue(db_session, row)
+
+
 def get_recent_activities(
     db_session: Session,
     provider_id: str,
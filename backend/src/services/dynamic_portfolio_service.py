@@ -5,17 +5,18 @@ Uses last received price data, not external API calls on each request.
 """
 
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import text, desc
+from sqlalchemy import text, desc, func, and_
 
 from src.core.logging import LoggerMixin
-from src.models import Portfolio, Holding, Stock, RealtimePriceHistory, PortfolioValuation
-from src.models.realtime_symbol import RealtimeSymbol
+from src.models import Portfolio, Holding, Stock, PortfolioValuation
 from src.schemas.portfolio import PortfolioResponse
 from src.schemas.holding import HoldingResponse
+from src.services.price_broadcast_hub import HoldingValuation, PortfolioValuationUpdate
+from src.services.price_snapshot_service import PriceSnapshot, PriceSnapshotService
 
 
 class PortfolioValue:
@@ -33,6 +34,21 @@ class PortfolioValue:
         self.total_gain_percent = total_gain_percent
 
 
+class PortfolioSnapshot:
+    """Container for a single-pass portfolio valuation: totals, holdings and daily change."""
+    def __init__(
+        self,
+        value: Optional[PortfolioValue] = None,
+        holdings: Optional[List[HoldingResponse]] = None,
+        daily_change: Decimal = Decimal("0.00"),
+        daily_change_percent: Decimal = Decimal("0.00")
+    ):
+        self.value = value or PortfolioValue()
+        self.holdings = holdings or []
+        self.daily_change = daily_change
+        self.daily_change_percent = daily_change_percent
+
+
 class DynamicPortfolioService(LoggerMixin):
     """Service for calculating dynamic portfolio valuations using cached price data."""
 
@@ -60,67 +76,14 @@ class DynamicPortfolioService(LoggerMixin):
                     self.log_info("Using cached portfolio valuation", portfolio_id=str(portfolio_id))
                     return cached_value
 
-            # Get all holdings for the portfolio
-            holdings = self.db.query(Holding).options(
-                joinedload(Holding.stock)
-            ).filter(
-                Holding.portfolio_id == portfolio_id,
-                Holding.quantity > 0
-            ).all()
+            holdings = self._get_active_holdings(portfolio_id)
 
             if not holdings:
                 self.log_info("No holdings found for portfolio", portfolio_id=str(portfolio_id))
                 return PortfolioValue()
 
-            # Get unique symbols from holdings
             symbols = list(set(holding.stock.symbol for holding in holdings))
-            self.log_info("Getting cached prices for symbols", symbols=symbols)
-
-            # Get cached current prices
-            current_prices = self._get_cached_prices(symbols)
-
-            # Calculate values for each holding
-            total_value = Decimal("0.00")
-            total_cost_basis = Decimal("0.00")
-
-            for holding in holdings:
-                symbol = holding.stock.symbol
-                quantity = holding.quantity
-                average_cost = holding.average_cost
-
-                # Get cached price or fallback to average cost
-                current_price = current_prices.get(symbol)
-                if current_price is None:
-                    self.log_warning(f"No cached price available for {symbol}, using average cost as fallback")
-                    current_price = average_cost
-
-                # Calculate values
-                holding_cost_basis = quantity * average_cost
-                holding_current_value = quantity * current_price
-
-                total_value += holding_current_value
-                total_cost_basis += holding_cost_basis
-
-                self.log_debug(
-                    f"Holding calculation: {symbol}",
-                    quantity=str(quantity),
-                    average_cost=str(average_cost),
-                    current_price=str(current_price),
-                    current_value=str(holding_current_value)
-                )
-
-            # Calculate unrealized gain/loss and percentage
-            total_unrealized_gain = total_value - total_cost_basis
-            total_gain_percent = Decimal("0.00")
-            if total_cost_basis > 0:
-                total_gain_percent = (total_unrealized_gain / total_cost_basis) * 100
-
-            result = PortfolioValue(
-                total_value=total_value,
-                total_cost_basis=total_cost_basis,
-                total_unrealized_gain=total_unrealized_gain,
-                total_gain_percent=total_gain_percent
-            )
+            result = self._value_holdings(holdings, self._get_master_price_data(symbols)).value
 
             # Skip caching for now to avoid readonly database errors
             # self._cache_portfolio_value(portfolio_id, result, len(holdings))
@@ -140,6 +103,95 @@ class DynamicPortfolioService(LoggerMixin):
             # Return default values on error
             return PortfolioValue()
 
+    def calculate_portfolio_snapshot(
+        self,
+        portfolio: Portfolio,
+        price_snapshots: Optional[Dict[str, PriceSnapshot]] = None
+    ) -> PortfolioSnapshot:
+        """
+        Value a portfolio in a single pass.
+
+        Holdings are taken from the (eagerly loaded) portfolio relationship and
+        master prices plus previous closes are resolved with one query, so the
+        totals, per-holding rows and daily change all come from the same data.
+
+        Args:
+            portfolio: Portfolio with holdings and stocks loaded
+            price_snapshots: Preloaded price snapshots to share across portfolios;
+                fetched for this portfolio's symbols when omitted
+
+        Returns:
+            PortfolioSnapshot with totals, holdings and daily change
+        """
+        holdings = [holding for holding in portfolio.holdings if holding.quantity > 0]
+        if not holdings:
+            return PortfolioSnapshot()
+
+        if price_snapshots is None:
+            symbols = list(set(holding.stock.symbol for holding in holdings))
+            price_snapshots = self._get_master_price_data(symbols)
+
+        snapshot = self._value_holdings(holdings, price_snapshots)
+
+        self.log_info(
+            "Portfolio snapshot calculated",
+            portfolio_id=str(portfolio.id),
+            holdings_count=len(holdings),
+            total_value=str(snapshot.value.total_value),
+            daily_change=str(snapshot.daily_change)
+        )
+
+        return snapshot
+
+    def calculate_valuation_update(
+        self,
+        portfolio_id: UUID,
+        changed_symbols: Optional[Iterable[str]] = None
+    ) -> Optional[PortfolioValuationUpdate]:
+        """
+        Value a portfolio for pushing to streaming clients.
+
+        Args:
+            portfolio_id: UUID of the portfolio
+            changed_symbols: Symbols whose holdings to include (None = all holdings)
+
+        Returns:
+            PortfolioValuationUpdate, or None if the portfolio is not active
+        """
+        portfolio = self.db.query(Portfolio).options(
+            joinedload(Portfolio.holdings).joinedload(Holding.stock)
+        ).filter(
+            Portfolio.id == portfolio_id,
+            Portfolio.is_active.is_(True)
+        ).first()
+
+        if not portfolio:
+            return None
+
+        snapshot = self.calculate_portfolio_snapshot(portfolio)
+        wanted = set(changed_symbols) if changed_symbols is not None else None
+
+        return PortfolioValuationUpdate(
+            portfolio_id=str(portfolio.id),
+            total_value=snapshot.value.total_value,
+            daily_change=snapshot.daily_change,
+            daily_change_percent=snapshot.daily_change_percent,
+            unrealized_gain_loss=snapshot.value.total_unrealized_gain,
+            last_updated=portfolio.price_last_updated or portfolio.updated_at,
+            changed_holdings=[
+                HoldingValuation(
+                    symbol=holding.stock.symbol,
+                    quantity=holding.quantity,
+                    current_price=holding.stock.current_price,
+                    current_value=holding.current_value,
+                    unrealized_gain_loss=holding.unrealized_gain_loss,
+                    unrealized_gain_loss_percent=holding.unrealized_gain_loss_percent
+                )
+                for holding in snapshot.holdings
+                if wanted is None or holding.stock.symbol in wanted
+            ]
+        )
+
     def get_dynamic_portfolio(self, portfolio_id: UUID) -> Optional[PortfolioResponse]:
         """
         Get portfolio with dynamically calculated values.
@@ -151,7 +203,7 @@ class DynamicPortfolioService(LoggerMixin):
             PortfolioResponse with current market values
         """
         try:
-            # Get the portfolio
+            # Get the portfolio together with its holdings and stocks
             portfolio = self.db.query(Portfolio).options(
                 joinedload(Portfolio.holdings).joinedload(Holding.stock)
             ).filter(
@@ -163,39 +215,96 @@ class DynamicPortfolioService(LoggerMixin):
                 self.log_warning("Portfolio not found", portfolio_id=str(portfolio_id))
                 return None
 
-            # Calculate dynamic values
-            portfolio_value = self.calculate_portfolio_value(portfolio_id)
+            snapshot = self.calculate_portfolio_snapshot(portfolio)
 
-            # Get holdings with current market prices
-            updated_holdings = self._get_dynamic_holdings(portfolio_id)
-
-            # Calculate daily change separately from unrealized gain
-            daily_change_value = self.calculate_daily_change(portfolio_id)
-            daily_change_percent = self.calculate_daily_change_percent(portfolio_id, daily_change_value)
-
-            # Create response with updated values including unrealized P&L
-            portfolio_dict = {
-                "id": portfolio.id,
-                "name": portfolio.name,
-                "description": portfolio.description,
-                "owner_id": portfolio.owner_id,
-                "total_value": portfolio_value.total_value,
-                "daily_change": daily_change_value,
-                "daily_change_percent": daily_change_percent,
-                "unrealized_gain_loss": portfolio_value.total_unrealized_gain,
-                "unrealized_gain_loss_percent": portfolio_value.total_gain_percent,
-                "created_at": portfolio.created_at,
-                "updated_at": portfolio.updated_at,
-                "is_active": portfolio.is_active,
-                "holdings": updated_holdings
-            }
-
-            return PortfolioResponse.model_validate(portfolio_dict)
+            # Prefer a valid cached valuation for the totals, as calculate_portfolio_value does
+            portfolio_value = self._get_cached_portfolio_value(portfolio_id) or snapshot.value
+
+            return self._build_portfolio_response(portfolio, portfolio_value, snapshot)
 
         except Exception as e:
             self.log_error("Error getting dynamic portfolio", portfolio_id=str(portfolio_id), error=str(e))
             return None
 
+    def get_dynamic_portfolios_for_owner(self, owner_id: UUID) -> List[PortfolioResponse]:
+        """
+        Get all of a user's active portfolios with dynamically calculated values.
+
+        Values every portfolio in a constant number of queries: one for the
+        portfolios with holdings and stocks, one price snapshot shared by all
+        of them and one for cached valuations.
+
+        Args:
+            owner_id: UUID of the portfolio owner
+
+        Returns:
+            List of PortfolioResponse objects with current market values
+        """
+        portfolios = self.db.query(Portfolio).options(
+            joinedload(Portfolio.holdings).joinedload(Holding.stock)
+        ).filter(
+            Portfolio.owner_id == owner_id,
+            Portfolio.is_active.is_(True)
+        ).all()
+
+        if not portfolios:
+            return []
+
+        symbols = list(set(
+            holding.stock.symbol
+            for portfolio in portfolios
+            for holding in portfolio.holdings
+            if holding.quantity > 0
+        ))
+        price_snapshots = self._get_master_price_data(symbols)
+        cached_values = self._get_cached_portfolio_values([portfolio.id for portfolio in portfolios])
+
+        portfolio_responses = []
+        for portfolio in portfolios:
+            try:
+                snapshot = self.calculate_portfolio_snapshot(portfolio, price_snapshots)
+                portfolio_value = cached_values.get(portfolio.id) or snapshot.value
+                portfolio_responses.append(self._build_portfolio_response(portfolio, portfolio_value, snapshot))
+            except Exception as e:
+                self.log_error("Error getting dynamic portfolio", portfolio_id=str(portfolio.id), error=str(e))
+                # Fallback to static values if dynamic calculation fails
+                portfolio_responses.append(PortfolioResponse.model_validate(portfolio))
+
+        self.log_info(
+            "Batch portfolio valuation completed",
+            owner_id=str(owner_id),
+            portfolio_count=len(portfolios),
+            symbol_count=len(symbols)
+        )
+
+        return portfolio_responses
+
+    def _build_portfolio_response(
+        self,
+        portfolio: Portfolio,
+        portfolio_value: PortfolioValue,
+        snapshot: PortfolioSnapshot
+    ) -> PortfolioResponse:
+        """Build the API response for a portfolio from its valuation snapshot."""
+        # Create response with updated values including unrealized P&L
+        portfolio_dict = {
+            "id": portfolio.id,
+            "name": portfolio.name,
+            "description": portfolio.description,
+            "owner_id": portfolio.owner_id,
+            "total_value": portfolio_value.total_value,
+            "daily_change": snapshot.daily_change,
+            "daily_change_percent": snapshot.daily_change_percent,
+            "unrealized_gain_loss": portfolio_value.total_unrealized_gain,
+            "unrealized_gain_loss_percent": portfolio_value.total_gain_percent,
+            "created_at": portfolio.created_at,
+            "updated_at": portfolio.updated_at,
+            "is_active": portfolio.is_active,
+            "holdings": snapshot.holdings
+        }
+
+        return PortfolioResponse.model_validate(portfolio_dict)
+
     def _get_dynamic_holdings(self, portfolio_id: UUID) -> List[HoldingResponse]:
         """
         Get holdings with dynamically calculated current values.
@@ -207,77 +316,116 @@ class DynamicPortfolioService(LoggerMixin):
             List of HoldingResponse objects with updated values
         """
         try:
-            # Get holdings with stock info
-            holdings = self.db.query(Holding).options(
-                joinedload(Holding.stock)
-            ).filter(
-                Holding.portfolio_id == portfolio_id,
-                Holding.quantity > 0
-            ).all()
+            holdings = self._get_active_holdings(portfolio_id)
 
             if not holdings:
                 return []
 
-            # Get cached prices AND fresh timestamps for all symbols
-            symbols = [holding.stock.symbol for holding in holdings]
-            price_data = self._get_prices_and_timestamps(symbols)
-
-            updated_holdings = []
-            for holding in holdings:
-                symbol = holding.stock.symbol
-                symbol_data = price_data.get(symbol, {})
-                current_price = symbol_data.get("price", holding.average_cost)
-                fresh_timestamp = symbol_data.get("last_updated")
-
-                # Debug logging for timestamp tracing
-                self.log_info(f"TIMESTAMP DEBUG - Building holding for {symbol}: fresh_timestamp={fresh_timestamp}, price={current_price}")
-
-                if current_price is None:
-                    current_price = holding.average_cost
-
-                # Calculate updated values
-                current_value = holding.quantity * current_price
-                cost_basis = holding.quantity * holding.average_cost
-                unrealized_gain_loss = current_value - cost_basis
-
-                # Calculate unrealized gain/loss percentage
-                unrealized_gain_loss_percent = Decimal("0.00")
-                if cost_basis > 0:
-                    unrealized_gain_loss_percent = (unrealized_gain_loss / cost_basis) * 100
-
-                # Create holding dict with updated values including FRESH timestamp
-                holding_dict = {
-                    "id": holding.id,
-                    "portfolio_id": holding.portfolio_id,
-                    "stock_id": holding.stock_id,
-                    "stock": {
-                        "id": holding.stock.id,
-                        "symbol": holding.stock.symbol,
-                        "company_name": holding.stock.company_name,
-                        "exchange": holding.stock.exchange,
-                        "status": holding.stock.status,
-                        "current_price": current_price,
-                        "last_price_update": fresh_timestamp,  # FRESH timestamp from master table
-                        "created_at": holding.stock.created_at,
-                        "updated_at": holding.stock.updated_at
-                    },
-                    "quantity": holding.quantity,
-                    "average_cost": holding.average_cost,
-                    "current_value": current_value,
-                    "unrealized_gain_loss": unrealized_gain_loss,
-                    "unrealized_gain_loss_percent": unrealized_gain_loss_percent,
-                    "created_at": holding.created_at,
-                    "updated_at": holding.updated_at
-                }
-
-                updated_holdings.append(HoldingResponse.model_validate(holding_dict))
-
-            return updated_holdings
+            symbols = list(set(holding.stock.symbol for holding in holdings))
+            return self._value_holdings(holdings, self._get_master_price_data(symbols)).holdings
 
         except Exception as e:
             self.log_error("Error getting dynamic holdings", portfolio_id=str(portfolio_id), error=str(e))
             return []
 
+    def _get_active_holdings(self, portfolio_id: UUID) -> List[Holding]:
+        """Load the portfolio's holdings with a positive quantity, stocks included."""
+        return self.db.query(Holding).options(
+            joinedload(Holding.stock)
+        ).filter(
+            Holding.portfolio_id == portfolio_id,
+            Holding.quantity > 0
+        ).all()
+
+    def _value_holdings(self, holdings: List[Holding], snapshots: Dict[str, PriceSnapshot]) -> PortfolioSnapshot:
+        """
+        Calculate totals, per-holding rows and daily change from preloaded data.
+
+        Performs no queries: holdings must have their stock loaded and snapshots
+        come from _get_master_price_data.
+
+        Args:
+            holdings: Holdings to value
+            snapshots: Dictionary mapping symbols to master table price snapshots
+
+        Returns:
+            PortfolioSnapshot for the given holdings
+        """
+        total_value = Decimal("0.00")
+        total_cost_basis = Decimal("0.00")
+        total_daily_change = Decimal("0.00")
+        holding_rows = []
+
+        for holding in holdings:
+            symbol = holding.stock.symbol
+            quantity = holding.quantity
+            average_cost = holding.average_cost
+            snapshot = snapshots.get(symbol)
+
+            # Get cached price or fallback to average cost
+            current_price = snapshot.price if snapshot else None
+            if current_price is None:
+                self.log_warning(f"No cached price available for {symbol}, using average cost as fallback")
+                current_price = average_cost
+
+            # Calculate values
+            cost_basis = quantity * average_cost
+            current_value = quantity * current_price
+            unrealized_gain_loss = current_value - cost_basis
+
+            unrealized_gain_loss_percent = Decimal("0.00")
+            if cost_basis > 0:
+                unrealized_gain_loss_percent = (unrealized_gain_loss / cost_basis) * 100
+
+            total_value += current_value
+            total_cost_basis += cost_basis
+
+            # Daily change = (current_price - previous_close) * quantity
+            if snapshot and snapshot.previous_close is not None:
+                total_daily_change += (snapshot.price - snapshot.previous_close) * quantity
+
+            holding_rows.append(HoldingResponse.model_validate({
+                "id": holding.id,
+                "portfolio_id": holding.portfolio_id,
+                "stock_id": holding.stock_id,
+                "stock": {
+                    "id": holding.stock.id,
+                    "symbol": symbol,
+                    "company_name": holding.stock.company_name,
+                    "exchange": holding.stock.exchange,
+                    "status": holding.stock.status,
+                    "current_price": current_price,
+                    "last_price_update": snapshot.last_updated if snapshot else None,  # FRESH timestamp from master table
+                    "created_at": holding.stock.created_at,
+                    "updated_at": holding.stock.updated_at
+                },
+                "quantity": quantity,
+                "average_cost": average_cost,
+                "current_value": current_value,
+                "unrealized_gain_loss": unrealized_gain_loss,
+                "unrealized_gain_loss_percent": unrealized_gain_loss_percent,
+                "created_at": holding.created_at,
+                "updated_at": holding.updated_at
+            }))
+
+        # Calculate unrealized gain/loss and percentage
+        total_unrealized_gain = total_value - total_cost_basis
+        total_gain_percent = Decimal("0.00")
+        if total_cost_basis > 0:
+            total_gain_percent = (total_unrealized_gain / total_cost_basis) * 100
+
+        return PortfolioSnapshot(
+            value=PortfolioValue(
+                total_value=total_value,
+                total_cost_basis=total_cost_basis,
+                total_unrealized_gain=total_unrealized_gain,
+                total_gain_percent=total_gain_percent
+            ),
+            holdings=holding_rows,
+            daily_change=total_daily_change,
+            daily_change_percent=self._daily_change_percent(total_value, total_daily_change)
+        )
+
     def update_portfolio_cache_values(self, portfolio_id: UUID) -> bool:
         """
         Update the cached portfolio values in the database.
@@ -361,29 +509,8 @@ class DynamicPortfolioService(LoggerMixin):
         Returns:
             Dictionary mapping symbols to their current prices from master table
         """
-        if not symbols:
-            return {}
-
-        try:
-            # Get current prices from master table (realtime_symbols)
-            prices = {}
-
-            for symbol in symbols:
-                # Get current price from master table
-                master_record = self.db.query(RealtimeSymbol).filter(
-                    RealtimeSymbol.symbol == symbol
-                ).first()
-
-                if master_record:
-                    prices[symbol] = Decimal(str(master_record.current_price))
-                    self.log_debug(f"Master table price for {symbol}: {master_record.current_price}")
-
-            self.log_info("Retrieved prices from master table", symbols=symbols, found_count=len(prices))
-            return prices
-
-        except Exception as e:
-            self.log_error("Error retrieving prices from master table", error=str(e))
-            return {}
+        snapshots = self._get_master_price_data(symbols)
+        return {symbol: snapshot.price for symbol, snapshot in snapshots.items()}
 
     def _get_prices_and_timestamps(self, symbols: List[str]) -> Dict[str, Dict]:
         """
@@ -398,34 +525,26 @@ class DynamicPortfolioService(LoggerMixin):
         Returns:
             Dictionary mapping symbols to their price data with fresh timestamps
         """
-        if not symbols:
-            return {}
+        snapshots = self._get_master_price_data(symbols)
+        return {
+            symbol: {"price": snapshot.price, "last_updated": snapshot.last_updated}
+            for symbol, snapshot in snapshots.items()
+        }
 
-        try:
-            # Get current prices and timestamps from master table (realtime_symbols)
-            price_data = {}
-
-            for symbol in symbols:
-                # Get current price and fresh timestamp from master table
-                master_record = self.db.query(RealtimeSymbol).filter(
-                    RealtimeSymbol.symbol == symbol
-                ).first()
-
-                if master_record:
-                    price_data[symbol] = {
-                        "price": Decimal(str(master_record.current_price)),
-                        "last_updated": master_record.last_updated  # FRESH timestamp
-                    }
-                    # Use INFO level to ensure we see this in logs
-                    self.log_info(f"TIMESTAMP DEBUG - Master table data for {symbol}: ${master_record.current_price} at {master_record.last_updated}")
-                else:
-                    self.log_info(f"TIMESTAMP DEBUG - No master record found for symbol: {symbol}")
-
-            self.log_info("Retrieved prices and timestamps from master table", symbols=symbols, found_count=len(price_data))
-            return price_data
+    def _get_master_price_data(self, symbols: List[str]) -> Dict[str, PriceSnapshot]:
+        """
+        Get price, timestamp and previous close for many symbols at once.
 
+        Args:
+            symbols: List of stock symbols to get prices for
+
+        Returns:
+            Dictionary mapping symbols to their master table price snapshots
+        """
+        try:
+            return PriceSnapshotService(self.db).get_snapshots(symbols)
         except Exception as e:
-            self.log_error("Error retrieving prices and timestamps from master table", error=str(e))
+            self.log_error("Error retrieving prices from master table", error=str(e))
             return {}
 
     def _get_cached_portfolio_value(self, portfolio_id: UUID) -> Optional[PortfolioValue]:
@@ -448,26 +567,71 @@ class DynamicPortfolioService(LoggerMixin):
                 self.log_debug("No cached valuation found", portfolio_id=str(portfolio_id))
                 return None
 
-            if cached_valuation.is_expired:
-                self.log_debug("Cached valuation expired", portfolio_id=str(portfolio_id))
-                return None
+            return self._valuation_to_value(cached_valuation)
 
-            if cached_valuation.is_stale:
-                self.log_debug("Cached valuation marked as stale", portfolio_id=str(portfolio_id))
-                return None
+        except Exception as e:
+            self.log_error("Error retrieving cached portfolio value", portfolio_id=str(portfolio_id), error=str(e))
+            return None
 
-            # Convert to PortfolioValue object
-            return PortfolioValue(
-                total_value=Decimal(str(cached_valuation.total_value)),
-                total_cost_basis=Decimal(str(cached_valuation.total_cost_basis)),
-                total_unrealized_gain=Decimal(str(cached_valuation.total_gain_loss)),
-                total_gain_percent=Decimal(str(cached_valuation.total_gain_loss_percent))
-            )
+    def _get_cached_portfolio_values(self, portfolio_ids: List[UUID]) -> Dict[UUID, PortfolioValue]:
+        """
+        Get the latest valid cached valuation for many portfolios in one query.
+
+        Args:
+            portfolio_ids: UUIDs of the portfolios
+
+        Returns:
+            Dictionary mapping portfolio IDs to cached values; portfolios without
+            a valid cached valuation are omitted
+        """
+        if not portfolio_ids:
+            return {}
+
+        try:
+            latest = self.db.query(
+                PortfolioValuation.portfolio_id,
+                func.max(PortfolioValuation.calculated_at).label("calculated_at")
+            ).filter(
+                PortfolioValuation.portfolio_id.in_(portfolio_ids)
+            ).group_by(PortfolioValuation.portfolio_id).subquery()
+
+            cached_valuations = self.db.query(PortfolioValuation).join(
+                latest,
+                and_(
+                    PortfolioValuation.portfolio_id == latest.c.portfolio_id,
+                    PortfolioValuation.calculated_at == latest.c.calculated_at
+                )
+            ).all()
+
+            cached_values = {}
+            for cached_valuation in cached_valuations:
+                value = self._valuation_to_value(cached_valuation)
+                if value:
+                    cached_values[cached_valuation.portfolio_id] = value
+            return cached_values
 
         except Exception as e:
-            self.log_error("Error retrieving cached portfolio value", portfolio_id=str(portfolio_id), error=str(e))
+            self.log_error("Error retrieving cached portfolio values", error=str(e))
+            return {}
+
+    def _valuation_to_value(self, cached_valuation: PortfolioValuation) -> Optional[PortfolioValue]:
+        """Convert a cached valuation to a PortfolioValue, or None if expired or stale."""
+        if cached_valuation.is_expired:
+            self.log_debug("Cached valuation expired", portfolio_id=str(cached_valuation.portfolio_id))
+            return None
+
+        if cached_valuation.is_stale:
+            self.log_debug("Cached valuation marked as stale", portfolio_id=str(cached_valuation.portfolio_id))
             return None
 
+        # Convert to PortfolioValue object
+        return PortfolioValue(
+            total_value=Decimal(str(cached_valuation.total_value)),
+            total_cost_basis=Decimal(str(cached_valuation.total_cost_basis)),
+            total_unrealized_gain=Decimal(str(cached_valuation.total_gain_loss)),
+            total_gain_percent=Decimal(str(cached_valuation.total_gain_loss_percent))
+        )
+
     def calculate_daily_change(self, portfolio_id: UUID) -> Decimal:
         """
         Calculate portfolio daily change based on (current_price - previous_close) * quantity.
@@ -479,61 +643,13 @@ class DynamicPortfolioService(LoggerMixin):
             Daily change amount in dollars
         """
         try:
-            # Get all holdings for the portfolio
-            holdings = self.db.query(Holding).options(
-                joinedload(Holding.stock)
-            ).filter(
-                Holding.portfolio_id == portfolio_id,
-                Holding.quantity > 0
-            ).all()
+            holdings = self._get_active_holdings(portfolio_id)
 
             if not holdings:
                 return Decimal("0.00")
 
-            total_daily_change = Decimal("0.00")
-
-            for holding in holdings:
-                symbol = holding.stock.symbol
-                quantity = holding.quantity
-
-                # Get master symbol record
-                master_symbol = self.db.query(RealtimeSymbol).filter(
-                    RealtimeSymbol.symbol == symbol
-                ).first()
-
-                if not master_symbol:
-                    self.log_warning(f"No master symbol found for {symbol}, skipping daily change calculation")
-                    continue
-
-                current_price = master_symbol.current_price
-
-                # Get previous close from linked history record
-                previous_close = None
-                if master_symbol.latest_history_id:
-                    history_record = self.db.query(RealtimePriceHistory).filter(
-                        RealtimePriceHistory.id == master_symbol.latest_history_id
-                    ).first()
-                    if history_record and history_record.previous_close:
-                        previous_close = history_record.previous_close
-
-                if previous_close is None:
-                    # No previous close data available, skip this holding for daily change
-                    self.log_debug(f"No previous close data for {symbol}, daily change = 0")
-                    continue
-
-                # Calculate daily change for this holding
-                price_change = current_price - previous_close
-                holding_daily_change = price_change * quantity
-                total_daily_change += holding_daily_change
-
-                self.log_debug(
-                    f"Daily change calculation: {symbol}",
-                    current_price=str(current_price),
-                    previous_close=str(previous_close),
-                    price_change=str(price_change),
-                    quantity=str(quantity),
-                    holding_daily_change=str(holding_daily_change)
-                )
+            symbols = list(set(holding.stock.symbol for holding in holdings))
+            total_daily_change = self._value_holdings(holdings, self._get_master_price_data(symbols)).daily_change
 
             self.log_info("Portfolio daily change calculated", portfolio_id=str(portfolio_id), daily_change=str(total_daily_change))
             return total_daily_change
@@ -559,35 +675,23 @@ class DynamicPortfolioService(LoggerMixin):
 
             # Get current portfolio value
             portfolio_value = self.calculate_portfolio_value(portfolio_id, use_cache=False)
-            current_value = portfolio_value.total_value
-
-            if current_value == 0:
-                return Decimal("0.00")
-
-            # Calculate yesterday's value: current_value - daily_change
-            yesterday_value = current_value - daily_change
-
-            if yesterday_value <= 0:
-                return Decimal("0.00")
-
-            # Calculate percentage: (daily_change / yesterday_value) * 100
-            daily_change_percent = (daily_change / yesterday_value) * 100
-
-            self.log_debug(
-                "Daily change percentage calculated",
-                portfolio_id=str(portfolio_id),
-                daily_change=str(daily_change),
-                current_value=str(current_value),
-                yesterday_value=str(yesterday_value),
-                percentage=str(daily_change_percent)
-            )
-
-            return daily_change_percent
+            return self._daily_change_percent(portfolio_value.total_value, daily_change)
 
         except Exception as e:
             self.log_error("Error calculating daily change percentage", portfolio_id=str(portfolio_id), error=str(e))
             return Decimal("0.00")
 
+    def _daily_change_percent(self, current_value: Decimal, daily_change: Decimal) -> Decimal:
+        """Daily change as a percentage of yesterday's value (current_value - daily_change)."""
+        if daily_change == 0 or current_value == 0:
+            return Decimal("0.00")
+
+        yesterday_value = current_value - daily_change
+        if yesterday_value <= 0:
+            return Decimal("0.00")
+
+        return (daily_change / yesterday_value) * 100
+
     def _cache_portfolio_value(self, portfolio_id: UUID, portfolio_value: PortfolioValue, holdings_count: int) -> bool:
         """
         Cache the calculated portfolio value.
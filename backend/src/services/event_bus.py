@@ -0,0 +1,427 @@
+"""
+Cross-worker event bus for price changes and portfolio updates.
+
+The price cache, broadcast hub and PortfolioUpdateQueue are per-process, so
+with several uvicorn workers a price stored in one worker never reached SSE
+clients attached to another. Each worker now publishes stored prices and
+completed portfolio updates to the bus and applies events received from other
+workers to its own cache and hub. Redis pub/sub carries events between
+workers; the in-memory backend connects buses within one process and is used
+for single-worker deployments and tests.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import socket
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.core.logging import LoggerMixin
+from src.services.price_snapshot_service import PriceSnapshot
+
+PRICE_CHANNEL = "portfolio-manager:prices"
+PORTFOLIO_CHANNEL = "portfolio-manager:portfolio-updates"
+CHANNELS = (PRICE_CHANNEL, PORTFOLIO_CHANNEL)
+
+# Set to a redis:// URL to share events between workers
+REDIS_URL_ENV = "PM_REDIS_URL"
+
+# Handlers that hand work to the background return its future so failures are counted
+EventHandler = Callable[[Dict], Optional[asyncio.Future]]
+
+
+def snapshot_to_event(snapshot: PriceSnapshot) -> Dict:
+    """Serialize a price snapshot for the bus."""
+    return {
+        "symbol": snapshot.symbol,
+        "price": str(snapshot.price),
+        "last_updated": snapshot.last_updated.isoformat() if snapshot.last_updated else None,
+        "previous_close": str(snapshot.previous_close) if snapshot.previous_close is not None else None,
+        "provider": snapshot.provider,
+        "company_name": snapshot.company_name,
+        "volume": snapshot.volume,
+        "market_cap": str(snapshot.market_cap) if snapshot.market_cap is not None else None
+    }
+
+
+def snapshot_from_event(event: Dict) -> PriceSnapshot:
+    """Deserialize a price snapshot received from the bus."""
+    return PriceSnapshot(
+        symbol=event["symbol"],
+        price=Decimal(event["price"]),
+        last_updated=datetime.fromisoformat(event["last_updated"]) if event.get("last_updated") else None,
+        previous_close=Decimal(event["previous_close"]) if event.get("previous_close") is not None else None,
+        provider=event.get("provider"),
+        company_name=event.get("company_name"),
+        volume=event.get("volume"),
+        market_cap=Decimal(event["market_cap"]) if event.get("market_cap") is not None else None
+    )
+
+
+class EventBus(LoggerMixin, ABC):
+    """
+    Publishes events to other workers and dispatches the events they publish.
+
+    Events published by this worker are not dispatched back to it; local
+    consumers are updated directly by the publisher.
+    """
+
+    def __init__(self, worker_id: Optional[str] = None):
+        """
+        Initialize the bus.
+
+        Args:
+            worker_id: Identifier of this worker (defaults to host, pid and a random suffix)
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Counters
+        self._published = 0
+        self._publish_failures = 0
+        self._received = 0
+        self._handler_errors = 0
+
+    @property
+    @abstractmethod
+    def backend(self) -> str:
+        """Backend name for monitoring."""
+
+    def add_handler(self, channel: str, handler: EventHandler) -> None:
+        """Call handler with the payload of every event other workers publish on channel."""
+        self._handlers[channel].append(handler)
+
+    async def start(self) -> None:
+        """Start receiving events."""
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self) -> None:
+        """Stop receiving events."""
+        self._loop = None
+
+    def publish(self, channel: str, payload: Dict) -> None:
+        """
+        Publish an event to other workers without blocking (safe from any thread).
+
+        Args:
+            channel: Channel to publish on
+            payload: JSON-serializable event payload
+        """
+        message = json.dumps({"origin": self.worker_id, "payload": payload})
+        try:
+            self._send(channel, message)
+            self._published += 1
+        except Exception as e:
+            self._publish_failures += 1
+            self.log_error("Failed to publish event", channel=channel, error=str(e))
+
+    def publish_prices(self, snapshots: Iterable[PriceSnapshot]) -> None:
+        """Publish stored price snapshots to other workers."""
+        events = [snapshot_to_event(snapshot) for snapshot in snapshots]
+        if events:
+            self.publish(PRICE_CHANNEL, {"snapshots": events})
+
+    def publish_portfolio_update(self, portfolio_id: str, symbols: Iterable[str]) -> None:
+        """Publish a completed portfolio update to other workers."""
+        self.publish(PORTFOLIO_CHANNEL, {"portfolio_id": str(portfolio_id), "symbols": sorted(symbols)})
+
+    @abstractmethod
+    def _send(self, channel: str, message: str) -> None:
+        """Hand a serialized event to the backend."""
+
+    def _receive(self, channel: str, message: str) -> None:
+        """Dispatch a serialized event from the backend to this worker's handlers."""
+        try:
+            event = json.loads(message)
+        except (TypeError, ValueError):
+            self._handler_errors += 1
+            self.log_warning("Ignoring malformed event", channel=channel)
+            return
+
+        if event.get("origin") == self.worker_id:
+            return
+
+        self._received += 1
+        for handler in self._handlers.get(channel, ()):
+            try:
+                future = handler(event.get("payload") or {})
+            except Exception as e:
+                self._handler_errors += 1
+                self.log_error("Error handling event", channel=channel, error=str(e))
+                continue
+            if isinstance(future, asyncio.Future):
+                future.add_done_callback(functools.partial(self._on_handler_done, channel))
+
+    def _on_handler_done(self, channel: str, future: Any) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._handler_errors += 1
+            self.log_error("Error handling event", channel=channel, error=str(error))
+
+    def get_stats(self) -> Dict:
+        """Get bus statistics for monitoring."""
+        return {
+            "backend": self.backend,
+            "worker_id": self.worker_id,
+            "is_running": self._loop is not None,
+            "published": self._published,
+            "publish_failures": self._publish_failures,
+            "received": self._received,
+            "handler_errors": self._handler_errors
+        }
+
+
+class InMemoryBroker:
+    """Connects in-memory buses within one process, standing in for Redis."""
+
+    def __init__(self):
+        self._buses: List["InMemoryEventBus"] = []
+        self._lock = Lock()
+
+    def attach(self, bus: "InMemoryEventBus") -> None:
+        with self._lock:
+            if bus not in self._buses:
+                self._buses.append(bus)
+
+    def detach(self, bus: "InMemoryEventBus") -> None:
+        with self._lock:
+            if bus in self._buses:
+                self._buses.remove(bus)
+
+    def deliver(self, channel: str, message: str) -> None:
+        """Deliver a message to every attached bus on its own loop."""
+        with self._lock:
+            buses = list(self._buses)
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        for bus in buses:
+            loop = bus._loop
+            if loop is None or loop is running_loop:
+                bus._receive(channel, message)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(bus._receive, channel, message)
+
+
+class InMemoryEventBus(EventBus):
+    """Event bus whose events only reach buses attached to the same broker."""
+
+    def __init__(self, broker: Optional[InMemoryBroker] = None, worker_id: Optional[str] = None):
+        super().__init__(worker_id)
+        self.broker = broker or InMemoryBroker()
+        self.broker.attach(self)
+
+    @property
+    def backend(self) -> str:
+        return "memory"
+
+    async def stop(self) -> None:
+        await super().stop()
+        self.broker.detach(self)
+
+    def _send(self, channel: str, message: str) -> None:
+        self.broker.deliver(channel, message)
+
+
+class RedisEventBus(EventBus):
+    """
+    Event bus backed by Redis pub/sub.
+
+    Publishing is fire-and-forget on the bus's event loop; the subscriber
+    reconnects with backoff if the connection drops.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: Optional[str] = None,
+        reconnect_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0
+    ):
+        super().__init__(worker_id)
+        self.url = url
+        self.reconnect_backoff_seconds = reconnect_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        self._redis = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._reconnects = 0
+
+    @property
+    def backend(self) -> str:
+        return "redis"
+
+    async def start(self) -> None:
+        import redis.asyncio as redis_asyncio
+
+        await super().start()
+        self._redis = redis_asyncio.from_url(self.url)
+        self._listen_task = asyncio.create_task(self._listen())
+        self.log_info("Redis event bus started", worker_id=self.worker_id)
+
+    async def stop(self) -> None:
+        if self._listen_task and not self._listen_task.done():
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+        self._listen_task = None
+
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+        await super().stop()
+
+    def _send(self, channel: str, message: str) -> None:
+        loop = self._loop
+        if loop is None or self._redis is None:
+            raise RuntimeError("Redis event bus is not running")
+
+        coroutine = self._redis.publish(channel, message)
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is loop:
+            task = loop.create_task(coroutine)
+            task.add_done_callback(self._on_publish_done)
+        else:
+            future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+            future.add_done_callback(self._on_publish_done)
+
+    def _on_publish_done(self, future) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._publish_failures += 1
+            self.log_error("Failed to publish event to Redis", error=str(error))
+
+    async def _listen(self) -> None:
+        """Receive events, reconnecting with exponential backoff."""
+        backoff = self.reconnect_backoff_seconds
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(*CHANNELS)
+                backoff = self.reconnect_backoff_seconds
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    channel = message["channel"]
+                    data = message["data"]
+                    self._receive(
+                        channel.decode() if isinstance(channel, bytes) else channel,
+                        data.decode() if isinstance(data, bytes) else data
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._reconnects += 1
+                self.log_error("Redis event bus connection lost", error=str(e), retry_in_seconds=backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(self.max_backoff_seconds, backoff * 2)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def get_stats(self) -> Dict:
+        stats = super().get_stats()
+        stats["reconnects"] = self._reconnects
+        return stats
+
+
+def _apply_remote_prices(payload: Dict) -> None:
+    """Refresh this worker's price cache and stream subscribers with another worker's prices."""
+    from src.services.price_broadcast_hub import get_price_broadcast_hub
+    from src.services.price_cache import get_price_cache
+
+    snapshots = [snapshot_from_event(event) for event in payload.get("snapshots", [])]
+    get_price_cache().put_many({snapshot.symbol: snapshot for snapshot in snapshots})
+    get_price_broadcast_hub().publish_many(snapshots)
+
+
+def _publish_remote_valuation(portfolio_id: str, symbols: List[str]) -> None:
+    """Recompute a portfolio's valuation and publish it to this worker's subscribers."""
+    from src.database import SessionLocal
+    from src.services.dynamic_portfolio_service import DynamicPortfolioService
+    from src.services.price_broadcast_hub import get_price_broadcast_hub
+
+    db = SessionLocal()
+    try:
+        valuation = DynamicPortfolioService(db).calculate_valuation_update(uuid.UUID(portfolio_id), symbols)
+    finally:
+        db.close()
+
+    if valuation is not None:
+        get_price_broadcast_hub().publish_portfolio(valuation)
+
+
+def _apply_remote_portfolio_update(payload: Dict) -> Optional[asyncio.Future]:
+    """Push a portfolio recomputed by another worker to this worker's stream subscribers."""
+    from src.services.price_broadcast_hub import get_price_broadcast_hub
+
+    portfolio_id = payload.get("portfolio_id")
+    if not portfolio_id or not get_price_broadcast_hub().has_portfolio_subscribers(portfolio_id):
+        return None
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _publish_remote_valuation(portfolio_id, payload.get("symbols") or [])
+        return None
+
+    # Keep database reads off the event loop
+    return loop.run_in_executor(None, _publish_remote_valuation, portfolio_id, payload.get("symbols") or [])
+
+
+def create_event_bus() -> EventBus:
+    """Create the bus for this worker: Redis when PM_REDIS_URL is set, otherwise in-memory."""
+    redis_url = os.getenv(REDIS_URL_ENV)
+    bus = RedisEventBus(redis_url) if redis_url else InMemoryEventBus()
+    bus.add_handler(PRICE_CHANNEL, _apply_remote_prices)
+    bus.add_handler(PORTFOLIO_CHANNEL, _apply_remote_portfolio_update)
+    return bus
+
+
+# Global instance for the application
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the global event bus instance."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = create_event_bus()
+    return _event_bus
+
+
+async def initialize_event_bus():
+    """Start receiving events from other workers."""
+    await get_event_bus().start()
+
+
+async def shutdown_event_bus():
+    """Stop the global event bus."""
+    global _event_bus
+    if _event_bus is not None:
+        await _event_bus.stop()
+        _event_bus = None
@@ -0,0 +1,159 @@
+"""
+Application-lifetime HTTP client pool for market data providers.
+
+Creating an aiohttp.ClientSession per MarketDataService instance throws away
+keep-alive connections, DNS cache entries and TLS sessions after every
+request. This pool owns a single session for the life of the application,
+bounds connections per host and records how often connections are reused.
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+import aiohttp
+
+from src.core.logging import LoggerMixin
+
+DEFAULT_USER_AGENT = "Portfolio-Manager/1.0"
+
+
+class HttpClientPool(LoggerMixin):
+    """
+    Shared aiohttp session with a bounded, keep-alive connection pool.
+
+    Features:
+    - Connection reuse: one TCPConnector keeps idle connections warm between requests
+    - Limits: at most limit connections overall and limit_per_host per host
+    - DNS caching: resolved addresses are cached for dns_cache_ttl_seconds
+    - Metrics: requests, new connections, reused connections and errors
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout_seconds: float = 30.0,
+        dns_cache_ttl_seconds: int = 300,
+        request_timeout_seconds: float = 30.0
+    ):
+        """
+        Initialize the HTTP client pool.
+
+        Args:
+            limit: Maximum number of simultaneous connections
+            limit_per_host: Maximum simultaneous connections to one host
+            keepalive_timeout_seconds: How long idle connections are kept open
+            dns_cache_ttl_seconds: How long resolved host addresses are cached
+            request_timeout_seconds: Total timeout applied to each request
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout_seconds = keepalive_timeout_seconds
+        self.dns_cache_ttl_seconds = dns_cache_ttl_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Counters
+        self._requests = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._errors = 0
+        self._sessions_created = 0
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared session, creating it on first use.
+
+        A session is bound to the event loop it was created on, so a new one is
+        created if the running loop has changed (e.g. between test cases).
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self._create_session()
+            self._loop = loop
+            self._sessions_created += 1
+            self.log_info(
+                "Created shared HTTP session",
+                limit=self.limit,
+                limit_per_host=self.limit_per_host
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared session and its pooled connections."""
+        session, self._session = self._session, None
+        self._loop = None
+        if session is not None and not session.closed:
+            await session.close()
+            self.log_info("Closed shared HTTP session")
+
+    def get_stats(self) -> Dict:
+        """Get connection reuse statistics for monitoring."""
+        total_connections = self._connections_created + self._connections_reused
+        connector = self._session.connector if self._session is not None and not self._session.closed else None
+        return {
+            "is_open": connector is not None,
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "requests": self._requests,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_rate": round(self._connections_reused / total_connections, 4) if total_connections else None,
+            "errors": self._errors,
+            "sessions_created": self._sessions_created
+        }
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout_seconds,
+            ttl_dns_cache=self.dns_cache_ttl_seconds
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            trace_configs=[self._create_trace_config()]
+        )
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self._requests += 1
+
+        async def on_connection_create_end(session, context, params):
+            self._connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self._connections_reused += 1
+
+        async def on_request_exception(session, context, params):
+            self._errors += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+
+# Global instance for the application
+_http_client_pool: Optional[HttpClientPool] = None
+
+
+def get_http_client_pool() -> HttpClientPool:
+    """Get the global HTTP client pool instance."""
+    global _http_client_pool
+    if _http_client_pool is None:
+        _http_client_pool = HttpClientPool()
+    return _http_client_pool
+
+
+async def shutdown_http_client_pool():
+    """Close the global HTTP client pool's session and connections."""
+    if _http_client_pool is not None:
+        await _http_client_pool.close()
@@ -11,9 +11,10 @@ from decimal import Decimal
 import asyncio
 import aiohttp
 import logging
+import uuid
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from sqlalchemy import desc, and_, insert
 
 from src.models.market_data_provider import MarketDataProvider
 from src.models.realtime_price_history import RealtimePriceHistory
@@ -24,34 +25,43 @@ from src.models.holding import Holding
 from src.models.stock import Stock
 from src.models.portfolio import Portfolio
 from src.utils.datetime_utils import utc_now
-from src.services.activity_service import log_provider_activity
+from src.services.activity_service import log_provider_activity, queue_provider_activity
+from src.services.http_client_pool import get_http_client_pool
+from src.services.event_bus import get_event_bus
+from src.services.price_broadcast_hub import get_price_broadcast_hub
+from src.services.price_cache import get_price_cache
+from src.services.price_snapshot_service import PriceSnapshot, PriceSnapshotService
+from src.services.price_fetch_coordinator import get_price_fetch_coordinator
+from src.services.provider_executor import get_provider_executor
+from src.services.provider_rate_limiter import get_provider_rate_limiter
+from src.services.trading_calendar import is_asx_symbol
 from src.core.logging import get_logger
 from src.utils.datetime_utils import to_iso_string
 
 logger = get_logger(__name__)
 
+# yfinance has no hard bulk limit but per-request latency degrades with too many symbols
+YFINANCE_BULK_CHUNK_SIZE = 50
+
 
 class MarketDataService:
     """Service for fetching and managing market data."""
 
     def __init__(self, db: Session):
         self.db = db
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._recent_fetches = {}  # Track recent fetches to avoid duplicates
+        self._recent_fetches = {}  # Per-instance record of fetch times; deduplication is process-wide
 
     async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={"User-Agent": "Portfolio-Manager/1.0"}
-            )
-        return self._session
+        """Get the application-wide pooled HTTP session."""
+        return await get_http_client_pool().get_session()
 
     async def close_session(self):
-        """Close HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """
+        Release this service's HTTP resources.
+
+        The pooled session is shared and owned by the application lifespan, so
+        it is left open to keep connections warm for the next request.
+        """
 
     def get_enabled_providers(self) -> List[MarketDataProvider]:
         """Get list of enabled providers ordered by priority."""
@@ -78,15 +88,20 @@ class MarketDataService:
         return any(self.supports_bulk_operations(provider) for provider in providers)
 
     async def fetch_price(self, symbol: str) -> Optional[Dict]:
-        """Fetch current price for a symbol using available providers."""
-        # Check if we've fetched this symbol recently (within 10 minutes)
-        now = datetime.utcnow()
-        if symbol in self._recent_fetches:
-            last_fetch_time = self._recent_fetches[symbol]
-            if (now - last_fetch_time).total_seconds() < 600:  # 10 minutes
-                logger.info(f"Skipping {symbol} - fetched recently at {last_fetch_time}")
-                return None
+        """
+        Fetch current price for a symbol using available providers.
+
+        Concurrent requests for the same symbol, from any service instance,
+        share one provider call, and a successful result is reused for the
+        next 10 minutes instead of refetching.
+        """
+        return await get_price_fetch_coordinator().fetch(
+            symbol, lambda: self._fetch_price_from_providers(symbol)
+        )
 
+    async def _fetch_price_from_providers(self, symbol: str) -> Optional[Dict]:
+        """Fetch current price for a symbol, trying each enabled provider in priority order."""
+        now = datetime.utcnow()
         providers = self.get_enabled_providers()
 
         for provider in providers:
@@ -107,7 +122,7 @@ class MarketDataService:
 
                     # Log successful activity for admin dashboard
                     response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-                    log_provider_activity(
+                    queue_provider_activity(
                         db_session=self.db,
                         provider_id=provider.name,
                         activity_type="API_CALL",
@@ -130,7 +145,7 @@ class MarketDataService:
                 self._log_api_usage(provider, symbol, 500, False, str(e))
 
                 # Log error activity for admin dashboard
-                log_provider_activity(
+                queue_provider_activity(
                     db_session=self.db,
                     provider_id=provider.name,
                     activity_type="API_ERROR",
@@ -148,7 +163,7 @@ class MarketDataService:
         logger.error(f"Failed to fetch price for {symbol} from all providers")
         # Log that all providers failed
         if providers:
-            log_provider_activity(
+            queue_provider_activity(
                 db_session=self.db,
                 provider_id="system",
                 activity_type="PROVIDER_FAILURE",
@@ -163,18 +178,27 @@ class MarketDataService:
 
         return None
 
-    def get_actively_monitored_symbols(self, provider_bulk_limit: int = 10, minutes_lookback: int = 60) -> List[str]:
+    def get_provider_bulk_limit(self) -> int:
+        """Get the number of symbols the highest-priority bulk provider accepts per batch."""
+        for provider in self.get_enabled_providers():
+            if provider.name == "yfinance":
+                return YFINANCE_BULK_CHUNK_SIZE
+            elif provider.name == "alpha_vantage" and provider.api_key:
+                return 100  # Alpha Vantage REALTIME_BULK_QUOTES limit
+
+        return 10  # Conservative default
+
+    def get_monitored_universe(self, minutes_lookback: int = 60) -> List[str]:
         """
-        Get list of symbols that should be actively monitored based on:
+        Get every symbol that should be actively monitored based on:
         1. Current portfolio holdings
         2. Recent price requests
 
         Args:
-            provider_bulk_limit: Maximum symbols per batch (provider-specific)
             minutes_lookback: How far back to look for recent price requests
 
         Returns:
-            List of symbol strings to monitor, limited by provider_bulk_limit
+            Sorted list of all monitored symbol strings
         """
         monitored_symbols = set()
 
@@ -204,10 +228,23 @@ class MarketDataService:
             monitored_symbols.add(symbol_tuple[0])
 
         # Convert to sorted list for consistent ordering
-        symbol_list = sorted(list(monitored_symbols))
+        return sorted(monitored_symbols)
 
-        # Limit to provider bulk limit
-        return symbol_list[:provider_bulk_limit]
+    def get_actively_monitored_symbols(self, provider_bulk_limit: int = 10, minutes_lookback: int = 60) -> List[str]:
+        """
+        Get the first provider-sized batch of the monitored universe.
+
+        Schedulers should refresh the whole of get_monitored_universe() through
+        the UniverseRefreshScheduler instead; this only returns one batch.
+
+        Args:
+            provider_bulk_limit: Maximum symbols per batch (provider-specific)
+            minutes_lookback: How far back to look for recent price requests
+
+        Returns:
+            List of symbol strings to monitor, limited by provider_bulk_limit
+        """
+        return self.get_monitored_universe(minutes_lookback)[:provider_bulk_limit]
 
     async def fetch_multiple_prices(self, symbols: List[str]) -> Dict[str, Dict]:
         """Fetch prices for multiple symbols using bulk operations when possible."""
@@ -233,6 +270,11 @@ class MarketDataService:
                     # Initialize bulk_results
                     bulk_results = {}
 
+                    # Each bulk chunk is a single API call against the provider's quota
+                    bulk_calls = -(-len(remaining_symbols) // YFINANCE_BULK_CHUNK_SIZE) if provider.name == "yfinance" else 1
+                    if not await self._acquire_rate_limit(provider, bulk_calls):
+                        continue
+
                     # Determine which bulk method to use
                     if provider.name == "yfinance":
                         logger.info(f"Using bulk yfinance fetch for {len(remaining_symbols)} symbols")
@@ -241,24 +283,22 @@ class MarketDataService:
                         logger.info(f"Using bulk Alpha Vantage fetch for {len(remaining_symbols)} symbols")
                         bulk_results = await self._bulk_fetch_from_alpha_vantage(remaining_symbols, provider.api_key)
 
-                    successful_symbols = []
+                    fetched = {symbol: result for symbol, result in bulk_results.items() if result}
 
-                    for symbol, result in bulk_results.items():
-                        if result:
-                            price_data[symbol] = result
-                            success_count += 1
-                            successful_symbols.append(symbol)
-                            # Store in database using new single master table approach
-                            self.store_price_to_master(symbol, result, provider)
-                            # Log API usage
-                            self._log_api_usage(provider, symbol, 200, True)
+                    # Store the whole batch in one transaction and log its usage in one commit
+                    successful_symbols = self.store_prices_to_master(fetched, provider)
+                    self._log_api_usage_batch(provider, successful_symbols, 200, True)
+
+                    for symbol in successful_symbols:
+                        price_data[symbol] = fetched[symbol]
+                    success_count += len(successful_symbols)
 
                     # Remove successfully fetched symbols from remaining
                     remaining_symbols = [s for s in remaining_symbols if s not in successful_symbols]
 
                     # Log bulk activity
                     if successful_symbols:
-                        log_provider_activity(
+                        queue_provider_activity(
                             db_session=self.db,
                             provider_id=provider.name,
                             activity_type="BULK_PRICE_UPDATE",
@@ -301,7 +341,7 @@ class MarketDataService:
         logger.info(f"Bulk fetch completed: {success_count}/{len(symbols)} successful in {duration:.2f}s")
 
         if success_count > 0:
-            log_provider_activity(
+            queue_provider_activity(
                 db_session=self.db,
                 provider_id="system",
                 activity_type="BULK_PRICE_UPDATE",
@@ -325,8 +365,31 @@ class MarketDataService:
 
         return price_data
 
+    async def _acquire_rate_limit(self, provider: MarketDataProvider, calls: int = 1) -> bool:
+        """
+        Wait for capacity under the provider's rate limits.
+
+        Returns:
+            True if the calls may be made, False if the quota is exhausted
+        """
+        if await get_provider_rate_limiter().acquire(provider, calls):
+            return True
+
+        queue_provider_activity(
+            db_session=self.db,
+            provider_id=provider.name,
+            activity_type="RATE_LIMIT",
+            description=f"Rate limit reached for {provider.name}, skipping {calls} call(s)",
+            status="warning",
+            metadata=get_provider_rate_limiter().get_remaining_quota(provider)
+        )
+        return False
+
     async def _fetch_from_provider_single(self, symbol: str, provider: MarketDataProvider) -> Optional[Dict]:
         """Fetch price data from a specific provider for a single symbol."""
+        if not await self._acquire_rate_limit(provider):
+            return None
+
         if provider.name == "yfinance":
             return await self._fetch_from_yfinance(symbol)
         elif provider.name == "alpha_vantage":
@@ -347,24 +410,30 @@ class MarketDataService:
             if provider.name == "yfinance":
                 # yfinance provider - handle bulk logic internally
                 # yfinance has no hard limit but performance degrades with too many symbols
-                YFINANCE_BULK_LIMIT = 50  # Reasonable batch size for performance
-
                 if len(symbols) > 1:
                     # Check if we need to split into chunks due to limits
-                    if len(symbols) > YFINANCE_BULK_LIMIT:
-                        logger.info(f"Splitting {len(symbols)} symbols into chunks of {YFINANCE_BULK_LIMIT} for yfinance")
-                        symbol_chunks = [symbols[i:i+YFINANCE_BULK_LIMIT] for i in range(0, len(symbols), YFINANCE_BULK_LIMIT)]
-                        for chunk in symbol_chunks:
-                            chunk_results = await self._fetch_yfinance_bulk_chunk(chunk)
+                    if len(symbols) > YFINANCE_BULK_CHUNK_SIZE:
+                        logger.info(f"Splitting {len(symbols)} symbols into chunks of {YFINANCE_BULK_CHUNK_SIZE} for yfinance")
+                        symbol_chunks = [symbols[i:i + YFINANCE_BULK_CHUNK_SIZE] for i in range(0, len(symbols), YFINANCE_BULK_CHUNK_SIZE)]
+
+                        async def fetch_chunk(chunk: List[str]) -> Dict[str, Optional[Dict]]:
+                            if not await self._acquire_rate_limit(provider):
+                                return {symbol: None for symbol in chunk}
+                            return await self._fetch_yfinance_bulk_chunk(chunk)
+
+                        # Independent chunks run in parallel within the provider pool's limits
+                        for chunk_results in await asyncio.gather(*(fetch_chunk(chunk) for chunk in symbol_chunks)):
                             results.update(chunk_results)
-                    else:
+                    elif await self._acquire_rate_limit(provider):
                         # Use bulk for multiple symbols within limit
                         chunk_results = await self._fetch_yfinance_bulk_chunk(symbols)
                         results.update(chunk_results)
+                    else:
+                        results = {symbol: None for symbol in symbols}
                 else:
                     # Single symbol - use individual fetch
                     symbol = symbols[0]
-                    results[symbol] = await self._fetch_from_yfinance(symbol)
+                    results[symbol] = await self._fetch_from_provider_single(symbol, provider)
 
             elif provider.name == "alpha_vantage":
                 # Alpha Vantage provider - handle bulk logic internally
@@ -379,25 +448,23 @@ class MarketDataService:
                         remaining_symbols = symbols[ALPHA_VANTAGE_BULK_LIMIT:]
 
                         # Process bulk portion
-                        results.update(await self._bulk_fetch_from_alpha_vantage(bulk_symbols, provider.api_key))
-
-                        # Process remaining individually
-                        for symbol in remaining_symbols:
-                            try:
-                                result = await self._fetch_from_alpha_vantage(symbol, provider.api_key)
-                                results[symbol] = result
-                                await asyncio.sleep(2)  # Rate limiting
-                            except Exception as e:
-                                logger.error(f"Individual fetch failed for {symbol}: {e}")
-                                results[symbol] = None
+                        if await self._acquire_rate_limit(provider):
+                            results.update(await self._bulk_fetch_from_alpha_vantage(bulk_symbols, provider.api_key))
+                        else:
+                            results.update({symbol: None for symbol in bulk_symbols})
+
+                        # Process remaining individually, as fast as the rate limit allows
+                        results.update(await self._fetch_individually(provider, remaining_symbols))
                     else:
                         # Use bulk API if available and within limit
                         logger.info(f"Using Alpha Vantage bulk fetch for {len(symbols)} symbols")
                         try:
+                            if not await self._acquire_rate_limit(provider):
+                                return {symbol: None for symbol in symbols}
                             results = await self._bulk_fetch_from_alpha_vantage(symbols, provider.api_key)
 
                             # Log bulk operation
-                            log_provider_activity(
+                            queue_provider_activity(
                                 db_session=self.db,
                                 provider_id=provider.name,
                                 activity_type="BULK_PRICE_UPDATE",
@@ -413,25 +480,10 @@ class MarketDataService:
                         except Exception as bulk_error:
                             logger.warning(f"Alpha Vantage bulk fetch failed: {bulk_error}, falling back to individual")
                             # Fallback to individual fetches
-                            for symbol in symbols:
-                                try:
-                                    result = await self._fetch_from_alpha_vantage(symbol, provider.api_key)
-                                    results[symbol] = result
-                                    await asyncio.sleep(2)  # Alpha Vantage rate limiting
-                                except Exception as e:
-                                    logger.error(f"Individual fetch failed for {symbol}: {e}")
-                                    results[symbol] = None
+                            results = await self._fetch_individually(provider, symbols)
                 else:
                     # Single symbol or no API key - use individual fetches
-                    for symbol in symbols:
-                        try:
-                            result = await self._fetch_from_alpha_vantage(symbol, provider.api_key)
-                            results[symbol] = result
-                            if len(symbols) > 1:
-                                await asyncio.sleep(2)  # Rate limiting for multiple individual calls
-                        except Exception as e:
-                            logger.error(f"Individual fetch failed for {symbol}: {e}")
-                            results[symbol] = None
+                    results = await self._fetch_individually(provider, symbols)
 
             else:
                 logger.warning(f"Unknown provider: {provider.name}")
@@ -443,6 +495,23 @@ class MarketDataService:
             logger.error(f"Error in _fetch_from_provider for {provider.name}: {e}")
             return {symbol: None for symbol in symbols}
 
+    async def _fetch_individually(self, provider: MarketDataProvider, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch symbols one call each, concurrently, paced by the provider's rate limiter.
+
+        Returns:
+            Dictionary mapping each symbol to its price data, or None on failure
+        """
+        async def fetch(symbol: str) -> Optional[Dict]:
+            try:
+                return await self._fetch_from_provider_single(symbol, provider)
+            except Exception as e:
+                logger.error(f"Individual fetch failed for {symbol}: {e}")
+                return None
+
+        fetched = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+        return dict(zip(symbols, fetched))
+
     async def _fetch_yfinance_bulk_chunk(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
         """Fetch a chunk of symbols from yfinance using bulk API."""
         try:
@@ -480,10 +549,10 @@ class MarketDataService:
                         data[original_symbol] = None
                 return data
 
-            results = await asyncio.get_event_loop().run_in_executor(None, fetch_bulk)
+            results = await get_provider_executor().run(fetch_bulk)
 
             # Log bulk operation for this chunk
-            log_provider_activity(
+            queue_provider_activity(
                 db_session=self.db,
                 provider_id="yfinance",
                 activity_type="BULK_PRICE_UPDATE",
@@ -507,7 +576,6 @@ class MarketDataService:
         """Fetch price data from Yahoo Finance using yfinance library."""
         try:
             import yfinance as yf
-            import asyncio
 
             # Run yfinance in thread pool to avoid blocking
             def fetch_data():
@@ -594,9 +662,8 @@ class MarketDataService:
                     "provider": "yfinance"
                 }
 
-            # Run in thread pool to avoid blocking async event loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, fetch_data)
+            # Run in the provider thread pool to avoid blocking async event loop
+            result = await get_provider_executor().run(fetch_data)
 
             if result:
                 logger.info(f"Successfully fetched {symbol} from yfinance: ${result['price']}")
@@ -609,43 +676,19 @@ class MarketDataService:
 
     def _is_asx_symbol(self, symbol: str) -> bool:
         """Check if symbol appears to be an ASX stock (basic heuristic)."""
-        # Common ASX symbols that we know about
-        known_asx_symbols = {
-            'CBA', 'ANZ', 'WBC', 'NAB',  # Big 4 banks
-            'BHP', 'RIO', 'FMG',         # Mining
-            'CSL', 'COH', 'PME',         # Healthcare
-            'WOW', 'COL', 'JBH',         # Retail
-            'TCL', 'TLS', 'SGP',         # Telco/Property
-            'MQG', 'SUN', 'QBE',         # Finance/Insurance
-            'REA', 'CAR', 'SEK',         # Tech/Services
-            'GMG', 'WES', 'ALL',         # Industrials
-            'APT', 'XRO', 'WTC',         # Fintech
-            'A2M', 'BAP', 'IFL'          # Other
-        }
-
-        # Check if it's a known ASX symbol
-        if symbol in known_asx_symbols:
-            return True
-
-        # Fallback heuristic: 3-4 letter codes, but exclude common US patterns
-        us_patterns = {'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX', 'AMD', 'INTC'}
-        if symbol in us_patterns:
-            return False
-
-        # For unknown symbols, use basic heuristic but be more conservative
-        # ASX symbols are typically 3-4 letters, but so are many US symbols
-        # This is a fallback that may need refinement
-        return (len(symbol) == 3 and symbol.isalpha() and symbol.isupper())
+        return is_asx_symbol(symbol)
 
     async def _bulk_fetch_from_yfinance(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
-        """Fetch prices for multiple symbols from yfinance in a single operation."""
-        import concurrent.futures
-        import asyncio
+        """
+        Fetch prices for multiple symbols from yfinance in bulk.
 
+        Symbols are split into chunks of YFINANCE_BULK_CHUNK_SIZE that are
+        fetched in parallel on the provider thread pool.
+        """
         try:
             import yfinance as yf
 
-            def bulk_fetch():
+            def bulk_fetch(symbols: List[str]):
                 """Synchronous bulk fetch function to run in thread pool."""
                 results = {}
 
@@ -706,10 +749,18 @@ class MarketDataService:
 
                 return results
 
-            # Run the bulk fetch in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                results = await loop.run_in_executor(executor, bulk_fetch)
+            async def fetch_chunk(chunk: List[str]) -> Dict[str, Optional[Dict]]:
+                try:
+                    return await get_provider_executor().run(bulk_fetch, chunk)
+                except asyncio.TimeoutError:
+                    logger.error(f"Bulk yfinance fetch timed out for {len(chunk)} symbols")
+                    return {symbol: None for symbol in chunk}
+
+            # Run the chunks in parallel on the provider pool to avoid blocking
+            chunks = [symbols[i:i + YFINANCE_BULK_CHUNK_SIZE] for i in range(0, len(symbols), YFINANCE_BULK_CHUNK_SIZE)]
+            results = {}
+            for chunk_results in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+                results.update(chunk_results)
 
             successful_count = sum(1 for result in results.values() if result is not None)
             logger.info(f"Bulk yfinance fetch completed: {successful_count}/{len(symbols)} symbols successful")
@@ -739,7 +790,7 @@ class MarketDataService:
 
                 # Log successful activity for admin dashboard
                 response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-                log_provider_activity(
+                queue_provider_activity(
                     db_session=self.db,
                     provider_id=provider.name,
                     activity_type="API_CALL",
@@ -957,8 +1008,20 @@ class MarketDataService:
 
                 logger.info(f"Created new master symbol record for {symbol}: ${price_data['price']}")
 
+            # Capture the written values before commit expires the instances
+            snapshot = PriceSnapshot.from_master_record(
+                master_record,
+                previous_close=price_data.get("previous_close"),
+                provider=provider.display_name
+            )
+
             self.db.commit()
 
+            # Refresh the in-process price cache with the row just written
+            get_price_cache().put(snapshot)
+            get_price_broadcast_hub().publish(snapshot)
+            get_event_bus().publish_prices([snapshot])
+
             logger.info(f"Stored price data to master table for {symbol}: ${price_data['price']}")
 
             # Trigger portfolio updates for this symbol
@@ -971,6 +1034,147 @@ class MarketDataService:
             self.db.rollback()
             raise
 
+    def store_prices_to_master(self, prices: Dict[str, Dict], provider: MarketDataProvider) -> List[str]:
+        """
+        Store a batch of fetched prices in one transaction.
+
+        History rows are written with a single executemany insert and the
+        realtime_symbols master rows with INSERT ... ON CONFLICT upserts (one for
+        rows with a company name, one for rows without), so ingest cost scales
+        with the number of batches rather than symbols.
+        Unlike store_price_to_master this does not trigger portfolio updates;
+        callers emit one combined change event for the whole batch.
+
+        Args:
+            prices: Price data dicts keyed by symbol (same shape as store_price_to_master)
+            provider: Provider the prices were fetched from
+
+        Returns:
+            List of symbols that were stored
+        """
+        if not prices:
+            return []
+
+        upsert = self._get_upsert_insert()
+        if upsert is None:
+            # Dialect without ON CONFLICT support: fall back to per-symbol writes
+            for symbol, price_data in prices.items():
+                self.store_price_to_master(symbol, price_data, provider)
+            return list(prices)
+
+        fetched_at = utc_now()
+        history_rows = []
+        named_master_rows = []
+        unnamed_master_rows = []
+        snapshots = {}
+
+        for symbol, price_data in prices.items():
+            history_id = uuid.uuid4()
+            history_rows.append({
+                "id": history_id,
+                "symbol": symbol,
+                "price": price_data["price"],
+                "opening_price": price_data.get("open_price"),
+                "high_price": price_data.get("high_price"),
+                "low_price": price_data.get("low_price"),
+                "previous_close": price_data.get("previous_close"),
+                "volume": price_data.get("volume"),
+                "market_cap": price_data.get("market_cap"),
+                "fifty_two_week_high": price_data.get("fifty_two_week_high"),
+                "fifty_two_week_low": price_data.get("fifty_two_week_low"),
+                "dividend_yield": price_data.get("dividend_yield"),
+                "pe_ratio": price_data.get("pe_ratio"),
+                "beta": price_data.get("beta"),
+                "currency": price_data.get("currency", "USD"),
+                "company_name": price_data.get("company_name"),
+                "provider_id": provider.id,
+                "source_timestamp": price_data["source_timestamp"],
+                "fetched_at": fetched_at
+            })
+
+            master_record = RealtimeSymbol(
+                symbol=symbol,
+                current_price=price_data["price"],
+                company_name=price_data.get("company_name"),
+                last_updated=price_data["source_timestamp"],
+                provider_id=provider.id,
+                volume=price_data.get("volume"),
+                market_cap=price_data.get("market_cap"),
+                latest_history_id=history_id
+            )
+            # Same default as store_price_to_master for symbols seen for the first time
+            master_rows = named_master_rows if price_data.get("company_name") else unnamed_master_rows
+            master_rows.append({
+                "symbol": symbol,
+                "current_price": price_data["price"],
+                "company_name": price_data.get("company_name") or f"{symbol} Company",
+                "last_updated": price_data["source_timestamp"],
+                "provider_id": provider.id,
+                "volume": price_data.get("volume"),
+                "market_cap": price_data.get("market_cap"),
+                "latest_history_id": history_id,
+                "created_at": fetched_at,
+                "updated_at": fetched_at
+            })
+            snapshots[symbol] = PriceSnapshot.from_master_record(
+                master_record,
+                previous_close=price_data.get("previous_close"),
+                provider=provider.display_name
+            )
+
+        try:
+            self.db.execute(insert(RealtimePriceHistory), history_rows)
+
+            statement = upsert(RealtimeSymbol.__table__)
+            excluded = statement.excluded
+            update_columns = {
+                "current_price": excluded.current_price,
+                "last_updated": excluded.last_updated,
+                "provider_id": excluded.provider_id,
+                "volume": excluded.volume,
+                "market_cap": excluded.market_cap,
+                "latest_history_id": excluded.latest_history_id,
+                "updated_at": excluded.updated_at
+            }
+            if named_master_rows:
+                self.db.execute(statement.on_conflict_do_update(
+                    index_elements=[RealtimeSymbol.symbol],
+                    set_={**update_columns, "company_name": excluded.company_name}
+                ), named_master_rows)
+            if unnamed_master_rows:
+                # Keep the known company name when the provider omits it
+                self.db.execute(statement.on_conflict_do_update(
+                    index_elements=[RealtimeSymbol.symbol],
+                    set_=update_columns
+                ), unnamed_master_rows)
+            self.db.commit()
+
+        except Exception as e:
+            logger.error(f"Error storing batch of {len(prices)} prices to master table: {e}")
+            self.db.rollback()
+            # Core statements bypass the ORM flush hooks, so drop anything cached for these symbols
+            get_price_cache().invalidate(prices.keys())
+            raise
+
+        # Core statements bypass the ORM flush hooks, so refresh the cache explicitly
+        get_price_cache().put_many(snapshots)
+        get_price_broadcast_hub().publish_many(snapshots.values())
+        get_event_bus().publish_prices(snapshots.values())
+
+        logger.info(f"Stored batch of {len(prices)} prices to master table from {provider.name}")
+        return list(prices)
+
+    def _get_upsert_insert(self):
+        """Get the dialect-specific insert construct supporting ON CONFLICT, if any."""
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+            return sqlite_insert
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+            return postgresql_insert
+        return None
+
     def get_current_price_from_master(self, symbol: str) -> Optional[Dict]:
         """
         Get current price data from master table (single source of truth).
@@ -978,25 +1182,26 @@ class MarketDataService:
         Returns price data from realtime_symbols table, ensuring consistent
         pricing across all APIs and portfolio calculations.
         """
-        try:
-            master_record = self.db.query(RealtimeSymbol).filter_by(symbol=symbol).first()
+        return self.get_current_prices_from_master([symbol]).get(symbol)
 
-            if not master_record:
-                return None
+    def get_current_prices_from_master(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get current price data for many symbols from the master table at once.
 
-            return {
-                "symbol": master_record.symbol,
-                "price": master_record.current_price,
-                "company_name": master_record.company_name,
-                "fetched_at": master_record.last_updated,
-                "volume": master_record.volume,
-                "market_cap": master_record.market_cap,
-                "provider": master_record.provider.display_name if master_record.provider else None
-            }
+        Uses the batched price snapshot, so any number of symbols costs one
+        query per chunk rather than one query per symbol.
+
+        Returns:
+            Dictionary mapping symbols to price data; symbols without a master
+            record are omitted
+        """
+        try:
+            snapshots = PriceSnapshotService(self.db).get_snapshots(symbols)
+            return {symbol: snapshot.to_price_data() for symbol, snapshot in snapshots.items()}
 
         except Exception as e:
-            logger.error(f"Error getting current price from master table for {symbol}: {e}")
-            return None
+            logger.error(f"Error getting current prices from master table for {symbols}: {e}")
+            return {}
 
     def _store_comprehensive_price_data(self, symbol: str, price_data: Dict, provider: MarketDataProvider, db_session: Session) -> RealtimePriceHistory:
         """Store comprehensive price data with custom session (for testing)."""
@@ -1110,6 +1315,37 @@ class MarketDataService:
             logger.error(f"Error logging API usage: {e}")
             self.db.rollback()
 
+    def _log_api_usage_batch(self, provider: MarketDataProvider, symbols: List[str], status_code: int,
+                             success: bool, error_message: Optional[str] = None):
+        """Log API usage for a batch of symbols with a single commit."""
+        if not symbols:
+            return
+
+        try:
+            now_local = utc_now()
+            timestamp = now_local.strftime('%Y%m%d_%H%M%S_%f')[:23]
+
+            self.db.add_all([
+                MarketDataUsageMetrics(
+                    metric_id=f"{provider.name}_{symbol}_{timestamp}",
+                    provider_id=provider.name,
+                    request_type="price_fetch",
+                    requests_count=1,
+                    data_points_fetched=1 if success else 0,
+                    recorded_at=now_local,
+                    time_bucket="hourly",
+                    rate_limit_hit=False,
+                    error_count=1 if not success else 0,
+                    avg_response_time_ms=None
+                )
+                for symbol in symbols
+            ])
+            self.db.commit()
+
+        except Exception as e:
+            logger.error(f"Error logging API usage: {e}")
+            self.db.rollback()
+
     def get_latest_price(self, symbol: str, max_age_minutes: int = 30) -> Optional[RealtimePriceHistory]:
         """Get the latest cached price for a symbol."""
         cutoff_time = datetime.utcnow() - timedelta(minutes=max_age_minutes)
@@ -1167,29 +1403,30 @@ class MarketDataService:
         """
         try:
             from src.services.portfolio_update_queue import get_portfolio_update_queue
-            from src.services.real_time_portfolio_service import RealTimePortfolioService
+            from src.services.symbol_portfolio_index import get_symbol_portfolio_index
 
             # Find portfolios that contain this symbol
-            portfolio_service = RealTimePortfolioService(self.db)
-            affected_portfolios = portfolio_service._find_portfolios_with_symbol(symbol)
+            index = get_symbol_portfolio_index()
+            index.ensure_built(self.db)
+            affected_portfolio_ids = index.get_portfolios_for_symbol(symbol)
 
-            if affected_portfolios:
+            if affected_portfolio_ids:
                 # Queue updates for each affected portfolio instead of executing immediately
                 queue = get_portfolio_update_queue()
 
-                for portfolio in affected_portfolios:
+                for portfolio_id in affected_portfolio_ids:
                     queued = queue.queue_portfolio_update(
-                        portfolio_id=str(portfolio.id),
+                        portfolio_id=portfolio_id,
                         symbols=[symbol],
                         priority=1  # Normal priority for price updates
                     )
 
                     if queued:
-                        logger.debug(f"Queued portfolio update for {portfolio.id} after {symbol} price change")
+                        logger.debug(f"Queued portfolio update for {portfolio_id} after {symbol} price change")
                     else:
-                        logger.warning(f"Rate limited portfolio update for {portfolio.id} after {symbol} price change")
+                        logger.warning(f"Rate limited portfolio update for {portfolio_id} after {symbol} price change")
 
-                logger.info(f"Queued portfolio updates for {len(affected_portfolios)} portfolios after {symbol} price change")
+                logger.info(f"Queued portfolio updates for {len(affected_portfolio_ids)} portfolios after {symbol} price change")
 
         except Exception as e:
             logger.error(f"Error queuing portfolio updates for symbol {symbol}: {e}")
@@ -1202,40 +1439,29 @@ class MarketDataService:
         """
         try:
             from src.services.portfolio_update_queue import get_portfolio_update_queue
-            from src.services.real_time_portfolio_service import RealTimePortfolioService
-
-            # Find all unique portfolios affected by these symbols
-            portfolio_service = RealTimePortfolioService(self.db)
-            all_affected_portfolios = set()
+            from src.services.symbol_portfolio_index import get_symbol_portfolio_index
 
-            for symbol in symbols:
-                portfolios = portfolio_service._find_portfolios_with_symbol(symbol)
-                all_affected_portfolios.update(portfolios)
+            # Map each affected portfolio to the changed symbols it holds
+            index = get_symbol_portfolio_index()
+            index.ensure_built(self.db)
+            portfolio_symbols = index.get_portfolio_symbols(symbols)
 
-            if all_affected_portfolios:
+            if portfolio_symbols:
                 # Queue bulk updates for each affected portfolio
                 queue = get_portfolio_update_queue()
                 queued_count = 0
 
-                for portfolio in all_affected_portfolios:
-                    # Find which symbols from the bulk update affect this portfolio
-                    portfolio_symbols = []
-                    for symbol in symbols:
-                        symbol_portfolios = portfolio_service._find_portfolios_with_symbol(symbol)
-                        if portfolio in symbol_portfolios:
-                            portfolio_symbols.append(symbol)
-
-                    if portfolio_symbols:
-                        queued = queue.queue_portfolio_update(
-                            portfolio_id=str(portfolio.id),
-                            symbols=portfolio_symbols,
-                            priority=2  # Higher priority for bulk operations
-                        )
+                for portfolio_id, changed_symbols in portfolio_symbols.items():
+                    queued = queue.queue_portfolio_update(
+                        portfolio_id=portfolio_id,
+                        symbols=changed_symbols,
+                        priority=2  # Higher priority for bulk operations
+                    )
 
-                        if queued:
-                            queued_count += 1
+                    if queued:
+                        queued_count += 1
 
-                logger.info(f"Queued bulk portfolio updates for {queued_count}/{len(all_affected_portfolios)} unique portfolios after {len(symbols)} price changes")
+                logger.info(f"Queued bulk portfolio updates for {queued_count}/{len(portfolio_symbols)} unique portfolios after {len(symbols)} price changes")
 
         except Exception as e:
             logger.error(f"Error queuing bulk portfolio updates for symbols {symbols}: {e}")
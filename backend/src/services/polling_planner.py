@@ -0,0 +1,377 @@
+"""
+Priority-based adaptive polling for monitored symbols.
+
+Refreshing every monitored symbol on one fixed cycle spends as many API calls
+on a rarely viewed ticker as on the largest holding. The planner assigns each
+symbol a refresh tier from its held market value and recent request frequency,
+takes the tier intervals from active PollIntervalConfig rows, and picks the
+most overdue symbols that fit within the provider's remaining daily quota.
+"""
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Deque, Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.core.logging import LoggerMixin
+from src.models import Holding, Portfolio, RealtimePriceHistory, Stock
+from src.models.poll_interval_config import PollIntervalConfig
+from src.services.price_snapshot_service import PriceSnapshotService
+from src.services.provider_rate_limiter import get_provider_rate_limiter
+from src.services.trading_calendar import get_trading_calendar
+
+POLL_TIERS = ("high", "normal", "low")
+
+# Used for tiers without an active PollIntervalConfig row
+DEFAULT_TIER_INTERVALS_MINUTES = {"high": 1, "normal": 15, "low": 60}
+
+
+@dataclass(slots=True)
+class SymbolPollScore:
+    """Polling priority inputs and result for one symbol."""
+    symbol: str
+    tier: str
+    interval_minutes: int
+    staleness_seconds: Optional[float]  # None if the symbol has never been fetched
+    exposure: Decimal  # Total held market value across active portfolios
+    request_count: int  # Price fetches recorded within the lookback window
+    # Set when the market is closed and the closing price is already stored
+    reopens_in_seconds: Optional[float] = None
+
+    @property
+    def is_due(self) -> bool:
+        """Whether the symbol is older than its tier's refresh interval."""
+        if self.reopens_in_seconds is not None:
+            return False
+        return self.staleness_seconds is None or self.staleness_seconds >= self.interval_minutes * 60
+
+    @property
+    def overdue_ratio(self) -> float:
+        """Staleness as a multiple of the tier interval; never-fetched symbols rank first."""
+        if self.staleness_seconds is None:
+            return math.inf
+        return self.staleness_seconds / (self.interval_minutes * 60)
+
+    @property
+    def seconds_until_due(self) -> float:
+        """Seconds until the symbol becomes due (0 if already due)."""
+        if self.reopens_in_seconds is not None:
+            return self.reopens_in_seconds
+        if self.staleness_seconds is None:
+            return 0.0
+        return max(0.0, self.interval_minutes * 60 - self.staleness_seconds)
+
+
+@dataclass(slots=True)
+class PollPlan:
+    """Symbols to refresh this cycle and when to plan again."""
+    symbols: List[str]
+    next_poll_seconds: float
+    deferred: int = 0  # Due symbols left for the next cycle because of the quota budget
+    symbol_budget: Optional[int] = None
+    tier_counts: Dict[str, int] = field(default_factory=dict)
+
+
+class PollingPlanner(LoggerMixin):
+    """
+    Decides which monitored symbols to refresh on each polling cycle.
+
+    Tiers:
+    - high: held symbols that together make up high_exposure_share of the
+      total held market value, largest first
+    - normal: other held symbols and symbols requested at least
+      frequent_request_threshold times within the lookback window; the
+      planner's own scheduled fetches do not count as requests
+    - low: everything else (rarely viewed symbols)
+
+    Symbols that are due are ordered by how overdue they are relative to their
+    tier interval, then by exposure, and truncated to the call budget. While a
+    symbol's market is closed it is only due until its closing price is stored.
+    """
+
+    def __init__(
+        self,
+        high_exposure_share: float = 0.5,
+        frequent_request_threshold: int = 3,
+        min_poll_seconds: float = 60.0,
+        max_poll_seconds: float = 900.0,
+        closed_max_poll_seconds: float = 3600.0
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            high_exposure_share: Share of total held value covered by the high tier
+            frequent_request_threshold: Requests in the lookback window that make
+                an unheld symbol normal rather than low priority
+            min_poll_seconds: Shortest time between planning cycles
+            max_poll_seconds: Longest time between planning cycles
+            closed_max_poll_seconds: Longest time between planning cycles while
+                every monitored market is closed
+        """
+        self.high_exposure_share = high_exposure_share
+        self.frequent_request_threshold = frequent_request_threshold
+        self.min_poll_seconds = min_poll_seconds
+        self.max_poll_seconds = max_poll_seconds
+        self.closed_max_poll_seconds = closed_max_poll_seconds
+
+        # Times the scheduler fetched each symbol, excluded from request counts
+        self._scheduled_fetches: Dict[str, Deque[float]] = {}
+
+    def get_tier_intervals(self, db: Session) -> Dict[str, int]:
+        """
+        Get the refresh interval in minutes for each tier.
+
+        The newest active PollIntervalConfig for a tier wins; configs without a
+        tier set the normal interval.
+        """
+        intervals = dict(DEFAULT_TIER_INTERVALS_MINUTES)
+        configs = db.query(PollIntervalConfig).filter(
+            PollIntervalConfig.is_active.is_(True)
+        ).order_by(PollIntervalConfig.created_at).all()
+
+        for config in configs:
+            tier = config.tier or "normal"
+            if tier in intervals and config.interval_minutes and config.interval_minutes > 0:
+                intervals[tier] = config.interval_minutes
+
+        return intervals
+
+    def score(self, db: Session, universe: Iterable[str], minutes_lookback: int = 60) -> List[SymbolPollScore]:
+        """
+        Score every symbol in the universe by staleness, exposure and request frequency.
+
+        Args:
+            db: Database session
+            universe: Monitored symbols
+            minutes_lookback: Window used to count recent requests
+
+        Returns:
+            One SymbolPollScore per symbol
+        """
+        symbols = list(dict.fromkeys(universe))
+        if not symbols:
+            return []
+
+        intervals = self.get_tier_intervals(db)
+        snapshots = PriceSnapshotService(db).get_snapshots(symbols)
+        exposures = self._get_exposures(db, snapshots)
+        request_counts = self._get_request_counts(db, minutes_lookback)
+        high_tier = self._get_high_tier(exposures)
+
+        calendar = get_trading_calendar()
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        scores = []
+        for symbol in symbols:
+            exposure = exposures.get(symbol, Decimal("0"))
+            request_count = request_counts.get(symbol, 0)
+
+            if symbol in high_tier:
+                tier = "high"
+            elif exposure > 0 or request_count >= self.frequent_request_threshold:
+                tier = "normal"
+            else:
+                tier = "low"
+
+            snapshot = snapshots.get(symbol)
+            last_updated = snapshot.last_updated if snapshot else None
+            staleness = (now_utc - last_updated).total_seconds() if last_updated else None
+
+            reopens_in = None
+            if not calendar.needs_refresh(symbol, last_updated):
+                reopens_in = calendar.seconds_until_next_open([symbol])
+
+            scores.append(SymbolPollScore(
+                symbol=symbol,
+                tier=tier,
+                interval_minutes=intervals[tier],
+                staleness_seconds=staleness,
+                exposure=exposure,
+                request_count=request_count,
+                reopens_in_seconds=reopens_in
+            ))
+
+        return scores
+
+    def plan(
+        self,
+        db: Session,
+        universe: Iterable[str],
+        batch_size: int,
+        call_budget: Optional[int] = None,
+        minutes_lookback: int = 60
+    ) -> PollPlan:
+        """
+        Choose the symbols to refresh this cycle.
+
+        Args:
+            db: Database session
+            universe: Monitored symbols
+            batch_size: Symbols fetched per provider API call
+            call_budget: Provider API calls available this cycle (None = unlimited)
+            minutes_lookback: Window used to count recent requests
+
+        Returns:
+            PollPlan with the symbols to fetch, most overdue first
+        """
+        scores = self.score(db, universe, minutes_lookback)
+
+        due = sorted(
+            (score for score in scores if score.is_due),
+            key=lambda score: (-score.overdue_ratio, -score.exposure, score.symbol)
+        )
+
+        symbol_budget = call_budget * max(1, batch_size) if call_budget is not None else None
+        selected = due if symbol_budget is None else due[:symbol_budget]
+        deferred = len(due) - len(selected)
+
+        if deferred:
+            next_poll_seconds = self.min_poll_seconds
+        else:
+            waiting = [score.seconds_until_due for score in scores if not score.is_due]
+            next_poll_seconds = min(waiting) if waiting else self.max_poll_seconds
+
+        # Slow down while every monitored market is closed
+        all_closed = bool(scores) and all(score.reopens_in_seconds is not None for score in scores)
+        max_poll_seconds = self.closed_max_poll_seconds if all_closed else self.max_poll_seconds
+        next_poll_seconds = min(max_poll_seconds, max(self.min_poll_seconds, next_poll_seconds))
+
+        tier_counts = {tier: 0 for tier in POLL_TIERS}
+        for score in selected:
+            tier_counts[score.tier] += 1
+
+        self.log_info(
+            "Polling plan",
+            universe_size=len(scores),
+            due=len(due),
+            selected=len(selected),
+            deferred=deferred,
+            next_poll_seconds=round(next_poll_seconds, 1)
+        )
+
+        return PollPlan(
+            symbols=[score.symbol for score in selected],
+            next_poll_seconds=next_poll_seconds,
+            deferred=deferred,
+            symbol_budget=symbol_budget,
+            tier_counts=tier_counts
+        )
+
+    def get_call_budget(self, provider, cycle_seconds: float) -> Optional[int]:
+        """
+        Spread a provider's remaining daily quota evenly over the rest of the UTC day.
+
+        Args:
+            provider: Provider whose quota funds the cycle
+            cycle_seconds: Expected time until the next cycle
+
+        Returns:
+            API calls this cycle may use, or None if the provider has no daily limit
+        """
+        remaining_today = get_provider_rate_limiter().get_remaining_quota(provider)["remaining_today"]
+        if remaining_today is None:
+            return None
+
+        now_utc = datetime.now(timezone.utc)
+        end_of_day = datetime.combine(now_utc.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+        seconds_left = max(1.0, (end_of_day - now_utc).total_seconds())
+        cycles_left = max(1.0, seconds_left / max(1.0, cycle_seconds))
+
+        budget = int(remaining_today / cycles_left)
+        if budget == 0 and remaining_today > 0:
+            # Let low quotas still make progress rather than starving every cycle
+            budget = 1
+        return budget
+
+    def _get_exposures(self, db: Session, snapshots: Dict) -> Dict[str, Decimal]:
+        """Total held market value per symbol across active portfolios."""
+        rows = db.query(Stock.symbol, func.sum(Holding.quantity)).join(
+            Holding, Holding.stock_id == Stock.id
+        ).join(
+            Portfolio, Portfolio.id == Holding.portfolio_id
+        ).filter(
+            Holding.quantity > 0,
+            Portfolio.is_active.is_(True)
+        ).group_by(Stock.symbol).all()
+
+        exposures = {}
+        for symbol, quantity in rows:
+            snapshot = snapshots.get(symbol)
+            price = snapshot.price if snapshot else Decimal("0")
+            exposures[symbol] = Decimal(str(quantity)) * price
+        return exposures
+
+    def record_scheduled_fetches(self, symbols: Iterable[str]) -> None:
+        """
+        Record symbols fetched by a scheduled cycle.
+
+        Scheduled fetches write the same price history rows as user requests,
+        so without this a symbol would stay frequently requested on the
+        scheduler's own fetches alone.
+
+        Args:
+            symbols: Symbols the cycle fetched successfully
+        """
+        fetched_at = time.time()
+        for symbol in symbols:
+            self._scheduled_fetches.setdefault(symbol, deque()).append(fetched_at)
+
+    def _get_request_counts(self, db: Session, minutes_lookback: int) -> Dict[str, int]:
+        """Price fetches per symbol within the lookback window, excluding scheduled fetches."""
+        cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=minutes_lookback)
+        rows = db.query(RealtimePriceHistory.symbol, func.count(RealtimePriceHistory.id)).filter(
+            RealtimePriceHistory.fetched_at >= cutoff_time
+        ).group_by(RealtimePriceHistory.symbol).all()
+
+        scheduled_counts = self._count_scheduled_fetches(cutoff_time.timestamp())
+        return {
+            symbol: max(0, count - scheduled_counts.get(symbol, 0))
+            for symbol, count in rows
+        }
+
+    def _count_scheduled_fetches(self, cutoff: float) -> Dict[str, int]:
+        """Scheduled fetches per symbol since cutoff, dropping older records."""
+        counts = {}
+        for symbol in list(self._scheduled_fetches):
+            fetch_times = self._scheduled_fetches[symbol]
+            while fetch_times and fetch_times[0] < cutoff:
+                fetch_times.popleft()
+            if fetch_times:
+                counts[symbol] = len(fetch_times)
+            else:
+                del self._scheduled_fetches[symbol]
+        return counts
+
+    def _get_high_tier(self, exposures: Dict[str, Decimal]) -> set:
+        """Largest holdings that together cover high_exposure_share of total held value."""
+        total = sum(exposures.values(), Decimal("0"))
+        if total <= 0:
+            return set()
+
+        high_tier = set()
+        covered = Decimal("0")
+        threshold = total * Decimal(str(self.high_exposure_share))
+        for symbol, exposure in sorted(exposures.items(), key=lambda item: (-item[1], item[0])):
+            if covered >= threshold or exposure <= 0:
+                break
+            high_tier.add(symbol)
+            covered += exposure
+        return high_tier
+
+
+# Global instance for the application
+_polling_planner: Optional[PollingPlanner] = None
+
+
+def get_polling_planner() -> PollingPlanner:
+    """Get the global polling planner instance."""
+    global _polling_planner
+    if _polling_planner is None:
+        _polling_planner = PollingPlanner()
+    return _polling_planner
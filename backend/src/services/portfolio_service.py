@@ -10,7 +10,7 @@ from decimal import Decimal
 from src.core.exceptions import PortfolioNotFoundError
 from src.core.logging import LoggerMixin
 from src.models import Portfolio
-from src.models.realtime_symbol import RealtimeSymbol
+from src.services.price_snapshot_service import PriceSnapshotService
 from src.schemas.portfolio import PortfolioCreate, PortfolioResponse
 
 
@@ -146,12 +146,10 @@ class PortfolioService(LoggerMixin):
         """
         self.log_info("Getting current price from master table", symbol=symbol)
 
-        master_record = self.db.query(RealtimeSymbol).filter(
-            RealtimeSymbol.symbol == symbol
-        ).first()
+        snapshot = PriceSnapshotService(self.db).get_snapshot(symbol)
 
-        if master_record:
-            price = Decimal(str(master_record.current_price))
+        if snapshot:
+            price = snapshot.price
             self.log_info("Current price retrieved from master table",
                          symbol=symbol, price=str(price))
             return price
@@ -491,7 +491,10 @@ portfolio_update_success_rate {success_rate:.3f}
                 "active_portfolios": len(stats.get("portfolio_symbol_counts", {})),
                 "rate_limit_hits": sum(stats.get("rate_limit_windows", {}).values()),
                 "is_processing": stats.get("is_processing", True),
-                "total_symbols_queued": sum(stats.get("portfolio_symbol_counts", {}).values())
+                "total_symbols_queued": sum(stats.get("portfolio_symbol_counts", {}).values()),
+                "debounce_seconds": stats.get("debounce_seconds"),
+                "batch_size": stats.get("batch_size"),
+                "deferred_updates": stats.get("deferred_updates", 0)
             }
         except ImportError:
             # Return mock values if queue service not available
@@ -500,7 +503,10 @@ portfolio_update_success_rate {success_rate:.3f}
                 "active_portfolios": 0,
                 "rate_limit_hits": 0,
                 "is_processing": False,
-                "total_symbols_queued": 0
+                "total_symbols_queued": 0,
+                "debounce_seconds": None,
+                "batch_size": None,
+                "deferred_updates": 0
             }
 
     def cleanup_old_metrics(self, retention_days: int = 30) -> int:
@@ -2,18 +2,46 @@
 Portfolio Update Queue Service with Update Storm Protection.
 
 Implements intelligent batching, debouncing, and rate limiting to prevent
-update storms when many stock prices change simultaneously.
+update storms when many stock prices change simultaneously. Ready updates are
+executed by a bounded pool of workers, each recomputing only the requested
+portfolio in its own database session. Pending requests are ordered by
+deadline in a heap, so the processor sleeps until the next one is due instead
+of scanning every pending request. With adaptive=True the debounce window and
+dispatch batch size follow live load: arrival rate, queue depth and
+processing latency.
 """
 
 import asyncio
+import heapq
+import itertools
+import math
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Set, Optional
+from typing import Dict, List, Set, Optional, Tuple
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from threading import Lock
+from uuid import UUID
 
 from src.core.logging import LoggerMixin
+from src.services.event_bus import get_event_bus
+from src.services.price_broadcast_hub import get_price_broadcast_hub
+from src.services.trading_calendar import get_trading_calendar
+
+# Closing-price updates arrive in a burst after the close; coalesce them for longer
+CLOSED_MARKET_DEBOUNCE_SECONDS = 60.0
+
+# Portfolio updates executed concurrently
+DEFAULT_MAX_WORKERS = 4
+
+# Longest the processor sleeps with nothing due, so metrics are still recorded
+MAX_IDLE_SECONDS = 5.0
+
+# Adaptive load control: how often settings are recomputed, the processing
+# time assumed before any update has run, and how quickly a backlog should drain
+ADAPT_INTERVAL_SECONDS = 1.0
+DEFAULT_PROCESSING_SECONDS = 0.05
+BACKLOG_DRAIN_SECONDS = 10.0
 
 
 @dataclass
@@ -23,6 +51,19 @@ class UpdateRequest:
     symbols: Set[str]
     timestamp: float
     priority: int = 1  # Higher = more important
+    debounce_seconds: Optional[float] = None  # Overrides the queue default (e.g. closed markets)
+    version: int = 0  # Sequence of the request's live heap entry; older entries are stale
+
+
+@dataclass
+class WorkerStats:
+    """Processing statistics for one update worker."""
+    worker_id: int
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    current_portfolio: Optional[str] = None
+    last_duration_ms: Optional[float] = None
 
 
 class PortfolioUpdateQueue(LoggerMixin):
@@ -32,32 +73,97 @@ class PortfolioUpdateQueue(LoggerMixin):
     Features:
     - Debouncing: Delays updates to batch multiple symbol changes
     - Coalescing: Merges multiple requests for same portfolio
-    - Rate limiting: Prevents excessive updates per portfolio
+    - Rate limiting: Prevents excessive updates per portfolio; rate-limited
+      requests are deferred, merged, and released when the window opens so
+      the final state is never lost
     - Priority queuing: Important updates (like manual refreshes) get priority
+    - Worker pool: up to max_workers portfolios are recomputed concurrently,
+      and a portfolio is never recomputed by two workers at once
+    - Deadline heap: queuing and coalescing push a heap entry in O(log n);
+      superseded entries are discarded lazily when they reach the top
+    - Market hours: routine updates for symbols whose markets are all closed
+      wait closed_market_debounce_seconds, coalescing closing-price updates
+    - Adaptive load control (optional): quiet periods debounce for
+      min_debounce_seconds, price storms widen the window towards
+      max_debounce_seconds, and only as many ready updates are dispatched
+      as the workers can take so the rest keep coalescing
     """
 
-    def __init__(self, debounce_seconds: float = 2.0, max_updates_per_minute: int = 20):
+    def __init__(
+        self,
+        debounce_seconds: float = 2.0,
+        max_updates_per_minute: int = 20,
+        closed_market_debounce_seconds: Optional[float] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        adaptive: bool = False,
+        min_debounce_seconds: float = 0.1,
+        max_debounce_seconds: float = 10.0,
+        max_batch_size: int = 500
+    ):
         """
         Initialize the update queue.
 
         Args:
             debounce_seconds: How long to wait for more updates before processing
             max_updates_per_minute: Maximum updates per portfolio per minute
+            closed_market_debounce_seconds: Debounce for routine updates while
+                every changed symbol's market is closed (None disables)
+            max_workers: Number of portfolio updates executed concurrently
+            adaptive: Adjust debounce_seconds and batch_size from live load
+            min_debounce_seconds: Adaptive debounce when the queue is quiet
+            max_debounce_seconds: Adaptive debounce at or above full load
+            max_batch_size: Most ready updates dispatched per cycle when adaptive
         """
         self.debounce_seconds = debounce_seconds
         self.max_updates_per_minute = max_updates_per_minute
+        self.closed_market_debounce_seconds = closed_market_debounce_seconds
+        self.max_workers = max(1, max_workers)
+
+        # Load control; batch_size None dispatches every ready update
+        self.adaptive = adaptive
+        self.min_debounce_seconds = min_debounce_seconds
+        self.max_debounce_seconds = max(min_debounce_seconds, max_debounce_seconds)
+        self.max_batch_size = max(self.max_workers, max_batch_size)
+        self.batch_size: Optional[int] = None
+        if adaptive:
+            self.debounce_seconds = min_debounce_seconds
+            self.batch_size = self.max_workers
+        self._arrivals = 0  # Requests queued since the last adjustment
+        self._arrival_rate = 0.0  # Smoothed requests per second
+        self._load = 0.0
+        self._last_adapt_time = time.time()
+        self._dispatch_throttled = False
 
         # Queue management
         self._pending_updates: Dict[str, UpdateRequest] = {}  # portfolio_id -> latest request
+        self._deadlines: List[Tuple[float, int, str, int]] = []  # (deadline, -priority, portfolio_id, version)
+        self._sequence = itertools.count(1)
         self._update_lock = Lock()
 
         # Rate limiting tracking
         self._rate_limit_windows: Dict[str, deque] = defaultdict(deque)  # portfolio_id -> timestamps
 
+        # Rate-limited requests waiting for their portfolio's window to open
+        self._deferred_updates: Dict[str, UpdateRequest] = {}  # portfolio_id -> merged request
+        self._deferred_releases: List[Tuple[float, str]] = []  # (release time, portfolio_id) heap
+        self._deferred_total = 0
+        self._released_total = 0
+        self._dropped_total = 0
+
         # Background processing
         self._processing_task: Optional[asyncio.Task] = None
         self._shutdown = False
 
+        # Worker pool
+        self._ready_updates: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._in_flight: Set[str] = set()  # portfolio_ids being executed
+        self._worker_stats: Dict[int, WorkerStats] = {}
+
+        # Wakes the processor when a request becomes due earlier than it planned
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
         # Queue metrics tracking
         self._last_metrics_time: float = 0
         self._metrics_interval: float = 30.0  # Record metrics every 30 seconds
@@ -65,25 +171,45 @@ class PortfolioUpdateQueue(LoggerMixin):
 
         self.log_info("Portfolio Update Queue initialized", extra={
             "debounce_seconds": debounce_seconds,
-            "max_updates_per_minute": max_updates_per_minute
+            "max_updates_per_minute": max_updates_per_minute,
+            "max_workers": self.max_workers,
+            "adaptive": adaptive
         })
 
     async def start_processing(self):
-        """Start the background processing task."""
+        """Start the background processing task and its workers."""
         if self._processing_task is None or self._processing_task.done():
             self._shutdown = False
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._ready_updates = asyncio.Queue()
+            self._worker_stats = {i: WorkerStats(worker_id=i) for i in range(self.max_workers)}
+            self._worker_tasks = [
+                asyncio.create_task(self._run_worker(self._worker_stats[i]))
+                for i in range(self.max_workers)
+            ]
             self._processing_task = asyncio.create_task(self._process_queue())
-            self.log_info("Portfolio update queue processing started")
+            self.log_info("Portfolio update queue processing started", extra={"workers": self.max_workers})
 
     async def stop_processing(self):
-        """Stop the background processing task."""
+        """Stop the background processing task and its workers."""
         self._shutdown = True
-        if self._processing_task and not self._processing_task.done():
-            self._processing_task.cancel()
+        tasks = list(self._worker_tasks)
+        if self._processing_task:
+            tasks.append(self._processing_task)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        for task in tasks:
             try:
-                await self._processing_task
+                await task
             except asyncio.CancelledError:
                 pass
+        self._worker_tasks = []
+        self._ready_updates = None
+        self._wakeup = None
+        self._loop = None
+        self._in_flight.clear()
         self.log_info("Portfolio update queue processing stopped")
 
     def queue_portfolio_update(self, portfolio_id: str, symbols: List[str], priority: int = 1) -> bool:
@@ -96,18 +222,21 @@ class PortfolioUpdateQueue(LoggerMixin):
             priority: Update priority (higher = more important)
 
         Returns:
-            True if queued, False if rate limited
+            True if queued, False if rate limited (the update is deferred
+            until the portfolio's rate limit window opens)
         """
         try:
             # Check rate limiting
             if not self._check_rate_limit(portfolio_id):
-                self.log_warning(f"Rate limit exceeded for portfolio {portfolio_id}, skipping update")
+                self._defer_update(portfolio_id, set(symbols), priority)
                 return False
 
             current_time = time.time()
             symbol_set = set(symbols)
+            debounce_seconds = self._get_debounce_seconds(symbol_set, priority)
 
             with self._update_lock:
+                self._arrivals += 1
                 existing_request = self._pending_updates.get(portfolio_id)
 
                 if existing_request:
@@ -115,6 +244,10 @@ class PortfolioUpdateQueue(LoggerMixin):
                     existing_request.symbols.update(symbol_set)
                     existing_request.timestamp = current_time  # Reset debounce timer
                     existing_request.priority = max(existing_request.priority, priority)
+                    if existing_request.debounce_seconds is not None:
+                        debounce_seconds = min(existing_request.debounce_seconds, debounce_seconds)
+                    existing_request.debounce_seconds = debounce_seconds
+                    is_next_due = self._schedule(existing_request)
 
                     self.log_debug(f"Coalesced update for portfolio {portfolio_id}", extra={
                         "total_symbols": len(existing_request.symbols),
@@ -122,24 +255,150 @@ class PortfolioUpdateQueue(LoggerMixin):
                     })
                 else:
                     # New request
-                    self._pending_updates[portfolio_id] = UpdateRequest(
+                    request = UpdateRequest(
                         portfolio_id=portfolio_id,
                         symbols=symbol_set,
                         timestamp=current_time,
-                        priority=priority
+                        priority=priority,
+                        debounce_seconds=debounce_seconds
                     )
+                    self._pending_updates[portfolio_id] = request
+                    is_next_due = self._schedule(request)
 
                     self.log_debug(f"Queued new update for portfolio {portfolio_id}", extra={
                         "symbols": symbols,
                         "priority": priority
                     })
 
+            if is_next_due:
+                self._wake_processor()
+
             return True
 
         except Exception as e:
+            self._dropped_total += 1
             self.log_error(f"Error queuing portfolio update for {portfolio_id}", error=str(e))
             return False
 
+    def _defer_update(self, portfolio_id: str, symbols: Set[str], priority: int):
+        """Park a rate-limited request, merging it with any request already deferred."""
+        release_time = self._rate_limit_release_time(portfolio_id)
+
+        with self._update_lock:
+            self._arrivals += 1
+            self._deferred_total += 1
+            deferred = self._deferred_updates.get(portfolio_id)
+
+            if deferred:
+                deferred.symbols.update(symbols)
+                deferred.timestamp = time.time()
+                deferred.priority = max(deferred.priority, priority)
+                is_next_release = False
+            else:
+                self._deferred_updates[portfolio_id] = UpdateRequest(
+                    portfolio_id=portfolio_id,
+                    symbols=set(symbols),
+                    timestamp=time.time(),
+                    priority=priority
+                )
+                heapq.heappush(self._deferred_releases, (release_time, portfolio_id))
+                is_next_release = self._deferred_releases[0] == (release_time, portfolio_id)
+
+        self.log_debug(f"Rate limit exceeded for portfolio {portfolio_id}, deferring update", extra={
+            "symbols": list(symbols),
+            "release_in_seconds": round(release_time - time.time(), 1)
+        })
+        if is_next_release:
+            self._wake_processor()
+
+    def _release_deferred(self, current_time: float):
+        """Move deferred requests whose rate limit window has opened into the pending queue (caller holds the lock)."""
+        still_limited = []
+        while self._deferred_releases and self._deferred_releases[0][0] <= current_time:
+            _, portfolio_id = heapq.heappop(self._deferred_releases)
+            deferred = self._deferred_updates.get(portfolio_id)
+            if deferred is None:
+                continue
+
+            # Updates executed since the request was deferred may still fill the window
+            if not self._check_rate_limit(portfolio_id):
+                still_limited.append((self._rate_limit_release_time(portfolio_id), portfolio_id))
+                continue
+
+            del self._deferred_updates[portfolio_id]
+            self._released_total += 1
+
+            pending = self._pending_updates.get(portfolio_id)
+            if pending:
+                pending.symbols.update(deferred.symbols)
+                pending.priority = max(pending.priority, deferred.priority)
+            else:
+                # The request already waited out the window; make it due now
+                deferred.timestamp = current_time
+                deferred.debounce_seconds = 0.0
+                self._pending_updates[portfolio_id] = deferred
+                self._schedule(deferred)
+
+        for entry in still_limited:
+            heapq.heappush(self._deferred_releases, entry)
+
+    def _rate_limit_release_time(self, portfolio_id: str) -> float:
+        """Time at which the portfolio's rate limit window next has room."""
+        timestamps = self._rate_limit_windows[portfolio_id]
+        excess = len(timestamps) - self.max_updates_per_minute
+        if excess < 0:
+            return time.time()
+        return timestamps[excess] + 60
+
+    def _deadline(self, request: UpdateRequest) -> float:
+        """Time at which a request's debounce period ends."""
+        debounce_seconds = request.debounce_seconds if request.debounce_seconds is not None else self.debounce_seconds
+        return request.timestamp + debounce_seconds
+
+    def _schedule(self, request: UpdateRequest) -> bool:
+        """
+        Push a heap entry for the request, superseding its earlier entries (caller holds the lock).
+
+        Returns:
+            True if the request is now the next one due
+        """
+        request.version = next(self._sequence)
+        entry = (self._deadline(request), -request.priority, request.portfolio_id, request.version)
+        heapq.heappush(self._deadlines, entry)
+
+        # Coalescing leaves stale entries behind; rebuild once they dominate the heap
+        if len(self._deadlines) > 2 * len(self._pending_updates) + 64:
+            self._deadlines = [
+                (self._deadline(pending), -pending.priority, pending.portfolio_id, pending.version)
+                for pending in self._pending_updates.values()
+            ]
+            heapq.heapify(self._deadlines)
+
+        return self._deadlines[0] == entry
+
+    def _wake_processor(self):
+        """Wake the processor to recompute its sleep (safe from any thread)."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            wakeup.set()
+        else:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def _get_debounce_seconds(self, symbols: Set[str], priority: int) -> float:
+        """Debounce for a request; routine updates wait longer while all their markets are closed."""
+        if self.closed_market_debounce_seconds is None or priority > 1 or not symbols:
+            return self.debounce_seconds
+
+        if get_trading_calendar().any_open(symbols):
+            return self.debounce_seconds
+        return max(self.debounce_seconds, self.closed_market_debounce_seconds)
+
     def _check_rate_limit(self, portfolio_id: str) -> bool:
         """Check if portfolio is within rate limits."""
         current_time = time.time()
@@ -175,6 +434,7 @@ class PortfolioUpdateQueue(LoggerMixin):
             with self._update_lock:
                 pending_updates = len(self._pending_updates)
                 active_portfolios = len([p for p in self._pending_updates.keys() if self._pending_updates[p].symbols])
+                deferred_updates = len(self._deferred_updates)
 
             # Calculate processing rate (updates per minute)
             recent_updates = []
@@ -214,7 +474,17 @@ class PortfolioUpdateQueue(LoggerMixin):
                     is_processing=not (self._processing_task is None or self._processing_task.done()),
                     debounce_seconds=self.debounce_seconds,
                     max_updates_per_minute=self.max_updates_per_minute,
-                    created_at=utc_now().replace(tzinfo=None)
+                    created_at=utc_now().replace(tzinfo=None),
+                    extra_data={
+                        "adaptive": self.adaptive,
+                        "batch_size": self.batch_size,
+                        "arrival_rate_per_second": round(self._arrival_rate, 2),
+                        "load": round(self._load, 3),
+                        "deferred_updates": deferred_updates,
+                        "deferred_total": self._deferred_total,
+                        "released_total": self._released_total,
+                        "dropped_total": self._dropped_total
+                    }
                 )
                 db.add(queue_metric)
                 if close_db:
@@ -241,12 +511,15 @@ class PortfolioUpdateQueue(LoggerMixin):
 
         try:
             while not self._shutdown:
+                if self.adaptive:
+                    self._adapt_to_load()
+
                 await self._process_batch()
 
                 # Record queue metrics periodically
                 self._record_queue_metrics()
 
-                await asyncio.sleep(0.5)  # Check queue every 500ms
+                await self._wait_until_due()
 
         except asyncio.CancelledError:
             self.log_info("Portfolio update queue processor cancelled")
@@ -254,25 +527,97 @@ class PortfolioUpdateQueue(LoggerMixin):
         except Exception as e:
             self.log_error("Error in portfolio update queue processor", error=str(e))
 
+    async def _wait_until_due(self):
+        """Sleep until the next request is due or an earlier one is queued."""
+        self._wakeup.clear()
+        with self._update_lock:
+            next_deadline = self._deadlines[0][0] if self._deadlines else None
+            next_release = self._deferred_releases[0][0] if self._deferred_releases else None
+
+        timeout = MAX_IDLE_SECONDS
+        if self.adaptive:
+            timeout = min(timeout, ADAPT_INTERVAL_SECONDS)
+        # While dispatch is throttled the next free worker wakes the processor
+        if next_deadline is not None and not self._dispatch_throttled:
+            timeout = min(timeout, max(0.0, next_deadline - time.time()))
+        if next_release is not None:
+            timeout = min(timeout, max(0.0, next_release - time.time()))
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _adapt_to_load(self):
+        """Recompute the debounce window and batch size from live load."""
+        current_time = time.time()
+        elapsed = current_time - self._last_adapt_time
+        if elapsed < ADAPT_INTERVAL_SECONDS:
+            return
+
+        with self._update_lock:
+            arrivals = self._arrivals
+            self._arrivals = 0
+            depth = len(self._pending_updates) + len(self._in_flight)
+        self._last_adapt_time = current_time
+
+        self._arrival_rate = 0.5 * self._arrival_rate + 0.5 * (arrivals / elapsed)
+
+        processing_seconds = DEFAULT_PROCESSING_SECONDS
+        if self._processing_times:
+            processing_seconds = max(sum(self._processing_times) / len(self._processing_times), 0.001)
+        capacity = self.max_workers / processing_seconds  # updates per second
+
+        # Demand relative to capacity, from new arrivals or from the backlog
+        self._load = max(self._arrival_rate / capacity, depth / (capacity * BACKLOG_DRAIN_SECONDS))
+        target = self.min_debounce_seconds + (
+            self.max_debounce_seconds - self.min_debounce_seconds
+        ) * min(1.0, self._load)
+
+        # Widen at once when a storm starts, narrow gradually as it passes
+        if target >= self.debounce_seconds:
+            self.debounce_seconds = round(target, 2)
+        else:
+            self.debounce_seconds = round(0.5 * (self.debounce_seconds + target), 2)
+
+        # Dispatch roughly what the workers finish per interval; the rest keep coalescing
+        self.batch_size = min(
+            self.max_batch_size,
+            max(self.max_workers, math.ceil(capacity * ADAPT_INTERVAL_SECONDS))
+        )
+
     async def _process_batch(self):
-        """Process a batch of ready updates."""
+        """Hand a batch of ready updates to the worker pool."""
         ready_updates = []
         current_time = time.time()
 
-        # Find updates that are ready to process (past debounce time)
+        limit = None
+        if self.batch_size is not None:
+            limit = max(0, self.batch_size - self._ready_updates.qsize())
+        self._dispatch_throttled = False
+
+        # Pop updates that are ready to process (past debounce time)
         with self._update_lock:
-            ready_portfolio_ids = []
+            self._release_deferred(current_time)
 
-            for portfolio_id, request in self._pending_updates.items():
-                time_since_update = current_time - request.timestamp
+            while self._deadlines and self._deadlines[0][0] <= current_time:
+                if limit is not None and len(ready_updates) >= limit:
+                    self._dispatch_throttled = True
+                    break
 
-                if time_since_update >= self.debounce_seconds:
-                    ready_updates.append(request)
-                    ready_portfolio_ids.append(portfolio_id)
+                _, _, portfolio_id, version = heapq.heappop(self._deadlines)
+                request = self._pending_updates.get(portfolio_id)
+                if request is None or request.version != version:
+                    continue  # Superseded by coalescing or already dispatched
+
+                # A newer request for a portfolio being executed waits for that run to
+                # finish; the worker reschedules it
+                if portfolio_id in self._in_flight:
+                    continue
 
-            # Remove processed requests from queue
-            for portfolio_id in ready_portfolio_ids:
                 del self._pending_updates[portfolio_id]
+                self._in_flight.add(portfolio_id)
+                ready_updates.append(request)
 
         if not ready_updates:
             return
@@ -280,26 +625,48 @@ class PortfolioUpdateQueue(LoggerMixin):
         # Sort by priority (highest first)
         ready_updates.sort(key=lambda x: x.priority, reverse=True)
 
-        self.log_info(f"Processing batch of {len(ready_updates)} portfolio updates")
+        self.log_info(f"Dispatching batch of {len(ready_updates)} portfolio updates")
 
-        # Process each update
         for request in ready_updates:
+            self._ready_updates.put_nowait(request)
+
+    async def _run_worker(self, stats: WorkerStats):
+        """Execute ready updates one at a time until the queue stops."""
+        while True:
+            request = await self._ready_updates.get()
+            stats.current_portfolio = request.portfolio_id
+            start_time = time.time()
             try:
-                start_time = time.time()
-                await self._execute_portfolio_update(request)
-                end_time = time.time()
-
+                # Database work runs off the event loop so workers overlap
+                await asyncio.to_thread(self._execute_portfolio_update, request)
+                stats.processed += 1
+            except Exception as e:
+                stats.failed += 1
+                self.log_error(f"Error executing portfolio update for {request.portfolio_id}", error=str(e))
+            finally:
                 # Record processing time for metrics
-                processing_time = end_time - start_time
+                processing_time = time.time() - start_time
                 self._processing_times.append(processing_time)
+                stats.busy_seconds += processing_time
+                stats.last_duration_ms = round(processing_time * 1000, 2)
+                stats.current_portfolio = None
 
                 self._record_update(request.portfolio_id)
+                with self._update_lock:
+                    self._in_flight.discard(request.portfolio_id)
+                    held_request = self._pending_updates.get(request.portfolio_id)
+                    is_next_due = held_request is not None and self._schedule(held_request)
+                if is_next_due or self._dispatch_throttled:
+                    self._wake_processor()
+
+    def _execute_portfolio_update(self, request: UpdateRequest):
+        """
+        Recompute the requested portfolio in its own database session.
 
-            except Exception as e:
-                self.log_error(f"Error executing portfolio update for {request.portfolio_id}", error=str(e))
-
-    async def _execute_portfolio_update(self, request: UpdateRequest):
-        """Execute the actual portfolio update."""
+        Raises:
+            PortfolioError: If the update failed; the worker counts it as failed
+                and no valuation is published
+        """
         from src.services.real_time_portfolio_service import RealTimePortfolioService
         from src.database import SessionLocal
 
@@ -308,24 +675,46 @@ class PortfolioUpdateQueue(LoggerMixin):
             db = SessionLocal()
             portfolio_service = RealTimePortfolioService(db)
 
-            # Update the portfolio with all changed symbols
-            updated_portfolios = portfolio_service.bulk_update_portfolios_for_symbols(
-                list(request.symbols)
+            # Update only this portfolio; others holding the symbols have their own requests
+            updated_portfolio = portfolio_service.update_portfolio_for_symbols(
+                request.portfolio_id, list(request.symbols)
             )
 
-            if updated_portfolios:
-                self.log_info(f"Executed portfolio update for {request.portfolio_id}", extra={
-                    "symbols": list(request.symbols),
-                    "symbol_count": len(request.symbols),
-                    "priority": request.priority
-                })
-            else:
-                self.log_warning(f"Portfolio update found no portfolios for {request.portfolio_id}")
+            if updated_portfolio is None:
+                self.log_warning(f"Portfolio update found no active portfolio {request.portfolio_id}")
+                return
+
+            self.log_info(f"Executed portfolio update for {request.portfolio_id}", extra={
+                "symbols": list(request.symbols),
+                "symbol_count": len(request.symbols),
+                "priority": request.priority
+            })
+            self._publish_valuation(db, request)
 
         finally:
             if 'db' in locals():
                 db.close()
 
+    def _publish_valuation(self, db, request: UpdateRequest):
+        """Push the recomputed valuation to streaming clients subscribed to the portfolio."""
+        from src.services.dynamic_portfolio_service import DynamicPortfolioService
+
+        # Clients streaming from other workers are served by those workers
+        get_event_bus().publish_portfolio_update(request.portfolio_id, request.symbols)
+
+        hub = get_price_broadcast_hub()
+        if not hub.has_portfolio_subscribers(request.portfolio_id):
+            return
+
+        try:
+            valuation = DynamicPortfolioService(db).calculate_valuation_update(
+                UUID(str(request.portfolio_id)), request.symbols
+            )
+            if valuation is not None:
+                hub.publish_portfolio(valuation)
+        except Exception as e:
+            self.log_error(f"Error publishing valuation for {request.portfolio_id}", error=str(e))
+
     def get_queue_stats(self) -> Dict:
         """Get current queue statistics for monitoring."""
         with self._update_lock:
@@ -334,17 +723,54 @@ class PortfolioUpdateQueue(LoggerMixin):
                 pid: len(req.symbols)
                 for pid, req in self._pending_updates.items()
             }
+            in_flight = len(self._in_flight)
+            deferred_symbol_counts = {
+                pid: len(req.symbols)
+                for pid, req in self._deferred_updates.items()
+            }
+            scheduled_deadlines = len(self._deadlines)
+            next_due_in_seconds = (
+                round(max(0.0, self._deadlines[0][0] - time.time()), 3) if self._deadlines else None
+            )
 
         return {
             "pending_updates": pending_count,
+            "scheduled_deadlines": scheduled_deadlines,
+            "next_due_in_seconds": next_due_in_seconds,
             "portfolio_symbol_counts": portfolio_symbols,
+            "deferred_updates": len(deferred_symbol_counts),
+            "deferred_symbol_counts": deferred_symbol_counts,
+            "deferred_total": self._deferred_total,
+            "released_total": self._released_total,
+            "dropped_total": self._dropped_total,
             "rate_limit_windows": {
                 pid: len(timestamps)
                 for pid, timestamps in self._rate_limit_windows.items()
             },
             "is_processing": not (self._processing_task is None or self._processing_task.done()),
             "debounce_seconds": self.debounce_seconds,
-            "max_updates_per_minute": self.max_updates_per_minute
+            "closed_market_debounce_seconds": self.closed_market_debounce_seconds,
+            "max_updates_per_minute": self.max_updates_per_minute,
+            "max_workers": self.max_workers,
+            "adaptive": self.adaptive,
+            "min_debounce_seconds": self.min_debounce_seconds,
+            "max_debounce_seconds": self.max_debounce_seconds,
+            "batch_size": self.batch_size,
+            "arrival_rate_per_second": round(self._arrival_rate, 2),
+            "load": round(self._load, 3),
+            "in_flight": in_flight,
+            "ready_updates": self._ready_updates.qsize() if self._ready_updates is not None else 0,
+            "workers": [
+                {
+                    "worker_id": stats.worker_id,
+                    "processed": stats.processed,
+                    "failed": stats.failed,
+                    "busy_seconds": round(stats.busy_seconds, 3),
+                    "current_portfolio": stats.current_portfolio,
+                    "last_duration_ms": stats.last_duration_ms
+                }
+                for stats in self._worker_stats.values()
+            ]
         }
 
 
@@ -356,7 +782,10 @@ def get_portfolio_update_queue() -> PortfolioUpdateQueue:
     """Get the global portfolio update queue instance."""
     global _portfolio_queue
     if _portfolio_queue is None:
-        _portfolio_queue = PortfolioUpdateQueue()
+        _portfolio_queue = PortfolioUpdateQueue(
+            closed_market_debounce_seconds=CLOSED_MARKET_DEBOUNCE_SECONDS,
+            adaptive=True
+        )
     return _portfolio_queue
 
 
@@ -0,0 +1,271 @@
+"""
+In-process pub/sub fan-out of stored prices to streaming clients.
+
+The market data SSE stream used to poll the master table every 30 seconds for
+each connection, so price changes reached clients up to 30 seconds late and
+every open stream cost a database query per cycle. MarketDataService now
+publishes each stored price snapshot to this hub, and each SSE connection
+awaits its own bounded queue of the symbols it subscribed to.
+
+Portfolio valuations recomputed by the PortfolioUpdateQueue are published the
+same way to connections subscribed to those portfolio IDs, so clients no
+longer poll the portfolio endpoints to see values change.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Union
+
+from src.core.logging import LoggerMixin
+
+if TYPE_CHECKING:
+    from src.services.price_snapshot_service import PriceSnapshot
+
+# Pending updates kept per connection before the oldest are dropped
+DEFAULT_QUEUE_SIZE = 256
+
+
+@dataclass(slots=True)
+class HoldingValuation:
+    """Current value of one holding within a portfolio valuation."""
+    symbol: str
+    quantity: Decimal
+    current_price: Decimal
+    current_value: Decimal
+    unrealized_gain_loss: Decimal
+    unrealized_gain_loss_percent: Decimal
+
+
+@dataclass(slots=True)
+class PortfolioValuationUpdate:
+    """A recomputed portfolio valuation and the holdings whose prices changed."""
+    portfolio_id: str
+    total_value: Decimal
+    daily_change: Decimal
+    daily_change_percent: Decimal
+    unrealized_gain_loss: Decimal
+    last_updated: Optional[datetime]
+    changed_holdings: List[HoldingValuation] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class StreamUpdates:
+    """Latest pending updates for one subscription."""
+    prices: Dict[str, "PriceSnapshot"] = field(default_factory=dict)
+    portfolios: Dict[str, PortfolioValuationUpdate] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.prices or self.portfolios)
+
+
+class PriceSubscription:
+    """
+    One connection's subscription to a set of symbols and portfolios.
+
+    Updates are delivered through a bounded queue; when a slow client lets it
+    fill up, the oldest update is dropped so the newest value always arrives.
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        portfolio_ids: Iterable[str] = (),
+        max_queue_size: int = DEFAULT_QUEUE_SIZE
+    ):
+        self.symbols: Set[str] = set(symbols)
+        self.portfolio_ids: Set[str] = {str(portfolio_id) for portfolio_id in portfolio_ids}
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._loop = asyncio.get_running_loop()
+
+    def close(self) -> None:
+        """Wake a waiting consumer so it can see the subscription is closed (safe from any thread)."""
+        self.closed = True
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._deliver, None)
+
+    def _deliver(self, update: Union["PriceSnapshot", PortfolioValuationUpdate, None]) -> None:
+        """Queue an update (or a close marker), dropping the oldest pending update when full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(update)
+
+    async def get(self, timeout: Optional[float] = None) -> StreamUpdates:
+        """
+        Wait for the next updates.
+
+        Args:
+            timeout: Seconds to wait before returning with no updates (None = forever)
+
+        Returns:
+            Latest price per symbol and valuation per portfolio among all
+            pending updates; empty on timeout or once the subscription is closed
+        """
+        updates = StreamUpdates()
+        if self.closed:
+            return updates
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return updates
+
+        pending = [first]
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+
+        for update in pending:
+            if isinstance(update, PortfolioValuationUpdate):
+                updates.portfolios[update.portfolio_id] = update
+            elif update is not None:
+                updates.prices[update.symbol] = update
+        return updates
+
+    @property
+    def pending(self) -> int:
+        """Number of updates waiting to be sent."""
+        return self._queue.qsize()
+
+
+class PriceBroadcastHub(LoggerMixin):
+    """
+    Fans stored prices and portfolio valuations out to interested subscriptions.
+
+    Publishing is non-blocking and may happen from any thread; delivery is
+    scheduled on the loop that owns each subscription.
+    """
+
+    def __init__(self, max_queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize the hub.
+
+        Args:
+            max_queue_size: Pending updates kept per subscription
+        """
+        self.max_queue_size = max_queue_size
+
+        self._subscriptions: Dict[str, Set[PriceSubscription]] = {}
+        self._portfolio_subscriptions: Dict[str, Set[PriceSubscription]] = {}
+        self._lock = Lock()
+
+        # Counters
+        self._published = 0
+        self._delivered = 0
+        self._valuations_published = 0
+
+    def subscribe(self, symbols: Iterable[str], portfolio_ids: Iterable[str] = ()) -> PriceSubscription:
+        """
+        Subscribe to price updates for the given symbols and valuations for the given portfolios.
+
+        Must be called from the event loop that will consume the updates.
+        """
+        subscription = PriceSubscription(symbols, portfolio_ids, self.max_queue_size)
+        with self._lock:
+            for symbol in subscription.symbols:
+                self._subscriptions.setdefault(symbol, set()).add(subscription)
+            for portfolio_id in subscription.portfolio_ids:
+                self._portfolio_subscriptions.setdefault(portfolio_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: PriceSubscription) -> None:
+        """Stop delivering updates to a subscription."""
+        with self._lock:
+            for index, keys in (
+                (self._subscriptions, subscription.symbols),
+                (self._portfolio_subscriptions, subscription.portfolio_ids)
+            ):
+                for key in keys:
+                    subscribers = index.get(key)
+                    if subscribers is None:
+                        continue
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del index[key]
+
+    def has_portfolio_subscribers(self, portfolio_id: str) -> bool:
+        """Whether any connection is subscribed to the portfolio's valuations."""
+        with self._lock:
+            return str(portfolio_id) in self._portfolio_subscriptions
+
+    def publish(self, snapshot: "PriceSnapshot") -> None:
+        """Publish one stored price snapshot to its symbol's subscribers."""
+        self.publish_many([snapshot])
+
+    def publish_many(self, snapshots: Iterable["PriceSnapshot"]) -> None:
+        """Publish stored price snapshots to each symbol's subscribers."""
+        with self._lock:
+            deliveries: List = []
+            for snapshot in snapshots:
+                self._published += 1
+                for subscription in self._subscriptions.get(snapshot.symbol, ()):
+                    deliveries.append((subscription, snapshot))
+            self._delivered += len(deliveries)
+
+        self._dispatch(deliveries)
+
+    def publish_portfolio(self, valuation: PortfolioValuationUpdate) -> None:
+        """Publish a recomputed portfolio valuation to the portfolio's subscribers."""
+        with self._lock:
+            self._valuations_published += 1
+            deliveries = [
+                (subscription, valuation)
+                for subscription in self._portfolio_subscriptions.get(valuation.portfolio_id, ())
+            ]
+            self._delivered += len(deliveries)
+
+        self._dispatch(deliveries)
+
+    def _dispatch(self, deliveries: List) -> None:
+        """Deliver updates on the loop that owns each subscription."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        for subscription, update in deliveries:
+            if subscription._loop is running_loop:
+                subscription._deliver(update)
+            elif not subscription._loop.is_closed():
+                subscription._loop.call_soon_threadsafe(subscription._deliver, update)
+
+    def clear(self) -> None:
+        """Drop all subscriptions (for testing)."""
+        with self._lock:
+            self._subscriptions.clear()
+            self._portfolio_subscriptions.clear()
+
+    def get_stats(self) -> Dict:
+        """Get fan-out statistics for monitoring."""
+        with self._lock:
+            subscriptions = {
+                sub
+                for index in (self._subscriptions, self._portfolio_subscriptions)
+                for subs in index.values()
+                for sub in subs
+            }
+            return {
+                "subscriptions": len(subscriptions),
+                "symbols": len(self._subscriptions),
+                "portfolios": len(self._portfolio_subscriptions),
+                "published": self._published,
+                "valuations_published": self._valuations_published,
+                "delivered": self._delivered,
+                "pending": sum(sub.pending for sub in subscriptions),
+                "dropped": sum(sub.dropped for sub in subscriptions)
+            }
+
+
+# Global instance for the application
+_price_broadcast_hub: Optional[PriceBroadcastHub] = None
+
+
+def get_price_broadcast_hub() -> PriceBroadcastHub:
+    """Get the global price broadcast hub instance."""
+    global _price_broadcast_hub
+    if _price_broadcast_hub is None:
+        _price_broadcast_hub = PriceBroadcastHub()
+    return _price_broadcast_hub
@@ -0,0 +1,182 @@
+"""
+In-process price cache in front of the realtime_symbols master table.
+
+Keeps recently read price snapshots in a bounded LRU with a TTL so repeated
+lookups of the same symbols do not hit the database. Entries are refreshed by
+MarketDataService.store_price_to_master and invalidated whenever an ORM session
+flushes or commits a change to a RealtimeSymbol row.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.logging import LoggerMixin
+from src.models.realtime_symbol import RealtimeSymbol
+
+if TYPE_CHECKING:
+    from src.services.price_snapshot_service import PriceSnapshot
+
+# Default sizing: a few hundred actively traded tickers fit comfortably
+DEFAULT_MAX_SIZE = 2000
+DEFAULT_TTL_SECONDS = 60.0
+
+
+class PriceCache(LoggerMixin):
+    """
+    Thread-safe LRU cache of price snapshots with a per-entry TTL.
+
+    Features:
+    - Bounded size: least recently used entries are evicted first
+    - TTL: entries older than ttl_seconds are treated as misses
+    - Counters: hits, misses, evictions, expirations and invalidations
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the price cache.
+
+        Args:
+            max_size: Maximum number of symbols kept in memory
+            ttl_seconds: How long an entry stays valid after it is stored
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, PriceSnapshot]]" = OrderedDict()
+        self._lock = Lock()
+
+        # Counters
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get_many(self, symbols: Iterable[str]) -> Dict[str, "PriceSnapshot"]:
+        """
+        Get cached snapshots for the given symbols.
+
+        Returns:
+            Dictionary of fresh cached snapshots; missing or expired symbols are omitted
+        """
+        now = time.monotonic()
+        found = {}
+
+        with self._lock:
+            for symbol in symbols:
+                entry = self._entries.get(symbol)
+                if entry is None:
+                    self._misses += 1
+                    continue
+
+                stored_at, snapshot = entry
+                if now - stored_at > self.ttl_seconds:
+                    del self._entries[symbol]
+                    self._expirations += 1
+                    self._misses += 1
+                    continue
+
+                self._entries.move_to_end(symbol)
+                self._hits += 1
+                found[symbol] = snapshot
+
+        return found
+
+    def get(self, symbol: str) -> Optional["PriceSnapshot"]:
+        """Get a cached snapshot for one symbol, or None on a miss."""
+        return self.get_many([symbol]).get(symbol)
+
+    def put_many(self, snapshots: Dict[str, "PriceSnapshot"]) -> None:
+        """Store snapshots, evicting least recently used entries beyond max_size."""
+        if self.max_size <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            for symbol, snapshot in snapshots.items():
+                self._entries[symbol] = (now, snapshot)
+                self._entries.move_to_end(symbol)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def put(self, snapshot: "PriceSnapshot") -> None:
+        """Store or replace the snapshot for one symbol."""
+        self.put_many({snapshot.symbol: snapshot})
+
+    def invalidate(self, symbols: Iterable[str]) -> None:
+        """Drop cached entries for the given symbols."""
+        with self._lock:
+            for symbol in symbols:
+                if self._entries.pop(symbol, None) is not None:
+                    self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics for monitoring."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Global instance for the application
+_price_cache: Optional[PriceCache] = None
+
+
+def get_price_cache() -> PriceCache:
+    """Get the global price cache instance."""
+    global _price_cache
+    if _price_cache is None:
+        _price_cache = PriceCache()
+    return _price_cache
+
+
+_PENDING_KEY = "price_cache_pending_symbols"
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_symbols(session: Session, flush_context) -> None:
+    """Invalidate cached prices for RealtimeSymbol rows written in this flush."""
+    symbols = {
+        instance.symbol
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(instance, RealtimeSymbol)
+    }
+    if symbols:
+        get_price_cache().invalidate(symbols)
+        # Invalidate again on commit in case a concurrent reader re-cached the old row
+        session.info.setdefault(_PENDING_KEY, set()).update(symbols)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_symbols(session: Session) -> None:
+    """Invalidate cached prices for RealtimeSymbol rows committed by this session."""
+    symbols = session.info.pop(_PENDING_KEY, None)
+    if symbols:
+        get_price_cache().invalidate(symbols)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_symbols(session: Session) -> None:
+    """Forget pending invalidations; flushed entries were already dropped."""
+    session.info.pop(_PENDING_KEY, None)
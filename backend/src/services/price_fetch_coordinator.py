@@ -0,0 +1,158 @@
+"""
+Process-wide single-flight coordination for provider price fetches.
+
+A new MarketDataService is created per request, so per-instance bookkeeping
+cannot stop concurrent requests for the same symbol from each calling the
+provider. The coordinator lets concurrent callers await one in-flight fetch per
+symbol and serves repeat requests from a bounded, shared recent-fetch cache.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from src.core.logging import LoggerMixin
+
+# Matches the previous per-instance 10 minute "fetched recently" window
+DEFAULT_RECENT_TTL_SECONDS = 600.0
+DEFAULT_MAX_RECENT = 1000
+
+
+class PriceFetchCoordinator(LoggerMixin):
+    """
+    Coalesces concurrent fetches of the same symbol into one provider call.
+
+    Features:
+    - Single-flight: callers arriving while a fetch is running await its result
+    - Recent-fetch cache: successful results are reused for recent_ttl_seconds
+    - Bounded: the recent cache keeps at most max_recent symbols (LRU)
+    """
+
+    def __init__(self, recent_ttl_seconds: float = DEFAULT_RECENT_TTL_SECONDS, max_recent: int = DEFAULT_MAX_RECENT):
+        """
+        Initialize the coordinator.
+
+        Args:
+            recent_ttl_seconds: How long a successful fetch is reused
+            max_recent: Maximum number of symbols kept in the recent-fetch cache
+        """
+        self.recent_ttl_seconds = recent_ttl_seconds
+        self.max_recent = max_recent
+
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._recent: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = Lock()
+
+        # Counters
+        self._provider_calls = 0
+        self._coalesced = 0
+        self._recent_hits = 0
+
+    async def fetch(self, symbol: str, fetcher: Callable[[], Awaitable[Optional[Dict]]]) -> Optional[Dict]:
+        """
+        Fetch a symbol, sharing the result with concurrent and recent callers.
+
+        Args:
+            symbol: Symbol being fetched
+            fetcher: Coroutine factory performing the actual provider fetch
+
+        Returns:
+            Price data from the shared fetch, or None if it failed
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            recent = self._get_recent(symbol)
+            if recent is not None:
+                self._recent_hits += 1
+                return recent
+
+            in_flight = self._in_flight.get(symbol)
+            # Futures belong to one event loop; never await another loop's fetch
+            if in_flight is not None and not in_flight.done() and in_flight.get_loop() is loop:
+                self._coalesced += 1
+                leader = False
+            else:
+                in_flight = loop.create_future()
+                self._in_flight[symbol] = in_flight
+                self._provider_calls += 1
+                leader = True
+
+        if not leader:
+            self.log_debug("Joining in-flight price fetch", symbol=symbol)
+            return await asyncio.shield(in_flight)
+
+        try:
+            result = await fetcher()
+        except BaseException as e:
+            in_flight.set_exception(e)
+            # Mark the exception retrieved in case nobody else was waiting
+            in_flight.exception()
+            raise
+        else:
+            in_flight.set_result(result)
+            if result:
+                self._remember(symbol, result)
+            return result
+        finally:
+            with self._lock:
+                if self._in_flight.get(symbol) is in_flight:
+                    del self._in_flight[symbol]
+
+    def forget(self, symbol: str) -> None:
+        """Drop a symbol from the recent-fetch cache so the next request refetches it."""
+        with self._lock:
+            self._recent.pop(symbol, None)
+
+    def clear(self) -> None:
+        """Drop all recent-fetch entries."""
+        with self._lock:
+            self._recent.clear()
+
+    def get_stats(self) -> Dict:
+        """Get coalescing statistics for monitoring."""
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "recent_size": len(self._recent),
+                "max_recent": self.max_recent,
+                "provider_calls": self._provider_calls,
+                "coalesced": self._coalesced,
+                "recent_hits": self._recent_hits
+            }
+
+    def _get_recent(self, symbol: str) -> Optional[Dict]:
+        """Get a fresh recent-fetch result (caller holds the lock)."""
+        entry = self._recent.get(symbol)
+        if entry is None:
+            return None
+
+        fetched_at, result = entry
+        if time.monotonic() - fetched_at > self.recent_ttl_seconds:
+            del self._recent[symbol]
+            return None
+
+        self._recent.move_to_end(symbol)
+        return result
+
+    def _remember(self, symbol: str, result: Dict) -> None:
+        """Store a successful fetch, evicting the least recently used symbols."""
+        with self._lock:
+            self._recent[symbol] = (time.monotonic(), result)
+            self._recent.move_to_end(symbol)
+            while len(self._recent) > self.max_recent:
+                self._recent.popitem(last=False)
+
+
+# Global instance for the application
+_price_fetch_coordinator: Optional[PriceFetchCoordinator] = None
+
+
+def get_price_fetch_coordinator() -> PriceFetchCoordinator:
+    """Get the global price fetch coordinator instance."""
+    global _price_fetch_coordinator
+    if _price_fetch_coordinator is None:
+        _price_fetch_coordinator = PriceFetchCoordinator()
+    return _price_fetch_coordinator
@@ -0,0 +1,161 @@
+"""
+Batched price snapshot service.
+
+Resolves current prices for any set of symbols from the realtime_symbols
+master table with a single IN query per chunk, instead of one query per symbol.
+Reads go through the process-wide price cache first.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.core.logging import LoggerMixin
+from src.models.market_data_provider import MarketDataProvider
+from src.models.realtime_price_history import RealtimePriceHistory
+from src.models.realtime_symbol import RealtimeSymbol
+from src.services.price_cache import get_price_cache
+
+# Keep IN lists well under SQLite's bound-parameter limit
+SNAPSHOT_CHUNK_SIZE = 500
+
+
+@dataclass(frozen=True, slots=True)
+class PriceSnapshot:
+    """Current price data for one symbol, as stored in the master table."""
+    symbol: str
+    price: Decimal
+    last_updated: datetime
+    previous_close: Optional[Decimal] = None
+    provider: Optional[str] = None  # Provider display name
+    company_name: Optional[str] = None
+    volume: Optional[int] = None
+    market_cap: Optional[Decimal] = None
+
+    @classmethod
+    def from_master_record(
+        cls,
+        master_record: RealtimeSymbol,
+        previous_close=None,
+        provider: Optional[str] = None
+    ) -> "PriceSnapshot":
+        """
+        Build a snapshot from an in-session master record.
+
+        Values are normalised to what a fresh read from the database returns
+        (Decimal numerics, naive UTC timestamps) so cached and queried
+        snapshots are interchangeable.
+        """
+        last_updated = master_record.last_updated
+        if last_updated is not None and last_updated.tzinfo is not None:
+            last_updated = last_updated.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return cls(
+            symbol=master_record.symbol,
+            price=Decimal(str(master_record.current_price)),
+            last_updated=last_updated,
+            previous_close=Decimal(str(previous_close)) if previous_close else None,
+            provider=provider,
+            company_name=master_record.company_name,
+            volume=master_record.volume,
+            market_cap=Decimal(str(master_record.market_cap)) if master_record.market_cap is not None else None
+        )
+
+    def to_price_data(self) -> Dict:
+        """Convert to the price data dict shape used by the market data API."""
+        return {
+            "symbol": self.symbol,
+            "price": self.price,
+            "company_name": self.company_name,
+            "fetched_at": self.last_updated,
+            "volume": self.volume,
+            "market_cap": self.market_cap,
+            "previous_close": self.previous_close,
+            "provider": self.provider
+        }
+
+
+class PriceSnapshotService(LoggerMixin):
+    """Service for reading master table prices for many symbols at once."""
+
+    def __init__(self, db: Session, chunk_size: int = SNAPSHOT_CHUNK_SIZE, use_cache: bool = True):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.cache = get_price_cache() if use_cache else None
+
+    def get_snapshots(self, symbols: Iterable[str]) -> Dict[str, PriceSnapshot]:
+        """
+        Get price snapshots for a set of symbols.
+
+        Args:
+            symbols: Symbols to resolve (duplicates are ignored)
+
+        Returns:
+            Dictionary mapping symbols to snapshots; symbols without a master
+            record are omitted
+        """
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return {}
+
+        snapshots = self.cache.get_many(unique_symbols) if self.cache else {}
+        missing = [symbol for symbol in unique_symbols if symbol not in snapshots]
+
+        loaded = {}
+        for i in range(0, len(missing), self.chunk_size):
+            chunk = missing[i:i + self.chunk_size]
+            loaded.update(self._query_chunk(chunk))
+
+        if self.cache and loaded:
+            self.cache.put_many(loaded)
+        snapshots.update(loaded)
+
+        self.log_debug(
+            "Resolved price snapshots",
+            requested=len(unique_symbols),
+            cached=len(unique_symbols) - len(missing),
+            found=len(snapshots)
+        )
+        return snapshots
+
+    def get_snapshot(self, symbol: str) -> Optional[PriceSnapshot]:
+        """Get the price snapshot for a single symbol, or None if not in the master table."""
+        return self.get_snapshots([symbol]).get(symbol)
+
+    def _query_chunk(self, symbols: list) -> Dict[str, PriceSnapshot]:
+        """Resolve one chunk of symbols with a single joined query."""
+        rows = self.db.query(
+            RealtimeSymbol.symbol,
+            RealtimeSymbol.current_price,
+            RealtimeSymbol.last_updated,
+            RealtimePriceHistory.previous_close,
+            MarketDataProvider.display_name,
+            RealtimeSymbol.company_name,
+            RealtimeSymbol.volume,
+            RealtimeSymbol.market_cap
+        ).outerjoin(
+            RealtimePriceHistory,
+            RealtimePriceHistory.id == RealtimeSymbol.latest_history_id
+        ).outerjoin(
+            MarketDataProvider,
+            MarketDataProvider.id == RealtimeSymbol.provider_id
+        ).filter(
+            RealtimeSymbol.symbol.in_(symbols)
+        ).all()
+
+        return {
+            row.symbol: PriceSnapshot(
+                symbol=row.symbol,
+                price=Decimal(str(row.current_price)),
+                last_updated=row.last_updated,
+                previous_close=row.previous_close if row.previous_close else None,
+                provider=row.display_name,
+                company_name=row.company_name,
+                volume=row.volume,
+                market_cap=row.market_cap
+            )
+            for row in rows
+        }
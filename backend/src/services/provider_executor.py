@@ -0,0 +1,166 @@
+"""
+Dedicated thread pool for blocking market data provider calls.
+
+yfinance is a blocking library; running it on the event loop's default
+executor lets provider I/O starve every other to_thread/run_in_executor user
+and gives no visibility into backlog or latency. This executor is bounded,
+applies per-call timeouts and records queue depth and latency metrics.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Optional
+
+from src.core.logging import LoggerMixin
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT_SECONDS = 60.0
+
+
+class ProviderExecutor(LoggerMixin):
+    """
+    Bounded, instrumented thread pool for provider I/O.
+
+    Features:
+    - Bounded concurrency: at most max_workers blocking calls run at once
+    - Timeouts: callers stop waiting after timeout_seconds (the worker thread
+      finishes in the background and its result is discarded)
+    - Metrics: queue depth, active calls, queue wait and call latency
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of concurrent blocking provider calls
+            timeout_seconds: Default per-call timeout
+        """
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+        # Metrics
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._timeouts = 0
+        self._latencies_ms: Deque[float] = deque(maxlen=200)
+        self._queue_waits_ms: Deque[float] = deque(maxlen=200)
+
+    async def run(self, func: Callable[..., Any], *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run a blocking callable in the provider pool.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            timeout: Per-call timeout override in seconds
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            asyncio.TimeoutError: If the call does not finish within the timeout
+        """
+        submitted_at = time.monotonic()
+        with self._lock:
+            self._queued += 1
+
+        def call():
+            started_at = time.monotonic()
+            with self._lock:
+                self._queued -= 1
+                self._active += 1
+                self._queue_waits_ms.append((started_at - submitted_at) * 1000)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._latencies_ms.append((time.monotonic() - started_at) * 1000)
+
+        future = self._get_executor().submit(call)
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=timeout if timeout is not None else self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            if future.cancel():
+                # Never started, so call() will not decrement the queue
+                with self._lock:
+                    self._queued -= 1
+            with self._lock:
+                self._timeouts += 1
+            self.log_warning("Provider call timed out", function=getattr(func, "__name__", repr(func)))
+            raise
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+
+        with self._lock:
+            self._completed += 1
+        return result
+
+    def get_stats(self) -> Dict:
+        """Get queue depth and latency metrics for monitoring."""
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            waits = list(self._queue_waits_ms)
+            return {
+                "max_workers": self.max_workers,
+                "timeout_seconds": self.timeout_seconds,
+                "queue_depth": self._queued,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timeouts": self._timeouts,
+                "avg_latency_ms": round(sum(latencies) / len(latencies), 2) if latencies else None,
+                "p95_latency_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 2) if latencies else None,
+                "avg_queue_wait_ms": round(sum(waits) / len(waits), 2) if waits else None
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down the worker threads; a new pool is created on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            with self._lock:
+                # Cancelled calls never start, so they never leave the queue themselves
+                self._queued = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="provider-io"
+                )
+            return self._executor
+
+
+# Global instance for the application
+_provider_executor: Optional[ProviderExecutor] = None
+
+
+def get_provider_executor() -> ProviderExecutor:
+    """Get the global provider executor instance."""
+    global _provider_executor
+    if _provider_executor is None:
+        _provider_executor = ProviderExecutor()
+    return _provider_executor
+
+
+def shutdown_provider_executor():
+    """Shut down the global provider executor's worker threads."""
+    if _provider_executor is not None:
+        _provider_executor.shutdown()
@@ -0,0 +1,221 @@
+"""
+Per-provider async rate limiting for market data API calls.
+
+Each provider gets a token bucket sized from MarketDataProvider.rate_limit_per_minute
+and a daily quota from rate_limit_per_day. Callers await capacity concurrently:
+each acquire reserves a token immediately and sleeps only for its own deficit,
+so queued calls are released as fast as the quota refills instead of being
+spaced by fixed sleeps.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from src.core.logging import LoggerMixin
+
+
+def _positive_int(value) -> Optional[int]:
+    """Return value if it is a positive integer limit, otherwise None (unlimited)."""
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket allowing short bursts up to capacity and refilling continuously.
+
+    Tokens may go negative: a negative balance is the backlog of reserved
+    calls still waiting for capacity.
+    """
+    capacity: float
+    refill_per_second: float
+    tokens: float = field(default=None)
+    updated_at: float = field(default=None)
+
+    def __post_init__(self):
+        if self.tokens is None:
+            self.tokens = self.capacity
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        if self.updated_at is not None:
+            elapsed = max(0.0, now - self.updated_at)
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+
+    def reserve(self, now: float, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens and return how long the caller must wait for them.
+
+        Returns:
+            Seconds until the reservation is covered (0 when available now)
+        """
+        self.refill(now)
+        self.tokens -= tokens
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_second
+
+    def release(self, tokens: float = 1.0) -> None:
+        """Return tokens from a reservation that will not be used."""
+        self.tokens = min(self.capacity, self.tokens + tokens)
+
+
+@dataclass
+class ProviderQuota:
+    """Rate limit state for one provider."""
+    per_minute: Optional[int]
+    per_day: Optional[int]
+    bucket: Optional[TokenBucket]
+    day: date
+    used_today: int = 0
+    throttled: int = 0
+    rejected: int = 0
+
+
+class ProviderRateLimiter(LoggerMixin):
+    """
+    Async rate limiter with one token bucket per market data provider.
+
+    Limits are read from the provider rows on every acquire, so changes made
+    through the admin API take effect without a restart. Providers without a
+    configured limit are not throttled.
+    """
+
+    def __init__(self, max_wait_seconds: float = 120.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_wait_seconds: Longest a caller may wait for capacity before giving up
+            clock: Monotonic clock, injectable for tests
+        """
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._quotas: Dict[str, ProviderQuota] = {}
+        self._lock = Lock()
+
+    async def acquire(self, provider, tokens: int = 1, max_wait_seconds: Optional[float] = None) -> bool:
+        """
+        Wait until the provider has capacity for a call.
+
+        Args:
+            provider: MarketDataProvider (name and rate limit columns are used)
+            tokens: Number of API calls about to be made
+            max_wait_seconds: Override for the maximum wait
+
+        Returns:
+            True when the call may proceed, False if the daily quota is exhausted
+            or the wait would exceed max_wait_seconds
+        """
+        max_wait = self.max_wait_seconds if max_wait_seconds is None else max_wait_seconds
+
+        with self._lock:
+            quota = self._get_quota(provider)
+            self._roll_day(quota)
+
+            if quota.per_day is not None and quota.used_today + tokens > quota.per_day:
+                quota.rejected += 1
+                self.log_warning("Daily quota exhausted", provider=provider.name, used_today=quota.used_today)
+                return False
+
+            wait = quota.bucket.reserve(self._clock(), tokens) if quota.bucket else 0.0
+            if wait > max_wait:
+                quota.bucket.release(tokens)
+                quota.rejected += 1
+                self.log_warning("Rate limit wait too long", provider=provider.name, wait_seconds=round(wait, 2))
+                return False
+
+            quota.used_today += tokens
+            if wait > 0:
+                quota.throttled += 1
+
+        if wait > 0:
+            self.log_debug("Waiting for rate limit capacity", provider=provider.name, wait_seconds=round(wait, 2))
+            await asyncio.sleep(wait)
+        return True
+
+    def get_remaining_quota(self, provider) -> Dict:
+        """
+        Get the remaining quota for a provider.
+
+        Returns:
+            Dictionary with the configured limits, calls available right now,
+            calls left today, and throttle/reject counters
+        """
+        with self._lock:
+            quota = self._get_quota(provider)
+            self._roll_day(quota)
+            if quota.bucket:
+                quota.bucket.refill(self._clock())
+
+            return {
+                "provider": provider.name,
+                "rate_limit_per_minute": quota.per_minute,
+                "rate_limit_per_day": quota.per_day,
+                "available_now": max(0, int(quota.bucket.tokens)) if quota.bucket else None,
+                "remaining_today": max(0, quota.per_day - quota.used_today) if quota.per_day is not None else None,
+                "used_today": quota.used_today,
+                "throttled": quota.throttled,
+                "rejected": quota.rejected
+            }
+
+    def reset(self) -> None:
+        """Forget all provider state (quotas start full again)."""
+        with self._lock:
+            self._quotas.clear()
+
+    def _get_quota(self, provider) -> ProviderQuota:
+        """Get the quota state for a provider, applying any changed limits."""
+        per_minute = _positive_int(getattr(provider, "rate_limit_per_minute", None))
+        per_day = _positive_int(getattr(provider, "rate_limit_per_day", None))
+        quota = self._quotas.get(provider.name)
+
+        if quota is None:
+            quota = ProviderQuota(
+                per_minute=per_minute,
+                per_day=per_day,
+                bucket=self._make_bucket(per_minute),
+                day=self._today()
+            )
+            self._quotas[provider.name] = quota
+        elif quota.per_minute != per_minute:
+            quota.per_minute = per_minute
+            quota.bucket = self._make_bucket(per_minute)
+        quota.per_day = per_day
+
+        return quota
+
+    def _make_bucket(self, per_minute: Optional[int]) -> Optional[TokenBucket]:
+        if per_minute is None:
+            return None
+        return TokenBucket(capacity=per_minute, refill_per_second=per_minute / 60.0)
+
+    def _roll_day(self, quota: ProviderQuota) -> None:
+        """Reset the daily counter at the UTC day boundary."""
+        today = self._today()
+        if quota.day != today:
+            quota.day = today
+            quota.used_today = 0
+
+    @staticmethod
+    def _today() -> date:
+        return datetime.now(timezone.utc).date()
+
+
+# Global instance for the application
+_provider_rate_limiter: Optional[ProviderRateLimiter] = None
+
+
+def get_provider_rate_limiter() -> ProviderRateLimiter:
+    """Get the global provider rate limiter instance."""
+    global _provider_rate_limiter
+    if _provider_rate_limiter is None:
+        _provider_rate_limiter = ProviderRateLimiter()
+    return _provider_rate_limiter
@@ -8,9 +8,11 @@ Calculates daily changes and trends based on opening prices.
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import List, Optional, Dict
+from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import desc, and_
 
+from src.core.exceptions import PortfolioError
 from src.core.logging import LoggerMixin
 from src.models import Portfolio, Holding, Stock, RealtimePriceHistory
 from src.services.dynamic_portfolio_service import DynamicPortfolioService, PortfolioValue
@@ -106,6 +108,51 @@ class RealTimePortfolioService(LoggerMixin):
             self.log_error(f"Error in bulk portfolio update", error=str(e))
             return []
 
+    def update_portfolio_for_symbols(self, portfolio_id: str, symbols: List[str]) -> Optional[Portfolio]:
+        """
+        Update a single portfolio after some of its symbols changed.
+
+        Unlike bulk_update_portfolios_for_symbols, other portfolios holding
+        the same symbols are left to their own queued updates.
+
+        Args:
+            portfolio_id: Portfolio to update
+            symbols: Stock symbols that changed
+
+        Returns:
+            The updated portfolio, or None if it does not exist or is inactive
+
+        Raises:
+            PortfolioError: If recalculating the portfolio failed and was rolled back
+        """
+        try:
+            portfolio = self.db.query(Portfolio).filter(
+                and_(
+                    Portfolio.id == UUID(str(portfolio_id)),
+                    Portfolio.is_active.is_(True)
+                )
+            ).first()
+        except ValueError:
+            self.log_warning(f"Invalid portfolio id for update: {portfolio_id}")
+            return None
+
+        if portfolio is None:
+            return None
+
+        symbol_price_data = {}
+        for symbol in symbols:
+            latest_price = self._get_latest_price_data(symbol)
+            if latest_price:
+                symbol_price_data[symbol] = latest_price
+
+        if not self._update_portfolio_with_all_holdings(portfolio, symbol_price_data):
+            raise PortfolioError(
+                f"Failed to update portfolio {portfolio_id}",
+                code="PORTFOLIO_UPDATE_FAILED",
+                details={"portfolio_id": str(portfolio_id), "symbols": list(symbols)}
+            )
+        return portfolio
+
     def _find_portfolios_with_symbol(self, symbol: str) -> List[Portfolio]:
         """Find all portfolios that have holdings in the given symbol."""
         try:
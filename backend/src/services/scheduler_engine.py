@@ -0,0 +1,385 @@
+"""
+Single scheduling engine for scheduled market data fetches.
+
+Scheduled fetches used to be triggered from two places: the background loop in
+main.py and MarketDataSchedulerService.execute_market_data_fetch. Neither
+honoured the scheduler configuration, and a manual run overlapping a periodic
+cycle doubled the provider load. The engine is now the only thing that runs
+scheduled fetch cycles. Each cycle is split into provider-sized batch jobs
+that run with at most max_concurrent_jobs in flight, each attempt limited to
+timeout_seconds. Symbols a job fetched no price for are retried up to
+retry_attempts times with exponential backoff. A run requested while a cycle
+is in flight joins that cycle instead of starting another one. Portfolios are
+revalued by PortfolioUpdateQueue, which storing the prices already notifies.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.core.logging import LoggerMixin
+from src.database import SessionLocal, get_db
+from src.services.activity_service import log_provider_activity
+from src.services.market_data_service import MarketDataService
+from src.services.polling_planner import get_polling_planner
+from src.services.universe_refresh_scheduler import get_universe_refresh_scheduler
+from src.utils.datetime_utils import utc_now
+
+# Symbols fetched when no holdings or recent requests are found
+FALLBACK_SYMBOLS = ["CBA", "BHP", "WBC", "CSL"]
+
+
+class SchedulerEngine(LoggerMixin):
+    """
+    Runs scheduled fetch cycles using the scheduler service's configuration.
+
+    Features:
+    - Single trigger: the background loop and manual runs share one cycle
+    - Bounded concurrency: at most max_concurrent_jobs batch jobs in flight
+    - Per-job timeouts: each attempt is cancelled after timeout_seconds
+    - Retries: failed symbols and timed out jobs are retried with exponential backoff
+    - Execution history: every cycle is recorded as a SchedulerExecution row
+    """
+
+    def __init__(
+        self,
+        retry_backoff_seconds: float = 2.0,
+        max_backoff_seconds: float = 60.0,
+        initial_delay_seconds: float = 60.0,
+        idle_poll_seconds: float = 30.0
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            retry_backoff_seconds: Delay before the first retry, doubled on each further retry
+            max_backoff_seconds: Longest delay between retries
+            initial_delay_seconds: Delay before the first background cycle
+            idle_poll_seconds: How often the background loop checks a paused or stopped scheduler
+        """
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.initial_delay_seconds = initial_delay_seconds
+        self.idle_poll_seconds = idle_poll_seconds
+
+        self._loop_task: Optional[asyncio.Task] = None
+        self._cycle_task: Optional[asyncio.Task] = None
+        self._paused = False
+
+        # Counters
+        self._cycles = 0
+        self._coalesced_runs = 0
+        self._jobs_run = 0
+        self._jobs_failed = 0
+        self._retries = 0
+        self._timeouts = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._last_cycle_at: Optional[datetime] = None
+        self._last_cycle_ms: Optional[float] = None
+        self._last_poll_seconds: Optional[float] = None  # Cadence the previous plan asked for
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop is running."""
+        return self._loop_task is not None and not self._loop_task.done()
+
+    @property
+    def is_paused(self) -> bool:
+        """Whether background cycles are paused by admin control."""
+        return self._paused
+
+    def start(self) -> None:
+        """Start the background loop if it is not already running."""
+        self._paused = False
+        if self.is_running:
+            return
+        self._loop_task = asyncio.create_task(self.run_forever())
+        self.log_info("Scheduler engine started")
+
+    async def stop(self) -> None:
+        """Stop the background loop and wait for an in-flight cycle to be cancelled."""
+        for task in (self._loop_task, self._cycle_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._loop_task = None
+        self._cycle_task = None
+        self.log_info("Scheduler engine stopped")
+
+    def pause(self) -> None:
+        """Skip background cycles until resumed; an in-flight cycle finishes."""
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume background cycles."""
+        self._paused = False
+
+    async def run_forever(self) -> None:
+        """Background loop: run a cycle whenever the polling planner says one is due."""
+        from src.services.scheduler_service import SchedulerState, get_scheduler_service
+
+        next_poll_seconds = self.initial_delay_seconds
+        poll_interval_seconds: Optional[float] = None
+
+        while True:
+            try:
+                await asyncio.sleep(next_poll_seconds)
+
+                db = next(get_db())
+                try:
+                    scheduler = get_scheduler_service(db)
+                    if self._paused or scheduler.state != SchedulerState.RUNNING:
+                        self.log_info("Scheduler is paused or stopped, waiting...", state=scheduler.state.value)
+                        next_poll_seconds = self.idle_poll_seconds
+                        continue
+
+                    result = await self.run_now(scheduler, poll_interval_seconds)
+                    poll_interval_seconds = result.get("next_poll_seconds")
+                    next_poll_seconds = poll_interval_seconds or self.idle_poll_seconds
+                finally:
+                    db.close()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log_error("Error in scheduler engine loop", error=str(e))
+                next_poll_seconds = self.initial_delay_seconds
+
+    async def run_now(self, scheduler, poll_interval_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run a fetch cycle now, or join the cycle already in flight.
+
+        Args:
+            scheduler: MarketDataSchedulerService supplying configuration, the
+                database session and execution history
+            poll_interval_seconds: Expected time until the next cycle, used to
+                size its share of the daily quota (defaults to the cadence the
+                previous plan asked for)
+
+        Returns:
+            Dictionary with the cycle's results
+        """
+        if self._cycle_task is not None and not self._cycle_task.done():
+            self._coalesced_runs += 1
+            self.log_info("Fetch cycle already in flight, joining it")
+            return await asyncio.shield(self._cycle_task)
+
+        self._cycle_task = asyncio.create_task(self._run_cycle(scheduler, poll_interval_seconds))
+        return await asyncio.shield(self._cycle_task)
+
+    async def _run_cycle(self, scheduler, poll_interval_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Plan, fetch and record one scheduled cycle."""
+        started_at = time.monotonic()
+        db = scheduler.db
+        config = scheduler.configuration
+        cycle_number = self._cycles + 1
+
+        service = MarketDataService(db)
+        batch_size = service.get_provider_bulk_limit()
+
+        universe = service.get_monitored_universe(minutes_lookback=60)
+        if not universe:
+            universe = list(FALLBACK_SYMBOLS)
+            self.log_info("No actively monitored symbols found, using fallback", symbols=universe)
+
+        # Only refresh symbols whose tier interval has elapsed, within the daily quota.
+        # The budget is sized for the cadence the loop actually runs at; before the
+        # first plan, assume the shortest cadence so an early cycle cannot overspend.
+        planner = get_polling_planner()
+        providers = service.get_enabled_providers()
+        cycle_seconds = poll_interval_seconds or self._last_poll_seconds or planner.min_poll_seconds
+        call_budget = planner.get_call_budget(providers[0], cycle_seconds) if providers else None
+        plan = planner.plan(db, universe, batch_size, call_budget=call_budget)
+        symbols = plan.symbols
+        self._last_poll_seconds = plan.next_poll_seconds
+
+        scheduler.record_execution_start()
+
+        if cycle_number % 3 == 1:
+            log_provider_activity(
+                db_session=db,
+                provider_id="system",
+                activity_type="HEALTH_CHECK",
+                description="System health check completed",
+                status="success",
+                metadata={
+                    "cycles_completed": self._cycles,
+                    "providers_available": len(providers),
+                    "system_status": "healthy"
+                }
+            )
+
+        async def fetch_batch(batch: List[str]) -> Dict[str, Optional[Dict]]:
+            # Concurrent jobs commit and roll back independently, so each gets its own session
+            job_db = SessionLocal()
+            try:
+                return await self._run_job(MarketDataService(job_db), batch, config)
+            finally:
+                job_db.close()
+
+        results = await get_universe_refresh_scheduler().refresh(
+            service,
+            symbols,
+            batch_size,
+            max_concurrency=config.max_concurrent_jobs,
+            fetch_batch=fetch_batch
+        )
+
+        symbols_fetched = [symbol for symbol in symbols if results.get(symbol) is not None]
+        failed_symbols = [symbol for symbol in symbols if results.get(symbol) is None]
+        response_time_ms = int((time.monotonic() - started_at) * 1000)
+
+        if symbols and not symbols_fetched:
+            scheduler.record_execution_failure(f"All {len(symbols)} symbols failed to fetch")
+        else:
+            scheduler.record_execution_success(
+                symbols_processed=len(symbols_fetched),
+                response_time_ms=response_time_ms,
+                failed_fetches=len(failed_symbols)
+            )
+
+        # Storing the prices already queued an update for every affected portfolio
+        planner.record_scheduled_fetches(symbols_fetched)
+
+        if symbols:
+            log_provider_activity(
+                db_session=db,
+                provider_id="system",
+                activity_type="BATCH_SUMMARY",
+                description=f"Batch update completed: {len(symbols_fetched)}/{len(symbols)} symbols updated",
+                status="success" if symbols_fetched else "warning",
+                metadata={
+                    "cycle_number": cycle_number,
+                    "symbols_processed": symbols,
+                    "success_count": len(symbols_fetched),
+                    "provider_bulk_limit": batch_size,
+                    "max_concurrent_jobs": config.max_concurrent_jobs,
+                    "sources": "portfolio_holdings_and_recent_requests"
+                }
+            )
+
+        self._cycles += 1
+        self._last_cycle_at = utc_now()
+        self._last_cycle_ms = round((time.monotonic() - started_at) * 1000, 2)
+
+        self.log_info(
+            "Fetch cycle completed",
+            cycle=cycle_number,
+            due=len(symbols),
+            fetched=len(symbols_fetched),
+            failed=len(failed_symbols),
+            deferred=plan.deferred,
+            duration_ms=self._last_cycle_ms
+        )
+
+        next_run = scheduler._next_run
+        return {
+            "status": "completed",
+            "symbols_processed": len(symbols_fetched),
+            "symbols_fetched": symbols_fetched,
+            "failed_symbols": failed_symbols,
+            "deferred": plan.deferred,
+            "run_time": self._last_cycle_at.isoformat(),
+            "next_run": next_run.isoformat() if next_run else None,
+            "next_poll_seconds": plan.next_poll_seconds
+        }
+
+    async def _run_job(self, service: MarketDataService, batch: List[str], config) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch one batch, retrying failed symbols and timeouts with exponential backoff.
+
+        MarketDataService reports provider failures as missing or None prices
+        rather than raising, so each retry refetches only the symbols without
+        a price yet.
+
+        Returns:
+            Price data for every symbol in the batch, None for symbols that
+            still failed after retry_attempts retries
+
+        Raises:
+            Exception: The last error if every attempt raised or timed out
+        """
+        attempts = 1 + max(0, config.retry_attempts)
+        results: Dict[str, Optional[Dict]] = {}
+        pending = list(batch)
+        last_error: Optional[BaseException] = None
+
+        for attempt in range(attempts):
+            if attempt:
+                self._retries += 1
+                delay = min(self.max_backoff_seconds, self.retry_backoff_seconds * 2 ** (attempt - 1))
+                self.log_info("Retrying fetch job", attempt=attempt + 1, batch_size=len(pending), delay_seconds=delay)
+                await asyncio.sleep(delay)
+
+            self._jobs_run += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            try:
+                fetched = await asyncio.wait_for(service.fetch_multiple_prices(pending), timeout=config.timeout_seconds)
+            except asyncio.TimeoutError as e:
+                self._timeouts += 1
+                last_error = e
+                self.log_warning("Fetch job timed out", batch_size=len(pending), timeout_seconds=config.timeout_seconds)
+                continue
+            except Exception as e:
+                last_error = e
+                self.log_warning("Fetch job failed", batch_size=len(pending), error=str(e))
+                continue
+            finally:
+                self._in_flight -= 1
+
+            last_error = None
+            results.update({symbol: data for symbol, data in (fetched or {}).items() if data is not None})
+            pending = [symbol for symbol in pending if results.get(symbol) is None]
+            if not pending:
+                return results
+            self.log_warning("Fetch job returned no price for some symbols", failed=len(pending), batch_size=len(batch))
+
+        self._jobs_failed += 1
+        if last_error is not None and not results:
+            raise last_error
+        results.update({symbol: None for symbol in pending})
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics for monitoring."""
+        return {
+            "running": self.is_running,
+            "paused": self._paused,
+            "cycle_in_flight": self._cycle_task is not None and not self._cycle_task.done(),
+            "cycles": self._cycles,
+            "coalesced_runs": self._coalesced_runs,
+            "jobs_run": self._jobs_run,
+            "jobs_failed": self._jobs_failed,
+            "retries": self._retries,
+            "timeouts": self._timeouts,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "last_cycle_at": self._last_cycle_at,
+            "last_cycle_ms": self._last_cycle_ms
+        }
+
+
+# Global instance for the application
+_scheduler_engine: Optional[SchedulerEngine] = None
+
+
+def get_scheduler_engine() -> SchedulerEngine:
+    """Get the global scheduler engine instance."""
+    global _scheduler_engine
+    if _scheduler_engine is None:
+        _scheduler_engine = SchedulerEngine()
+    return _scheduler_engine
+
+
+async def shutdown_scheduler_engine() -> None:
+    """Stop the global scheduler engine."""
+    global _scheduler_engine
+    if _scheduler_engine is not None:
+        await _scheduler_engine.stop()
+        _scheduler_engine = None
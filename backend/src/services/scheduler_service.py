@@ -16,7 +16,7 @@ from src.utils.datetime_utils import utc_now
 from src.models.scheduler_execution import SchedulerExecution
 from src.models.holding import Holding
 from src.models.stock import Stock
-from src.services.market_data_service import MarketDataService
+from src.services.scheduler_engine import get_scheduler_engine
 
 logger = get_logger(__name__)
 
@@ -399,13 +399,19 @@ class MarketDataSchedulerService:
             self.db.commit()
             logger.debug("Scheduler execution started")
 
-    def record_execution_success(self, symbols_processed: int = 0, response_time_ms: Optional[int] = None) -> None:
+    def record_execution_success(
+        self,
+        symbols_processed: int = 0,
+        response_time_ms: Optional[int] = None,
+        failed_fetches: int = 0
+    ) -> None:
         """
         Record a successful scheduler execution.
 
         Args:
             symbols_processed: Number of symbols successfully processed
             response_time_ms: Response time in milliseconds
+            failed_fetches: Number of symbols that could not be fetched
         """
         if self._state == SchedulerState.RUNNING:
             completion_time = utc_now().replace(tzinfo=None)  # Store naive datetime
@@ -428,8 +434,8 @@ class MarketDataSchedulerService:
                 self._current_execution.completed_at = completion_time
                 self._current_execution.status = "success"
                 self._current_execution.symbols_processed = symbols_processed
-                self._current_execution.successful_fetches = symbols_processed  # Assume all successful for now
-                self._current_execution.failed_fetches = 0
+                self._current_execution.successful_fetches = symbols_processed
+                self._current_execution.failed_fetches = failed_fetches
                 if response_time_ms:
                     self._current_execution.execution_time_ms = response_time_ms
 
@@ -492,8 +498,9 @@ class MarketDataSchedulerService:
         """
         Execute actual market data fetching for all portfolio holdings.
 
-        This method integrates with MarketDataService to fetch real data
-        and updates scheduler metrics accordingly.
+        The fetch runs on the shared scheduler engine, so it honours
+        max_concurrent_jobs, timeout_seconds and retry_attempts, and joins a
+        cycle that is already in flight instead of starting a second one.
 
         Returns:
             Dictionary with execution results including symbols processed
@@ -501,115 +508,23 @@ class MarketDataSchedulerService:
         if self._state != SchedulerState.RUNNING:
             return {"error": f"Scheduler not running (state: {self._state})"}
 
-        execution_start_time = utc_now().replace(tzinfo=None)
-        symbols_processed = 0
-        symbols_fetched = []
-        failed_symbols = []
-
         try:
-            # Start database execution record
-            execution = SchedulerExecution(
-                started_at=execution_start_time,
-                status="running",
-                symbols_processed=0,
-                successful_fetches=0,
-                failed_fetches=0
-            )
-            self.db.add(execution)
-            self.db.commit()
-            self._current_execution = execution
-
-            # Use actively monitored symbols (includes both portfolio holdings and recent price requests)
-            market_service = MarketDataService(self.db)
-            symbols_to_fetch = market_service.get_actively_monitored_symbols(
-                provider_bulk_limit=50,  # Allow more symbols for bulk operations
-                minutes_lookback=60      # Consider symbols requested in last hour
-            )
-            logger.info(f"Scheduler executing market data fetch for {len(symbols_to_fetch)} actively monitored symbols: {symbols_to_fetch}")
-
-            if not symbols_to_fetch:
-                logger.warning("No portfolio holdings found - no symbols to fetch")
-                execution.completed_at = utc_now().replace(tzinfo=None)
-                execution.status = "completed"
-                execution.symbols_processed = 0
-                self.db.commit()
-                return {
-                    "status": "completed",
-                    "symbols_processed": 0,
-                    "symbols_fetched": [],
-                    "message": "No symbols to fetch"
-                }
-
-            # Market data service already initialized above for symbol fetching
-
-            try:
-                # Use bulk fetch for optimal API calls - provider adapters handle bulk vs single
-                logger.info(f"Using bulk fetch for optimal provider API usage")
-                bulk_results = await market_service.fetch_multiple_prices(symbols_to_fetch)
-
-                # Process bulk results
-                for symbol in symbols_to_fetch:
-                    if symbol in bulk_results and bulk_results[symbol]:
-                        price_data = bulk_results[symbol]
-                        symbols_fetched.append(symbol)
-                        symbols_processed += 1
-                        logger.info(f"Successfully fetched data for {symbol}: ${price_data.get('price', 'N/A')}")
-                    else:
-                        failed_symbols.append(symbol)
-                        logger.warning(f"No data returned for symbol {symbol}")
-
-            finally:
-                # Always close the market data service session
-                await market_service.close_session()
-
-            # Update execution record
-            execution.completed_at = utc_now().replace(tzinfo=None)
-            execution.status = "success" if symbols_processed > 0 else "partial"
-            execution.symbols_processed = symbols_processed
-            execution.successful_fetches = len(symbols_fetched)
-            execution.failed_fetches = len(failed_symbols)
-            self.db.commit()
-
-            # Update in-memory metrics
-            self._last_run = execution.completed_at
-            self._total_executions += 1
-            self._successful_executions += 1
-            self._total_symbols_processed += symbols_processed
-            self._calculate_next_run()
-
-            logger.info(f"Market data fetch completed: {symbols_processed} symbols processed, {len(failed_symbols)} failed")
-
-            return {
-                "status": "completed",
-                "symbols_processed": symbols_processed,
-                "symbols_fetched": symbols_fetched,
-                "failed_symbols": failed_symbols,
-                "run_time": execution.completed_at.isoformat(),
-                "next_run": self._next_run.isoformat() if self._next_run else None
-            }
+            return await get_scheduler_engine().run_now(self)
 
         except Exception as e:
-            # Handle execution failure
             logger.error(f"Market data fetch execution failed: {e}")
-
-            if execution:
-                execution.completed_at = utc_now().replace(tzinfo=None)
-                execution.status = "failed"
-                execution.symbols_processed = symbols_processed
-                execution.successful_fetches = len(symbols_fetched)
-                execution.failed_fetches = len(failed_symbols)
-                self.db.commit()
-
-            # Update failure metrics
-            self._total_executions += 1
-            self._failed_executions += 1
-            self._error_message = str(e)
+            if self._current_execution is not None:
+                self.record_execution_failure(str(e))
+            else:
+                self._total_executions += 1
+                self._failed_executions += 1
+                self._error_message = str(e)
 
             return {
                 "status": "failed",
                 "error": str(e),
-                "symbols_processed": symbols_processed,
-                "symbols_fetched": symbols_fetched
+                "symbols_processed": 0,
+                "symbols_fetched": []
             }
 
 
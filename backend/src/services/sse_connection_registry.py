@@ -0,0 +1,368 @@
+"""
+In-memory registry of open SSE connections with batched persistence.
+
+Each stream used to query and commit its sse_connections row on every
+heartbeat just to refresh last_heartbeat and check is_active, so a thousand
+open dashboards cost about two thousand writes a minute. Connections are now
+tracked in memory: heartbeats, messages sent and subscriptions are updated in
+place, changed connections are written to sse_connections in one batch per
+flush interval, and admins disconnect a stream by waking it directly instead
+of flipping a flag the stream has to poll for.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.core.logging import LoggerMixin
+from src.models.sse_connection import SSEConnection
+from src.utils.datetime_utils import now
+
+
+@dataclass(slots=True)
+class SSEConnectionState:
+    """Live state of one open SSE connection."""
+    connection_id: str
+    user_id: uuid.UUID
+    engine: Engine  # Database the connection row is written to
+    subscribed_symbols: List[str] = field(default_factory=list)
+    portfolio_ids: List[str] = field(default_factory=list)
+    connection_type: str = "market_data"
+    client_ip: Optional[str] = None
+    user_agent: Optional[str] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    connected_at: datetime = field(default_factory=now)
+    last_heartbeat: Optional[datetime] = None
+    messages_sent: int = 0
+    is_active: bool = True
+    disconnected_at: Optional[datetime] = None
+    persisted: bool = False  # Whether the row has been inserted
+    dirty: bool = True  # Whether the row differs from the database
+    on_disconnect: Optional[Callable[[], None]] = None
+
+    def to_row(self) -> Dict:
+        """Column values for the sse_connections row."""
+        return {
+            "id": self.id,
+            "connection_id": self.connection_id,
+            "user_id": self.user_id,
+            "client_ip": self.client_ip,
+            "user_agent": self.user_agent,
+            "subscribed_symbols": self.subscribed_symbols,
+            "portfolio_ids": self.portfolio_ids,
+            "connection_type": self.connection_type,
+            "is_active": self.is_active,
+            "last_heartbeat": self.last_heartbeat,
+            "messages_sent": self.messages_sent,
+            "connected_at": self.connected_at,
+            "disconnected_at": self.disconnected_at,
+            "created_at": self.connected_at
+        }
+
+
+class SSEConnectionRegistry(LoggerMixin):
+    """
+    Tracks open SSE connections in memory and writes them in batches.
+
+    Features:
+    - No per-heartbeat I/O: heartbeats and message counts update memory only
+    - Batched persistence: new connections are inserted and changed ones
+      updated with one executemany statement each per database per flush
+    - Admin disconnects: the stream is woken immediately through its callback
+    - Closed connections are forgotten once their final state is written
+    """
+
+    def __init__(self, flush_interval_seconds: float = 30.0):
+        """
+        Initialize the registry.
+
+        Args:
+            flush_interval_seconds: How often changed connections are written
+        """
+        self.flush_interval_seconds = flush_interval_seconds
+
+        self._connections: Dict[str, SSEConnectionState] = {}
+        self._lock = Lock()
+        self._flush_lock = Lock()
+
+        # Background flushing
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Counters
+        self._opened = 0
+        self._closed = 0
+        self._admin_disconnects = 0
+        self._rows_written = 0
+        self._failed = 0
+        self._flushes = 0
+        self._last_flush_at: Optional[datetime] = None
+        self._last_flush_ms: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flush task is active."""
+        return self._flush_task is not None and not self._flush_task.done()
+
+    async def start(self):
+        """Start the background flush task."""
+        if not self.is_running:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+            self.log_info("SSE connection registry started")
+
+    async def stop(self):
+        """Stop the background flush task, closing and writing every connection."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+
+        with self._lock:
+            open_ids = [cid for cid, state in self._connections.items() if state.is_active]
+        for connection_id in open_ids:
+            self.unregister(connection_id)
+
+        written = self.flush()
+        self.log_info("SSE connection registry stopped", flushed_on_shutdown=written)
+
+    def register(
+        self,
+        bind: Engine,
+        connection_id: str,
+        user_id: uuid.UUID,
+        subscribed_symbols: Optional[List[str]] = None,
+        portfolio_ids: Optional[List[str]] = None,
+        connection_type: str = "market_data",
+        client_ip: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        on_disconnect: Optional[Callable[[], None]] = None
+    ) -> SSEConnectionState:
+        """
+        Track a newly opened connection; its row is inserted on the next flush.
+
+        Args:
+            bind: Engine of the database the row is written to
+            connection_id: Unique connection identifier
+            user_id: Owner of the connection
+            subscribed_symbols: Symbols the client subscribed to
+            portfolio_ids: Portfolios the client subscribed to
+            connection_type: Stream type ('market_data', 'portfolio', ...)
+            client_ip: Client address
+            user_agent: Client user agent
+            on_disconnect: Called when an admin disconnects the connection
+
+        Returns:
+            The live connection state
+        """
+        state = SSEConnectionState(
+            connection_id=connection_id,
+            user_id=user_id,
+            engine=bind,
+            subscribed_symbols=list(subscribed_symbols or []),
+            portfolio_ids=list(portfolio_ids or []),
+            connection_type=connection_type,
+            client_ip=client_ip,
+            user_agent=user_agent,
+            on_disconnect=on_disconnect
+        )
+        state.last_heartbeat = state.connected_at
+
+        with self._lock:
+            self._connections[connection_id] = state
+            self._opened += 1
+        return state
+
+    def heartbeat(self, connection_id: str) -> bool:
+        """
+        Record a heartbeat.
+
+        Returns:
+            False if the connection is unknown or no longer active
+        """
+        with self._lock:
+            state = self._connections.get(connection_id)
+            if state is None or not state.is_active:
+                return False
+            state.last_heartbeat = now()
+            state.dirty = True
+            return True
+
+    def record_sent(self, connection_id: str, count: int = 1) -> None:
+        """Count messages sent on a connection."""
+        with self._lock:
+            state = self._connections.get(connection_id)
+            if state is not None:
+                state.messages_sent += count
+                state.dirty = True
+
+    def is_active(self, connection_id: str) -> bool:
+        """Whether the connection is open and not disconnected by an admin."""
+        with self._lock:
+            state = self._connections.get(connection_id)
+            return state is not None and state.is_active
+
+    def unregister(self, connection_id: str) -> None:
+        """Mark a connection closed; its final state is written on the next flush."""
+        with self._lock:
+            state = self._connections.get(connection_id)
+            if state is None or state.disconnected_at is not None:
+                return
+            state.is_active = False
+            state.disconnected_at = now()
+            state.dirty = True
+            self._closed += 1
+
+    def disconnect(self, connection_id: str) -> bool:
+        """
+        Disconnect a connection on behalf of an admin.
+
+        Returns:
+            False if the connection is unknown or already closed
+        """
+        with self._lock:
+            state = self._connections.get(connection_id)
+            if state is None or not state.is_active:
+                return False
+            state.is_active = False
+            state.dirty = True
+            self._admin_disconnects += 1
+            callback = state.on_disconnect
+
+        if callback is not None:
+            try:
+                callback()
+            except Exception as e:
+                self.log_error("Error waking disconnected SSE stream", connection_id=connection_id, error=str(e))
+        self.log_info("SSE connection disconnected by admin", connection_id=connection_id)
+        return True
+
+    def get_connections(self, active_only: bool = True) -> List[SSEConnectionState]:
+        """Get tracked connections, oldest first."""
+        with self._lock:
+            states = [
+                state for state in self._connections.values()
+                if state.is_active or not active_only
+            ]
+        return sorted(states, key=lambda state: state.connected_at)
+
+    def flush(self) -> int:
+        """
+        Write every changed connection, batched per database.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                changed = [(state, state.to_row()) for state in self._connections.values() if state.dirty]
+                for state, _ in changed:
+                    state.dirty = False
+
+            if not changed:
+                return 0
+
+            start = time.monotonic()
+            by_engine: Dict[Engine, List] = defaultdict(list)
+            for state, row in changed:
+                by_engine[state.engine].append((state, row))
+
+            written = 0
+            for engine, entries in by_engine.items():
+                new_rows = [row for state, row in entries if not state.persisted]
+                changed_rows = [row for state, row in entries if state.persisted]
+                try:
+                    with Session(bind=engine) as session:
+                        if new_rows:
+                            session.execute(insert(SSEConnection), new_rows)
+                        if changed_rows:
+                            session.execute(update(SSEConnection), changed_rows)
+                        session.commit()
+                    for state, _ in entries:
+                        state.persisted = True
+                    written += len(entries)
+                except Exception as e:
+                    self._failed += len(entries)
+                    with self._lock:
+                        for state, _ in entries:
+                            state.dirty = True
+                    self.log_error("Failed to write SSE connections", rows=len(entries), error=str(e))
+
+            with self._lock:
+                # Closed connections are no longer needed once their final state is stored
+                for state, _ in changed:
+                    if state.disconnected_at is not None and state.persisted and not state.dirty:
+                        self._connections.pop(state.connection_id, None)
+
+            self._rows_written += written
+            self._flushes += 1
+            self._last_flush_at = now()
+            self._last_flush_ms = round((time.monotonic() - start) * 1000, 2)
+            return written
+
+    def clear(self) -> None:
+        """Forget every connection without writing (for testing)."""
+        with self._lock:
+            self._connections.clear()
+
+    def get_stats(self) -> Dict:
+        """Get registry statistics for monitoring."""
+        with self._lock:
+            active = sum(1 for state in self._connections.values() if state.is_active)
+            pending_writes = sum(1 for state in self._connections.values() if state.dirty)
+
+        return {
+            "is_running": self.is_running,
+            "active": active,
+            "pending_writes": pending_writes,
+            "opened": self._opened,
+            "closed": self._closed,
+            "admin_disconnects": self._admin_disconnects,
+            "rows_written": self._rows_written,
+            "failed": self._failed,
+            "flushes": self._flushes,
+            "last_flush_at": self._last_flush_at,
+            "last_flush_ms": self._last_flush_ms
+        }
+
+    async def _flush_periodically(self):
+        """Write changed connections every flush interval."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                self.log_error("Error flushing SSE connection registry", error=str(e))
+
+
+# Global instance for the application
+_sse_connection_registry: Optional[SSEConnectionRegistry] = None
+
+
+def get_sse_connection_registry() -> SSEConnectionRegistry:
+    """Get the global SSE connection registry instance."""
+    global _sse_connection_registry
+    if _sse_connection_registry is None:
+        _sse_connection_registry = SSEConnectionRegistry()
+    return _sse_connection_registry
+
+
+async def initialize_sse_connection_registry():
+    """Start background flushing for the global SSE connection registry."""
+    await get_sse_connection_registry().start()
+
+
+async def shutdown_sse_connection_registry():
+    """Stop the global SSE connection registry, writing every connection's final state."""
+    if _sse_connection_registry is not None:
+        await _sse_connection_registry.stop()
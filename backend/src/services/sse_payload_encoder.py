@@ -0,0 +1,149 @@
+"""
+Per-connection encoding of SSE price payloads.
+
+The market data stream sent every subscribed symbol's full price dict with
+every update, whether or not anything changed. An encoder tracks what its
+connection was last sent and, in delta mode, emits only the fields that
+changed, with a full snapshot every full_snapshot_seconds so clients can
+resynchronise. Compact mode uses short keys, prices as scaled integers,
+epoch-second timestamps and JSON without whitespace.
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import TYPE_CHECKING, Dict, Optional
+
+from src.utils.datetime_utils import to_iso_string
+
+if TYPE_CHECKING:
+    from src.services.price_snapshot_service import PriceSnapshot
+
+# Compact prices are sent as integers in units of 1 / PRICE_SCALE
+PRICE_SCALE = 10000
+
+# Resynchronise delta streams with a full snapshot this often
+DEFAULT_FULL_SNAPSHOT_SECONDS = 300.0
+
+# Short keys used by the compact encoding
+COMPACT_KEYS = {"price": "p", "volume": "v", "fetched_at": "t"}
+
+
+def _epoch_seconds(value: datetime) -> int:
+    """Seconds since the epoch; naive datetimes are UTC as stored in the database."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+class PriceStreamEncoder:
+    """
+    Encodes price updates for one SSE connection.
+
+    Modes:
+    - full (default): every update carries price, volume and fetched_at
+    - delta: only fields that differ from what the connection was last sent,
+      with a full snapshot of every known symbol every full_snapshot_seconds
+    - compact: short keys, integer prices and epoch timestamps; combines
+      with either of the above
+    """
+
+    def __init__(
+        self,
+        delta: bool = False,
+        compact: bool = False,
+        full_snapshot_seconds: float = DEFAULT_FULL_SNAPSHOT_SECONDS
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            delta: Send only changed fields
+            compact: Use the compact encoding
+            full_snapshot_seconds: Interval between full snapshots in delta mode
+        """
+        self.delta = delta
+        self.compact = compact
+        self.full_snapshot_seconds = full_snapshot_seconds
+
+        self._sent: Dict[str, Dict] = {}  # symbol -> fields last sent
+        self._last_full_snapshot = time.monotonic()
+
+    def describe(self) -> Dict:
+        """Format description sent in the connection event so clients can decode updates."""
+        description = {"delta": self.delta, "compact": self.compact}
+        if self.compact:
+            description["price_scale"] = PRICE_SCALE
+            description["keys"] = {short: name for name, short in COMPACT_KEYS.items()}
+        if self.delta:
+            description["full_snapshot_seconds"] = self.full_snapshot_seconds
+        return description
+
+    def dumps(self, event: Dict) -> str:
+        """Serialize an event as an SSE data line."""
+        if self.compact:
+            return f"data: {json.dumps(event, separators=(',', ':'))}\n\n"
+        return f"data: {json.dumps(event)}\n\n"
+
+    def encode_prices(self, snapshots: Dict[str, "PriceSnapshot"]) -> Optional[str]:
+        """
+        Encode a price_update event for the given snapshots.
+
+        Returns:
+            SSE data line, or None if nothing changed since the last send
+        """
+        data = {}
+        for symbol, snapshot in snapshots.items():
+            fields = self._fields(snapshot)
+            previous = self._sent.get(symbol)
+            self._sent[symbol] = fields
+
+            if not self.delta or previous is None:
+                data[symbol] = fields
+                continue
+
+            changed = {key: value for key, value in fields.items() if previous.get(key) != value}
+            if changed:
+                data[symbol] = changed
+
+        if not data:
+            return None
+
+        event = {"type": "price_update", "data": data}
+        if self.delta:
+            event["delta"] = True
+        return self.dumps(event)
+
+    def full_snapshot_due(self) -> bool:
+        """Whether a delta stream should send a full snapshot now."""
+        return self.delta and bool(self._sent) and (
+            time.monotonic() - self._last_full_snapshot >= self.full_snapshot_seconds
+        )
+
+    def encode_full_snapshot(self) -> Optional[str]:
+        """
+        Encode every symbol's last sent fields as a full price_update event.
+
+        Returns:
+            SSE data line, or None if nothing has been sent yet
+        """
+        self._last_full_snapshot = time.monotonic()
+        if not self._sent:
+            return None
+        return self.dumps({"type": "price_update", "data": dict(self._sent), "full": True})
+
+    def _fields(self, snapshot: "PriceSnapshot") -> Dict:
+        """Price fields for one snapshot in this encoder's encoding."""
+        if self.compact:
+            price = int((Decimal(snapshot.price) * PRICE_SCALE).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+            return {
+                COMPACT_KEYS["price"]: price,
+                COMPACT_KEYS["volume"]: snapshot.volume,
+                COMPACT_KEYS["fetched_at"]: _epoch_seconds(snapshot.last_updated) if snapshot.last_updated else None
+            }
+        return {
+            "price": float(snapshot.price),
+            "volume": snapshot.volume,
+            "fetched_at": to_iso_string(snapshot.last_updated)
+        }
@@ -0,0 +1,174 @@
+"""
+In-memory reverse index from stock symbols to the portfolios that hold them.
+
+Used to find the portfolio update fan-out after a price fetch with a dictionary
+lookup instead of a holdings/stocks/portfolios join per symbol. The index is
+built at startup and refreshed per portfolio whenever a transaction changes its
+holdings.
+"""
+
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from src.core.logging import LoggerMixin
+from src.models import Holding, Portfolio, Stock
+
+
+class SymbolPortfolioIndex(LoggerMixin):
+    """
+    Thread-safe symbol -> active portfolio ID index.
+
+    Only active portfolios with a positive holding quantity are indexed, which
+    matches the portfolios that need revaluing when a symbol's price changes.
+    """
+
+    def __init__(self):
+        self._symbol_portfolios: Dict[str, Set[str]] = defaultdict(set)
+        self._portfolio_symbols: Dict[str, Set[str]] = {}
+        self._lock = Lock()
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been loaded from the database."""
+        return self._built
+
+    def build(self, db: Session) -> None:
+        """
+        Load the full index from the database with a single query.
+
+        Args:
+            db: Database session
+        """
+        rows = db.query(Stock.symbol, Holding.portfolio_id).join(
+            Holding, Holding.stock_id == Stock.id
+        ).join(
+            Portfolio, Portfolio.id == Holding.portfolio_id
+        ).filter(
+            Holding.quantity > 0,
+            Portfolio.is_active.is_(True)
+        ).all()
+
+        symbol_portfolios: Dict[str, Set[str]] = defaultdict(set)
+        portfolio_symbols: Dict[str, Set[str]] = defaultdict(set)
+        for symbol, portfolio_id in rows:
+            symbol_portfolios[symbol].add(str(portfolio_id))
+            portfolio_symbols[str(portfolio_id)].add(symbol)
+
+        with self._lock:
+            self._symbol_portfolios = symbol_portfolios
+            self._portfolio_symbols = dict(portfolio_symbols)
+            self._built = True
+
+        self.log_info(
+            "Symbol portfolio index built",
+            symbols=len(symbol_portfolios),
+            portfolios=len(portfolio_symbols)
+        )
+
+    def ensure_built(self, db: Session) -> None:
+        """Build the index from the given session if it has not been loaded yet."""
+        if not self._built:
+            self.build(db)
+
+    def refresh_portfolio(self, db: Session, portfolio_id) -> None:
+        """
+        Re-read one portfolio's held symbols after its holdings changed.
+
+        Does nothing until the index has been built, since the full build will
+        pick up the change anyway.
+
+        Args:
+            db: Database session
+            portfolio_id: Portfolio whose holdings changed
+        """
+        if not self._built:
+            return
+
+        rows = db.query(Stock.symbol).join(
+            Holding, Holding.stock_id == Stock.id
+        ).join(
+            Portfolio, Portfolio.id == Holding.portfolio_id
+        ).filter(
+            Holding.portfolio_id == portfolio_id,
+            Holding.quantity > 0,
+            Portfolio.is_active.is_(True)
+        ).all()
+
+        self._set_portfolio_symbols(str(portfolio_id), {row.symbol for row in rows})
+
+    def remove_portfolio(self, portfolio_id) -> None:
+        """Drop a deleted or deactivated portfolio from the index."""
+        self._set_portfolio_symbols(str(portfolio_id), set())
+
+    def get_portfolios_for_symbol(self, symbol: str) -> Set[str]:
+        """Get the IDs of active portfolios holding the given symbol."""
+        with self._lock:
+            return set(self._symbol_portfolios.get(symbol, ()))
+
+    def get_portfolio_symbols(self, symbols: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the update fan-out for a set of changed symbols.
+
+        Args:
+            symbols: Symbols whose prices changed
+
+        Returns:
+            Dictionary mapping each affected portfolio ID to the changed
+            symbols it holds, in the order the symbols were given
+        """
+        fan_out: Dict[str, List[str]] = defaultdict(list)
+        with self._lock:
+            for symbol in dict.fromkeys(symbols):
+                for portfolio_id in self._symbol_portfolios.get(symbol, ()):
+                    fan_out[portfolio_id].append(symbol)
+        return dict(fan_out)
+
+    def get_stats(self) -> Dict:
+        """Get index size statistics for monitoring."""
+        with self._lock:
+            return {
+                "is_built": self._built,
+                "symbols": len(self._symbol_portfolios),
+                "portfolios": len(self._portfolio_symbols)
+            }
+
+    def clear(self) -> None:
+        """Drop all entries; the index is rebuilt on next use."""
+        with self._lock:
+            self._symbol_portfolios = defaultdict(set)
+            self._portfolio_symbols = {}
+            self._built = False
+
+    def _set_portfolio_symbols(self, portfolio_id: str, symbols: Set[str]) -> None:
+        """Replace the indexed symbols for one portfolio."""
+        with self._lock:
+            previous = self._portfolio_symbols.pop(portfolio_id, set())
+
+            for symbol in previous - symbols:
+                holders = self._symbol_portfolios.get(symbol)
+                if holders is not None:
+                    holders.discard(portfolio_id)
+                    if not holders:
+                        del self._symbol_portfolios[symbol]
+
+            for symbol in symbols:
+                self._symbol_portfolios[symbol].add(portfolio_id)
+
+            if symbols:
+                self._portfolio_symbols[portfolio_id] = set(symbols)
+
+
+# Global instance for the application
+_symbol_portfolio_index: Optional[SymbolPortfolioIndex] = None
+
+
+def get_symbol_portfolio_index() -> SymbolPortfolioIndex:
+    """Get the global symbol portfolio index instance."""
+    global _symbol_portfolio_index
+    if _symbol_portfolio_index is None:
+        _symbol_portfolio_index = SymbolPortfolioIndex()
+    return _symbol_portfolio_index
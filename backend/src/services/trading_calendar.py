@@ -0,0 +1,320 @@
+"""
+Exchange trading calendar for ASX and US equity markets.
+
+Prices cannot change while an exchange is closed, so fetching and revaluing
+around the clock wastes provider quota and CPU. The calendar knows each
+exchange's regular session, timezone and holidays, and answers whether a
+symbol's market is open, when it last closed and when it next opens.
+
+Holidays are computed from rules (fixed dates with weekend observance,
+nth-weekday holidays and Easter), so no calendar data needs maintaining.
+Early closes (e.g. Christmas Eve) are treated as full sessions.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from src.core.logging import LoggerMixin
+
+# How many days to search for the next/previous session (covers long holiday runs)
+_MAX_SEARCH_DAYS = 14
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeSession:
+    """Regular trading session of one exchange."""
+    code: str
+    timezone: str
+    open_time: time
+    # Includes the closing auction and a few minutes for final prices to publish
+    close_time: time
+    holidays: Callable[[int], FrozenSet[date]]
+
+    @property
+    def tz(self) -> ZoneInfo:
+        return ZoneInfo(self.timezone)
+
+    def is_trading_day(self, day: date) -> bool:
+        """Whether the exchange trades on a local calendar date."""
+        return day.weekday() < 5 and day not in self.holidays(day.year)
+
+    def session_bounds(self, day: date) -> Tuple[datetime, datetime]:
+        """Open and close of the session on a local date, in UTC."""
+        tz = self.tz
+        opens = datetime.combine(day, self.open_time, tzinfo=tz).astimezone(timezone.utc)
+        closes = datetime.combine(day, self.close_time, tzinfo=tz).astimezone(timezone.utc)
+        return opens, closes
+
+
+def _easter_sunday(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The nth given weekday of a month (n=-1 for the last one)."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = (date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observe_next_weekday(days: Iterable[date]) -> set:
+    """Move weekend holidays to the next weekday that is not already a holiday."""
+    observed = set()
+    for day in days:
+        while day.weekday() >= 5 or day in observed:
+            day += timedelta(days=1)
+        observed.add(day)
+    return observed
+
+
+def _observe_nearest_weekday(day: date) -> date:
+    """US rule: Saturday holidays are observed Friday, Sunday holidays Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=32)
+def asx_holidays(year: int) -> FrozenSet[date]:
+    """ASX market holidays for a year."""
+    easter = _easter_sunday(year)
+    holidays = _observe_next_weekday([date(year, 1, 1)])
+    holidays |= _observe_next_weekday([date(year, 1, 26)])
+    holidays |= _observe_next_weekday([date(year, 12, 25), date(year, 12, 26)])
+    holidays |= {
+        easter - timedelta(days=2),  # Good Friday
+        easter + timedelta(days=1),  # Easter Monday
+        date(year, 4, 25),  # Anzac Day (not moved when on a weekend)
+        _nth_weekday(year, 6, 0, 2),  # King's Birthday
+    }
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=32)
+def us_holidays(year: int) -> FrozenSet[date]:
+    """NYSE/NASDAQ market holidays for a year."""
+    easter = _easter_sunday(year)
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        easter - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observe_nearest_weekday(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observe_nearest_weekday(date(year, 12, 25)),  # Christmas
+    }
+    if year >= 2022:
+        holidays.add(_observe_nearest_weekday(date(year, 6, 19)))  # Juneteenth
+
+    # New Year's Day on a Saturday is not observed on the previous Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observe_nearest_weekday(new_year))
+
+    return frozenset(holidays)
+
+
+_US_SESSION = dict(timezone="America/New_York", open_time=time(9, 30), close_time=time(16, 10), holidays=us_holidays)
+
+EXCHANGE_SESSIONS: Dict[str, ExchangeSession] = {
+    "ASX": ExchangeSession(
+        code="ASX",
+        timezone="Australia/Sydney",
+        open_time=time(10, 0),
+        close_time=time(16, 20),
+        holidays=asx_holidays
+    ),
+    "NYSE": ExchangeSession(code="NYSE", **_US_SESSION),
+    "NASDAQ": ExchangeSession(code="NASDAQ", **_US_SESSION),
+}
+
+# Common ASX symbols that we know about
+KNOWN_ASX_SYMBOLS = frozenset({
+    'CBA', 'ANZ', 'WBC', 'NAB',  # Big 4 banks
+    'BHP', 'RIO', 'FMG',         # Mining
+    'CSL', 'COH', 'PME',         # Healthcare
+    'WOW', 'COL', 'JBH',         # Retail
+    'TCL', 'TLS', 'SGP',         # Telco/Property
+    'MQG', 'SUN', 'QBE',         # Finance/Insurance
+    'REA', 'CAR', 'SEK',         # Tech/Services
+    'GMG', 'WES', 'ALL',         # Industrials
+    'APT', 'XRO', 'WTC',         # Fintech
+    'A2M', 'BAP', 'IFL'          # Other
+})
+
+# Common US symbols that the 3-letter ASX heuristic would misclassify
+KNOWN_US_SYMBOLS = frozenset({'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX', 'AMD', 'INTC'})
+
+
+def is_asx_symbol(symbol: str) -> bool:
+    """Check if symbol appears to be an ASX stock (basic heuristic)."""
+    if symbol in KNOWN_ASX_SYMBOLS:
+        return True
+
+    if symbol in KNOWN_US_SYMBOLS:
+        return False
+
+    # For unknown symbols, use basic heuristic but be more conservative
+    # ASX symbols are typically 3-4 letters, but so are many US symbols
+    # This is a fallback that may need refinement
+    return (len(symbol) == 3 and symbol.isalpha() and symbol.isupper())
+
+
+class TradingCalendar(LoggerMixin):
+    """
+    Answers market-hours questions for exchanges and symbols.
+
+    All methods accept an optional aware `at` datetime (default: now) and
+    return aware UTC datetimes.
+    """
+
+    def __init__(self, sessions: Optional[Dict[str, ExchangeSession]] = None):
+        """
+        Initialize the calendar.
+
+        Args:
+            sessions: Exchange sessions by code (defaults to ASX and US exchanges)
+        """
+        self.sessions = sessions or EXCHANGE_SESSIONS
+
+    def get_exchange_for_symbol(self, symbol: str) -> str:
+        """Get the exchange code a symbol trades on."""
+        if symbol.endswith(".AX") or is_asx_symbol(symbol):
+            return "ASX"
+        return "NASDAQ"
+
+    def is_open(self, exchange: str, at: Optional[datetime] = None) -> bool:
+        """Whether an exchange's regular session is in progress."""
+        session = self.sessions[exchange]
+        at = self._utc(at)
+        local_day = at.astimezone(session.tz).date()
+        if not session.is_trading_day(local_day):
+            return False
+        opens, closes = session.session_bounds(local_day)
+        return opens <= at < closes
+
+    def is_symbol_market_open(self, symbol: str, at: Optional[datetime] = None) -> bool:
+        """Whether the market for a symbol is open."""
+        return self.is_open(self.get_exchange_for_symbol(symbol), at)
+
+    def any_open(self, symbols: Iterable[str], at: Optional[datetime] = None) -> bool:
+        """Whether the market for at least one of the symbols is open."""
+        exchanges = {self.get_exchange_for_symbol(symbol) for symbol in symbols}
+        return any(self.is_open(exchange, at) for exchange in exchanges)
+
+    def last_close(self, exchange: str, at: Optional[datetime] = None) -> datetime:
+        """Most recent session close at or before `at`."""
+        session = self.sessions[exchange]
+        at = self._utc(at)
+        local_day = at.astimezone(session.tz).date()
+        for offset in range(_MAX_SEARCH_DAYS):
+            day = local_day - timedelta(days=offset)
+            if session.is_trading_day(day):
+                closes = session.session_bounds(day)[1]
+                if closes <= at:
+                    return closes
+        raise ValueError(f"No {exchange} session close within {_MAX_SEARCH_DAYS} days of {at}")
+
+    def next_open(self, exchange: str, at: Optional[datetime] = None) -> datetime:
+        """Next session open strictly after `at`."""
+        session = self.sessions[exchange]
+        at = self._utc(at)
+        local_day = at.astimezone(session.tz).date()
+        for offset in range(_MAX_SEARCH_DAYS):
+            day = local_day + timedelta(days=offset)
+            if session.is_trading_day(day):
+                opens = session.session_bounds(day)[0]
+                if opens > at:
+                    return opens
+        raise ValueError(f"No {exchange} session open within {_MAX_SEARCH_DAYS} days of {at}")
+
+    def seconds_until_next_open(self, symbols: Iterable[str], at: Optional[datetime] = None) -> float:
+        """Seconds until the first of the symbols' markets opens (0 if one is open)."""
+        at = self._utc(at)
+        exchanges = {self.get_exchange_for_symbol(symbol) for symbol in symbols}
+        if not exchanges:
+            return 0.0
+        if any(self.is_open(exchange, at) for exchange in exchanges):
+            return 0.0
+        return min((self.next_open(exchange, at) - at).total_seconds() for exchange in exchanges)
+
+    def needs_refresh(self, symbol: str, last_updated: Optional[datetime], at: Optional[datetime] = None) -> bool:
+        """
+        Whether a symbol's price can have changed since it was last fetched.
+
+        True while its market is open, or when the last fetch happened before
+        the most recent close (so the closing price has not been captured).
+
+        Args:
+            symbol: Stock symbol
+            last_updated: When the price was last fetched (naive values are UTC)
+            at: Time to evaluate at (default: now)
+        """
+        if last_updated is None:
+            return True
+        exchange = self.get_exchange_for_symbol(symbol)
+        if self.is_open(exchange, at):
+            return True
+        return self._utc(last_updated) < self.last_close(exchange, at)
+
+    def filter_needing_refresh(
+        self,
+        last_updated: Dict[str, Optional[datetime]],
+        at: Optional[datetime] = None
+    ) -> List[str]:
+        """Symbols (from a symbol -> last fetch time mapping) whose price can have changed."""
+        return [symbol for symbol, updated in last_updated.items() if self.needs_refresh(symbol, updated, at)]
+
+    def get_status(self, at: Optional[datetime] = None) -> Dict[str, Dict]:
+        """Open/closed state and next transition for every exchange."""
+        at = self._utc(at)
+        status = {}
+        for code in self.sessions:
+            is_open = self.is_open(code, at)
+            status[code] = {
+                "is_open": is_open,
+                "last_close": self.last_close(code, at),
+                "next_open": None if is_open else self.next_open(code, at),
+                "timezone": self.sessions[code].timezone
+            }
+        return status
+
+    @staticmethod
+    def _utc(at: Optional[datetime]) -> datetime:
+        if at is None:
+            return datetime.now(timezone.utc)
+        if at.tzinfo is None:
+            # Database timestamps are stored as naive UTC
+            return at.replace(tzinfo=timezone.utc)
+        return at.astimezone(timezone.utc)
+
+
+# Global instance for the application
+_trading_calendar: Optional[TradingCalendar] = None
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """Get the global trading calendar instance."""
+    global _trading_calendar
+    if _trading_calendar is None:
+        _trading_calendar = TradingCalendar()
+    return _trading_calendar
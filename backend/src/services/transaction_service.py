@@ -16,6 +16,7 @@ from src.models import Portfolio, Stock, Transaction, Holding
 from src.models.transaction import TransactionType, SourceType
 from src.schemas.transaction import TransactionCreate, TransactionResponse
 from src.services.audit_service import AuditService
+from src.services.symbol_portfolio_index import get_symbol_portfolio_index
 
 
 class TransactionService(LoggerMixin):
@@ -165,6 +166,9 @@ def process_transaction(
         # Commit all changes atomically
         db.commit()
 
+        # Keep the symbol -> portfolio fan-out index in step with the holdings
+        get_symbol_portfolio_index().refresh_portfolio(db, portfolio_id)
+
         # Final integrity check after commit
         if not integrity_service.ensure_data_consistency(portfolio_id):
             service.log_error("Portfolio integrity compromised after transaction")
@@ -418,6 +422,7 @@ def update_transaction(
         _update_portfolio_totals(db, portfolio_id)
 
         db.commit()
+        get_symbol_portfolio_index().refresh_portfolio(db, portfolio_id)
         db.refresh(transaction)
         
         service.log_info("Transaction updated successfully",
@@ -471,6 +476,7 @@ def delete_transaction(
         _update_portfolio_totals(db, portfolio_id)
 
         db.commit()
+        get_symbol_portfolio_index().refresh_portfolio(db, portfolio_id)
         
         service.log_info("Transaction deleted successfully",
                         transaction_id=str(transaction_id))
@@ -0,0 +1,194 @@
+"""
+Full-universe price refresh scheduling.
+
+The periodic refresh used to fetch only the first provider-sized batch of the
+alphabetically sorted monitored symbols, so anything past that batch was never
+refreshed. This scheduler splits the whole monitored universe into
+provider-sized batches each cycle, ordered stalest first, and tracks when each
+symbol was last refreshed so coverage can be monitored as the universe grows.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.core.logging import LoggerMixin
+from src.utils.datetime_utils import utc_now
+
+# Matches the 15 minute periodic refresh interval
+DEFAULT_STALE_AFTER_SECONDS = 900.0
+
+# Sort key for symbols that have never been refreshed
+_NEVER_REFRESHED = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class UniverseRefreshScheduler(LoggerMixin):
+    """
+    Rotates provider-sized batches through the whole monitored universe.
+
+    Features:
+    - Full coverage: every monitored symbol is in one of the cycle's batches
+    - Stalest first: never-refreshed and oldest symbols are fetched first, so a
+      cycle cut short by failures or rate limits resumes where it stopped
+    - Freshness tracking: last successful refresh time per symbol
+    - Failure isolation: a failed batch does not stop the remaining batches
+    - Bounded concurrency: up to max_concurrency batches are fetched at once
+    """
+
+    def __init__(self, stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS):
+        """
+        Initialize the refresh scheduler.
+
+        Args:
+            stale_after_seconds: Age after which a symbol counts as stale in stats
+        """
+        self.stale_after_seconds = stale_after_seconds
+
+        self._last_refreshed: Dict[str, datetime] = {}
+        self._universe: List[str] = []
+        self._lock = Lock()
+
+        # Counters
+        self._cycles = 0
+        self._batches_fetched = 0
+        self._batches_failed = 0
+        self._last_cycle_at: Optional[datetime] = None
+        self._last_cycle_ms: Optional[float] = None
+
+    def plan_batches(self, universe: List[str], batch_size: int) -> List[List[str]]:
+        """
+        Split the universe into batches, stalest symbols first.
+
+        Args:
+            universe: All symbols to refresh this cycle
+            batch_size: Maximum symbols per batch (provider bulk limit)
+
+        Returns:
+            List of symbol batches covering the whole universe
+        """
+        batch_size = max(1, batch_size)
+        with self._lock:
+            ordered = sorted(
+                dict.fromkeys(universe),
+                key=lambda symbol: (self._last_refreshed.get(symbol, _NEVER_REFRESHED), symbol)
+            )
+        return [ordered[i:i + batch_size] for i in range(0, len(ordered), batch_size)]
+
+    async def refresh(
+        self,
+        service,
+        universe: List[str],
+        batch_size: int,
+        max_concurrency: int = 1,
+        fetch_batch: Optional[Callable[[List[str]], Awaitable[Dict[str, Optional[Dict]]]]] = None
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Refresh every symbol in the universe in provider-sized batches.
+
+        Args:
+            service: MarketDataService used to fetch each batch (unused if fetch_batch is given)
+            universe: All symbols to refresh this cycle
+            batch_size: Maximum symbols per batch (provider bulk limit)
+            max_concurrency: Maximum batches fetched at the same time
+            fetch_batch: Coroutine function fetching one batch, replacing
+                service.fetch_multiple_prices (e.g. with timeouts and retries)
+
+        Returns:
+            Dictionary mapping every symbol to its price data, or None on failure
+        """
+        started_at = time.monotonic()
+        batches = self.plan_batches(universe, batch_size)
+        self.log_info(
+            "Refreshing monitored universe",
+            universe_size=len(universe),
+            batch_size=batch_size,
+            batches=len(batches)
+        )
+
+        fetch = fetch_batch or service.fetch_multiple_prices
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        results: Dict[str, Optional[Dict]] = {}
+
+        async def refresh_batch(batch: List[str]) -> None:
+            async with semaphore:
+                try:
+                    batch_results = await fetch(batch)
+                    self._batches_fetched += 1
+                except Exception as e:
+                    self.log_error("Error refreshing batch", batch_size=len(batch), error=str(e))
+                    self._batches_failed += 1
+                    batch_results = {}
+
+            for symbol in batch:
+                results[symbol] = batch_results.get(symbol)
+            self.record_refreshed([symbol for symbol in batch if results[symbol] is not None])
+
+        await asyncio.gather(*(refresh_batch(batch) for batch in batches))
+
+        with self._lock:
+            self._universe = list(dict.fromkeys(universe))
+            # Forget symbols that left the universe so tracking stays bounded
+            for symbol in set(self._last_refreshed) - set(self._universe):
+                del self._last_refreshed[symbol]
+            self._cycles += 1
+            self._last_cycle_at = utc_now()
+            self._last_cycle_ms = round((time.monotonic() - started_at) * 1000, 2)
+
+        return results
+
+    def record_refreshed(self, symbols: List[str]) -> None:
+        """Mark symbols as successfully refreshed now."""
+        refreshed_at = utc_now()
+        with self._lock:
+            for symbol in symbols:
+                self._last_refreshed[symbol] = refreshed_at
+
+    def get_last_refreshed(self, symbol: str) -> Optional[datetime]:
+        """Get when a symbol was last successfully refreshed by the scheduler."""
+        with self._lock:
+            return self._last_refreshed.get(symbol)
+
+    def clear(self) -> None:
+        """Forget all freshness tracking."""
+        with self._lock:
+            self._last_refreshed.clear()
+            self._universe = []
+
+    def get_stats(self) -> Dict:
+        """Get coverage and freshness statistics for monitoring."""
+        now_utc = utc_now()
+        with self._lock:
+            ages = [
+                (now_utc - self._last_refreshed[symbol]).total_seconds()
+                for symbol in self._universe
+                if symbol in self._last_refreshed
+            ]
+            universe_size = len(self._universe)
+            fresh = sum(1 for age in ages if age <= self.stale_after_seconds)
+            return {
+                "universe_size": universe_size,
+                "fresh": fresh,
+                "stale": len(ages) - fresh,
+                "never_refreshed": universe_size - len(ages),
+                "coverage": round(fresh / universe_size, 4) if universe_size else None,
+                "oldest_age_seconds": round(max(ages), 1) if ages else None,
+                "cycles": self._cycles,
+                "batches_fetched": self._batches_fetched,
+                "batches_failed": self._batches_failed,
+                "last_cycle_at": self._last_cycle_at,
+                "last_cycle_ms": self._last_cycle_ms
+            }
+
+
+# Global instance for the application
+_universe_refresh_scheduler: Optional[UniverseRefreshScheduler] = None
+
+
+def get_universe_refresh_scheduler() -> UniverseRefreshScheduler:
+    """Get the global universe refresh scheduler instance."""
+    global _universe_refresh_scheduler
+    if _universe_refresh_scheduler is None:
+        _universe_refresh_scheduler = UniverseRefreshScheduler()
+    return _universe_refresh_scheduler
@@ -1,18 +1,27 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from datetime import date
 from decimal import Decimal
 from dataclasses import dataclass
 
 from src.main import app
-from src.database import get_db, Base
+from src.database import get_async_db, get_db, get_db_bind, Base
 from src.models.user import User
 from src.models.portfolio import Portfolio
 from src.models.stock import Stock
 from src.models.user_role import UserRole
 from src.core.auth import get_password_hash, create_access_token
+from src.services.price_cache import get_price_cache
+from src.services.symbol_portfolio_index import get_symbol_portfolio_index
+from src.services.provider_rate_limiter import get_provider_rate_limiter
+from src.services.price_fetch_coordinator import get_price_fetch_coordinator
+from src.services.universe_refresh_scheduler import get_universe_refresh_scheduler
+from src.services.price_broadcast_hub import get_price_broadcast_hub
+from src.services.sse_connection_registry import get_sse_connection_registry
 
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -22,6 +31,10 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient runs each app on its own event loop, so async connections are not pooled
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 def override_get_db():
     try:
@@ -31,7 +44,14 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_db_bind] = lambda: engine
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 
 @dataclass
@@ -43,6 +63,21 @@ class TestData:
     access_token: str
 
 
+@pytest.fixture(autouse=True)
+def clear_in_memory_caches():
+    """Tables are recreated per test, so cached prices, indexes and quotas must not leak between tests."""
+    get_price_cache().clear()
+    get_symbol_portfolio_index().clear()
+    get_provider_rate_limiter().reset()
+    get_price_fetch_coordinator().clear()
+    get_universe_refresh_scheduler().clear()
+    get_price_broadcast_hub().clear()
+    get_sse_connection_registry().clear()
+    yield
+    get_price_cache().clear()
+    get_symbol_portfolio_index().clear()
+
+
 @pytest.fixture
 def client():
     Base.metadata.create_all(bind=engine)
@@ -251,6 +251,84 @@ class TestDynamicPortfolioValuation:
         assert portfolio_value.total_unrealized_gain == Decimal("0.00")
         assert portfolio_value.total_gain_percent == Decimal("0.00")
 
+    def test_portfolio_snapshot_matches_individual_calculations(self, db: Session, test_portfolio: Portfolio, test_holdings: list, test_cached_prices: list):
+        """Test that the single-pass snapshot agrees with the per-metric calculations."""
+        service = DynamicPortfolioService(db)
+
+        portfolio = db.query(Portfolio).filter(Portfolio.id == test_portfolio.id).first()
+        snapshot = service.calculate_portfolio_snapshot(portfolio)
+        portfolio_value = service.calculate_portfolio_value(test_portfolio.id, use_cache=False)
+
+        assert snapshot.value.total_value == portfolio_value.total_value == Decimal("15200.00")
+        assert snapshot.value.total_cost_basis == portfolio_value.total_cost_basis
+        assert snapshot.daily_change == service.calculate_daily_change(test_portfolio.id)
+        assert {h.stock.symbol for h in snapshot.holdings} == {"CBA", "BHP", "WBC"}
+
+    def test_get_dynamic_portfolio_uses_fixed_number_of_queries(self, db: Session, test_portfolio: Portfolio, test_holdings: list, test_cached_prices: list):
+        """Test that valuing a portfolio does not issue per-holding queries."""
+        from sqlalchemy import event
+
+        portfolio_id = test_portfolio.id
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            service = DynamicPortfolioService(db)
+            portfolio_response = service.get_dynamic_portfolio(portfolio_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert portfolio_response.total_value == Decimal("15200.00")
+        # Portfolio with holdings, master prices, cached valuation lookup
+        assert len(statements) <= 3
+
+    def test_batch_valuation_for_owner_matches_single_valuation(self, db: Session, test_user: User, test_portfolio: Portfolio, test_holdings: list, test_stocks: list, test_cached_prices: list):
+        """Test that valuing all of a user's portfolios together matches valuing them one by one."""
+        from sqlalchemy import event
+
+        second_portfolio = Portfolio(name="Second Portfolio", owner_id=test_user.id)
+        db.add(second_portfolio)
+        db.commit()
+        db.add(Holding(
+            portfolio_id=second_portfolio.id,
+            stock_id=test_stocks[0].id,  # CBA
+            quantity=Decimal("10"),
+            average_cost=Decimal("40.00")
+        ))
+        db.commit()
+
+        owner_id = test_user.id
+        service = DynamicPortfolioService(db)
+        expected = {
+            response.id: response.total_value
+            for response in (
+                service.get_dynamic_portfolio(test_portfolio.id),
+                service.get_dynamic_portfolio(second_portfolio.id)
+            )
+        }
+        db.expire_all()
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            responses = service.get_dynamic_portfolios_for_owner(owner_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert {response.id: response.total_value for response in responses} == expected
+        assert expected[second_portfolio.id] == Decimal("550.00")
+        # Portfolios with holdings, shared price snapshot, cached valuations
+        assert len(statements) <= 3
+
     def test_portfolio_api_returns_dynamic_values(self, db: Session, test_portfolio: Portfolio, test_holdings: list, test_cached_prices: list):
         """Test that portfolio API endpoints return dynamically calculated values."""
         # This test will be implemented after we update the API endpoints
@@ -0,0 +1,100 @@
+"""
+Tests for the write-behind provider activity buffer.
+
+Buffered activities must be written in batches on size or time thresholds,
+flushed on shutdown, and counted when dropped; the synchronous logging API
+must keep writing immediately.
+"""
+
+import asyncio
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.market_data_provider import MarketDataProvider, ProviderActivity
+from src.services.activity_log_buffer import ActivityLogBuffer
+from src.services.activity_service import queue_provider_activity
+
+
+def _row(description: str) -> dict:
+    return {
+        "provider_id": "yfinance",
+        "activity_type": "API_CALL",
+        "description": description,
+        "status": "success",
+        "activity_metadata": {}
+    }
+
+
+class TestActivityLogBuffer:
+    """Test suite for buffered ProviderActivity writes."""
+
+    @pytest.fixture
+    def provider(self, db_session: Session):
+        provider = MarketDataProvider(
+            name="yfinance",
+            display_name="Yahoo Finance",
+            is_enabled=True,
+            priority=1
+        )
+        db_session.add(provider)
+        db_session.commit()
+        return provider
+
+    def test_queue_writes_immediately_when_buffer_not_running(self, db_session: Session, provider):
+        queue_provider_activity(
+            db_session=db_session,
+            provider_id="yfinance",
+            activity_type="API_CALL",
+            description="Fetched CBA",
+            status="success",
+            metadata={"symbol": "CBA"}
+        )
+
+        activity = db_session.query(ProviderActivity).one()
+        assert activity.description == "Fetched CBA"
+        assert activity.activity_metadata == {"symbol": "CBA"}
+
+    def test_flush_writes_batch_and_counts_drops(self, db_session: Session, provider):
+        buffer = ActivityLogBuffer(max_buffer_size=3)
+
+        results = [buffer.enqueue(db_session, _row(f"activity {i}")) for i in range(5)]
+
+        assert results == [True, True, True, False, False]
+        assert db_session.query(ProviderActivity).count() == 0
+
+        assert buffer.flush() == 3
+        assert db_session.query(ProviderActivity).count() == 3
+
+        stats = buffer.get_stats()
+        assert stats["written"] == 3
+        assert stats["dropped"] == 2
+        assert stats["buffered"] == 0
+        assert stats["flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_triggers_background_flush(self, db_session: Session, provider):
+        buffer = ActivityLogBuffer(flush_batch_size=2, flush_interval_seconds=60)
+        await buffer.start()
+        try:
+            buffer.enqueue(db_session, _row("first"))
+            buffer.enqueue(db_session, _row("second"))
+
+            for _ in range(50):
+                if buffer.get_stats()["written"] == 2:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await buffer.stop()
+
+        assert buffer.get_stats()["written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_activities(self, db_session: Session, provider):
+        buffer = ActivityLogBuffer(flush_batch_size=100, flush_interval_seconds=60)
+        await buffer.start()
+        buffer.enqueue(db_session, _row("pending"))
+
+        await buffer.stop()
+
+        assert not buffer.is_running
+        assert db_session.query(ProviderActivity).filter_by(description="pending").count() == 1
@@ -0,0 +1,71 @@
+"""
+Tests for the read endpoints served through the async database session.
+
+Portfolio, holding and price reads use get_async_db so their queries do not
+block the event loop; the responses must match what the sync paths returned.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from src.models import Holding, NewsNotice, Portfolio, User
+from src.models.news_notice import NewsNoticeType
+
+
+class TestAsyncReadPaths:
+    """Test suite for portfolio and holding reads on the async session."""
+
+    def test_holdings_include_recent_news_counts(self, client: TestClient, test_data, db):
+        holding = Holding(
+            portfolio_id=test_data.portfolio.id,
+            stock_id=test_data.stock.id,
+            quantity=Decimal("10"),
+            average_cost=Decimal("120.00")
+        )
+        db.add(holding)
+        for days_ago in (1, 5, 45):
+            db.add(NewsNotice(
+                stock_id=test_data.stock.id,
+                title=f"Notice from {days_ago} days ago",
+                notice_type=NewsNoticeType.NEWS,
+                published_date=datetime.utcnow() - timedelta(days=days_ago)
+            ))
+        db.commit()
+
+        response = client.get(
+            f"/api/v1/portfolios/{test_data.portfolio.id}/holdings",
+            headers={"Authorization": f"Bearer {test_data.access_token}"}
+        )
+
+        assert response.status_code == 200
+        holdings = response.json()
+        assert len(holdings) == 1
+        assert holdings[0]["stock"]["symbol"] == "AAPL"
+        assert holdings[0]["recent_news_count"] == 2
+
+    def test_portfolio_of_another_user_is_not_found(self, client: TestClient, test_data, db):
+        other_user = User(email="other@example.com", first_name="Other", last_name="User", password_hash="hashed")
+        db.add(other_user)
+        db.flush()
+        other_portfolio = Portfolio(name="Other Portfolio", owner_id=other_user.id)
+        db.add(other_portfolio)
+        db.commit()
+        headers = {"Authorization": f"Bearer {test_data.access_token}"}
+
+        own = client.get(f"/api/v1/portfolios/{test_data.portfolio.id}", headers=headers)
+        other = client.get(f"/api/v1/portfolios/{other_portfolio.id}", headers=headers)
+
+        assert own.status_code == 200
+        assert own.json()["name"] == "Test Portfolio"
+        assert other.status_code == 404
+
+    def test_list_portfolios_returns_owned_portfolios(self, client: TestClient, test_data):
+        response = client.get(
+            "/api/v1/portfolios",
+            headers={"Authorization": f"Bearer {test_data.access_token}"}
+        )
+
+        assert response.status_code == 200
+        assert [portfolio["id"] for portfolio in response.json()] == [str(test_data.portfolio.id)]
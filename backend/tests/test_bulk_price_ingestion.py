@@ -0,0 +1,117 @@
+"""
+Tests for batched price ingestion into the realtime_symbols master table.
+
+A batch of fetched prices must be written with a fixed number of statements
+and one commit, and produce a single combined portfolio update event.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models.market_data_provider import MarketDataProvider
+from src.models.realtime_price_history import RealtimePriceHistory
+from src.models.realtime_symbol import RealtimeSymbol
+from src.services.market_data_service import MarketDataService
+from src.services.price_cache import get_price_cache
+from src.utils.datetime_utils import utc_now
+
+
+def _price(price: str, **extra) -> dict:
+    return {"price": Decimal(price), "source_timestamp": utc_now(), "volume": 1000, **extra}
+
+
+class TestBulkPriceIngestion:
+    """Test suite for MarketDataService.store_prices_to_master."""
+
+    @pytest.fixture
+    def provider(self, db_session: Session):
+        provider = MarketDataProvider(
+            name="yfinance",
+            display_name="Yahoo Finance",
+            is_enabled=True,
+            priority=1
+        )
+        db_session.add(provider)
+        db_session.commit()
+        return provider
+
+    def test_batch_inserts_history_and_upserts_master(self, db_session: Session, provider):
+        service = MarketDataService(db_session)
+        service.store_prices_to_master({"CBA": _price("110.00", company_name="Commonwealth Bank")}, provider)
+
+        stored = service.store_prices_to_master({
+            "CBA": _price("111.50", previous_close=Decimal("110.00")),
+            "BHP": _price("45.20", company_name="BHP Group")
+        }, provider)
+
+        assert stored == ["CBA", "BHP"]
+        db_session.expire_all()
+
+        cba = db_session.get(RealtimeSymbol, "CBA")
+        assert cba.current_price == Decimal("111.50")
+        assert cba.company_name == "Commonwealth Bank"
+        latest = db_session.get(RealtimePriceHistory, cba.latest_history_id)
+        assert latest.price == Decimal("111.50")
+        assert latest.previous_close == Decimal("110.00")
+
+        assert db_session.get(RealtimeSymbol, "BHP").company_name == "BHP Group"
+        assert db_session.query(RealtimePriceHistory).count() == 3
+
+    def test_new_symbols_without_company_name_get_default(self, db_session: Session, provider):
+        service = MarketDataService(db_session)
+        service.store_prices_to_master({
+            "CBA": _price("110.00", company_name="Commonwealth Bank"),
+            "WES": _price("70.00")
+        }, provider)
+
+        service.store_prices_to_master({"CBA": _price("111.00"), "WES": _price("71.00")}, provider)
+        db_session.expire_all()
+
+        assert db_session.get(RealtimeSymbol, "WES").company_name == "WES Company"
+        assert db_session.get(RealtimeSymbol, "CBA").company_name == "Commonwealth Bank"
+
+    def test_statement_count_does_not_scale_with_symbols(self, db_session: Session, provider):
+        prices = {f"SYM{i}": _price(f"{10 + i}.00") for i in range(40)}
+        service = MarketDataService(db_session)
+        statements = []
+        commits = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        event.listen(db_session, "after_commit", lambda session: commits.append(session))
+        try:
+            service.store_prices_to_master(prices, provider)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert len(statements) <= 2
+        assert len(commits) == 1
+        assert db_session.query(RealtimeSymbol).count() == 40
+
+    def test_batch_refreshes_price_cache(self, db_session: Session, provider):
+        MarketDataService(db_session).store_prices_to_master({"CSL": _price("290.10")}, provider)
+
+        cached = get_price_cache().get("CSL")
+        assert cached.price == Decimal("290.10")
+        assert cached.provider == "Yahoo Finance"
+
+    @pytest.mark.asyncio
+    async def test_bulk_fetch_emits_single_change_event(self, db_session: Session, provider):
+        service = MarketDataService(db_session)
+        bulk_results = {"CBA": _price("110.00"), "BHP": _price("45.20"), "ZZZ": None}
+
+        with patch.object(service, "_bulk_fetch_from_yfinance", AsyncMock(return_value=bulk_results)), \
+             patch.object(service, "_trigger_portfolio_updates") as single_trigger, \
+             patch.object(service, "_trigger_bulk_portfolio_updates") as bulk_trigger:
+            result = await service.fetch_multiple_prices(["CBA", "BHP", "ZZZ"])
+
+        assert set(result) == {"CBA", "BHP"}
+        single_trigger.assert_not_called()
+        bulk_trigger.assert_called_once_with(["CBA", "BHP"])
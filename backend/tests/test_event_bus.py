@@ -0,0 +1,125 @@
+"""
+Tests for the cross-worker event bus.
+
+Two in-memory buses on one broker stand in for two workers sharing Redis:
+events reach the other worker but never echo back to the publisher, and
+remote prices refresh the receiving worker's cache and stream subscribers.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from src.services.event_bus import (
+    PORTFOLIO_CHANNEL,
+    PRICE_CHANNEL,
+    InMemoryBroker,
+    InMemoryEventBus,
+    _apply_remote_prices,
+    snapshot_from_event,
+    snapshot_to_event,
+)
+from src.services.price_broadcast_hub import get_price_broadcast_hub
+from src.services.price_cache import get_price_cache
+from src.services.price_snapshot_service import PriceSnapshot
+
+
+def make_snapshot(symbol="CBA", price="101.25"):
+    return PriceSnapshot(
+        symbol=symbol,
+        price=Decimal(price),
+        last_updated=datetime(2026, 1, 5, 10, 30),
+        previous_close=Decimal("100.00"),
+        provider="Yahoo Finance",
+        volume=1500
+    )
+
+
+class TestEventBus:
+    """Test suite for the event bus."""
+
+    def test_snapshot_round_trip(self):
+        snapshot = make_snapshot()
+
+        assert snapshot_from_event(snapshot_to_event(snapshot)) == snapshot
+
+    @pytest.mark.asyncio
+    async def test_events_reach_other_workers_only(self):
+        broker = InMemoryBroker()
+        publisher = InMemoryEventBus(broker, worker_id="worker-1")
+        receiver = InMemoryEventBus(broker, worker_id="worker-2")
+        await publisher.start()
+        await receiver.start()
+
+        received = {"worker-1": [], "worker-2": []}
+        publisher.add_handler(PORTFOLIO_CHANNEL, received["worker-1"].append)
+        receiver.add_handler(PORTFOLIO_CHANNEL, received["worker-2"].append)
+
+        publisher.publish_portfolio_update("p-1", {"CBA", "BHP"})
+
+        assert received["worker-1"] == []
+        assert received["worker-2"] == [{"portfolio_id": "p-1", "symbols": ["BHP", "CBA"]}]
+        assert publisher.get_stats()["published"] == 1
+        assert receiver.get_stats()["received"] == 1
+
+        await publisher.stop()
+        await receiver.stop()
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_are_contained(self):
+        broker = InMemoryBroker()
+        publisher = InMemoryEventBus(broker, worker_id="worker-1")
+        receiver = InMemoryEventBus(broker, worker_id="worker-2")
+        await receiver.start()
+
+        def failing_handler(payload):
+            raise RuntimeError("boom")
+
+        received = []
+        receiver.add_handler(PRICE_CHANNEL, failing_handler)
+        receiver.add_handler(PRICE_CHANNEL, received.append)
+
+        publisher.publish_prices([make_snapshot()])
+
+        assert len(received) == 1
+        assert receiver.get_stats()["handler_errors"] == 1
+
+        await receiver.stop()
+
+    @pytest.mark.asyncio
+    async def test_background_handler_errors_are_counted(self):
+        broker = InMemoryBroker()
+        publisher = InMemoryEventBus(broker, worker_id="worker-1")
+        receiver = InMemoryEventBus(broker, worker_id="worker-2")
+        await receiver.start()
+        futures = []
+
+        def fail():
+            raise RuntimeError("database unavailable")
+
+        def background_handler(payload):
+            future = asyncio.get_running_loop().run_in_executor(None, fail)
+            futures.append(future)
+            return future
+
+        receiver.add_handler(PORTFOLIO_CHANNEL, background_handler)
+
+        publisher.publish_portfolio_update("p-1", {"CBA"})
+        await asyncio.gather(*futures, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert receiver.get_stats()["handler_errors"] == 1
+
+        await receiver.stop()
+
+    @pytest.mark.asyncio
+    async def test_remote_prices_update_cache_and_streams(self):
+        subscription = get_price_broadcast_hub().subscribe(["CBA"])
+        snapshot = make_snapshot()
+
+        _apply_remote_prices({"snapshots": [snapshot_to_event(snapshot)]})
+
+        assert get_price_cache().get("CBA") == snapshot
+        updates = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert updates.prices == {"CBA": snapshot}
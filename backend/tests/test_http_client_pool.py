@@ -0,0 +1,69 @@
+"""
+Tests for the application-lifetime HTTP client pool.
+
+Every MarketDataService instance must share one session so that keep-alive
+connections survive across requests, and closing a service must not close it.
+"""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.services.http_client_pool import HttpClientPool
+from src.services.market_data_service import MarketDataService
+
+
+async def _ok(request):
+    return web.json_response({"ok": True})
+
+
+class TestHttpClientPool:
+    """Test suite for the shared HTTP client pool."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused_across_requests(self):
+        app = web.Application()
+        app.router.add_get("/", _ok)
+        pool = HttpClientPool(limit_per_host=1)
+
+        async with TestServer(app) as server:
+            try:
+                session = await pool.get_session()
+                for _ in range(3):
+                    async with session.get(server.make_url("/")) as response:
+                        assert response.status == 200
+                        await response.read()
+            finally:
+                await pool.close()
+
+        stats = pool.get_stats()
+        assert stats["requests"] == 3
+        assert stats["connections_created"] == 1
+        assert stats["connections_reused"] == 2
+        assert stats["is_open"] is False
+
+    @pytest.mark.asyncio
+    async def test_close_and_reopen_creates_new_session(self):
+        pool = HttpClientPool()
+
+        first = await pool.get_session()
+        assert await pool.get_session() is first
+
+        await pool.close()
+        second = await pool.get_session()
+        await pool.close()
+
+        assert first.closed
+        assert second is not first
+        assert pool.get_stats()["sessions_created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_services_share_session_and_do_not_close_it(self, db_session):
+        first_service = MarketDataService(db_session)
+        second_service = MarketDataService(db_session)
+
+        session = await first_service.get_session()
+        await first_service.close_session()
+
+        assert await second_service.get_session() is session
+        assert not session.closed
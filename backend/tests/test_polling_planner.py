@@ -0,0 +1,141 @@
+"""
+Tests for the priority-based adaptive polling planner.
+
+Symbols are tiered by held market value and request frequency, tier intervals
+come from PollIntervalConfig, and only due symbols within the call budget are
+selected, most overdue first.
+"""
+
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from sqlalchemy.orm import Session
+
+from src.models import Holding, Portfolio, RealtimePriceHistory, Stock, User
+from src.models.market_data_provider import MarketDataProvider
+from src.models.poll_interval_config import PollIntervalConfig
+from src.models.realtime_symbol import RealtimeSymbol
+from src.services.polling_planner import DEFAULT_TIER_INTERVALS_MINUTES, PollingPlanner
+from src.utils.datetime_utils import utc_now
+
+
+@pytest.fixture(autouse=True)
+def market_open():
+    """Keep every market open so results do not depend on the wall clock."""
+    calendar = MagicMock()
+    calendar.needs_refresh.return_value = True
+    with patch("src.services.polling_planner.get_trading_calendar", return_value=calendar):
+        yield calendar
+
+
+class TestPollingPlanner:
+    """Test suite for the polling planner."""
+
+    @pytest.fixture
+    def universe(self, db_session: Session):
+        """
+        BIG is a large holding, SMALL a small one and VIEWED is not held.
+
+        Every symbol was last updated 5 minutes ago.
+        """
+        provider = MarketDataProvider(name="yfinance", display_name="Yahoo Finance", is_enabled=True, priority=1)
+        user = User(email="planner@example.com", password_hash="hashed", first_name="Poll", last_name="Planner")
+        db_session.add_all([provider, user])
+        db_session.flush()
+
+        portfolio = Portfolio(name="Planner Portfolio", owner_id=user.id)
+        db_session.add(portfolio)
+        db_session.flush()
+
+        last_updated = utc_now().replace(tzinfo=None) - timedelta(minutes=5)
+        for symbol, quantity in [("BIG", 1000), ("SMALL", 1), ("VIEWED", 0)]:
+            stock = Stock(symbol=symbol, company_name=f"{symbol} Limited", current_price=Decimal("10.00"))
+            db_session.add(stock)
+            db_session.flush()
+            if quantity:
+                db_session.add(Holding(portfolio_id=portfolio.id, stock_id=stock.id, quantity=quantity, average_cost=Decimal("10.00")))
+            db_session.add(RealtimeSymbol(
+                symbol=symbol,
+                current_price=Decimal("10.00"),
+                last_updated=last_updated,
+                provider_id=provider.id
+            ))
+        db_session.commit()
+        return ["BIG", "SMALL", "VIEWED"]
+
+    def test_symbols_are_tiered_by_exposure_and_requests(self, db_session: Session, universe):
+        scores = {score.symbol: score for score in PollingPlanner().score(db_session, universe)}
+
+        assert scores["BIG"].tier == "high"
+        assert scores["SMALL"].tier == "normal"
+        assert scores["VIEWED"].tier == "low"
+        assert scores["BIG"].exposure == Decimal("10000")
+
+    def test_scheduled_fetches_do_not_count_as_requests(self, db_session: Session, universe):
+        provider = db_session.query(MarketDataProvider).filter_by(name="yfinance").one()
+        fetched_at = utc_now().replace(tzinfo=None)
+        for _ in range(4):
+            db_session.add(RealtimePriceHistory(
+                symbol="VIEWED",
+                price=Decimal("10.00"),
+                provider_id=provider.id,
+                source_timestamp=fetched_at,
+                fetched_at=fetched_at
+            ))
+        db_session.commit()
+
+        planner = PollingPlanner()
+        assert {score.symbol: score.tier for score in planner.score(db_session, universe)}["VIEWED"] == "normal"
+
+        planner.record_scheduled_fetches(["VIEWED"] * 4)
+        scores = {score.symbol: score for score in planner.score(db_session, universe)}
+
+        assert scores["VIEWED"].tier == "low"
+        assert scores["VIEWED"].request_count == 0
+
+    def test_only_due_symbols_are_planned(self, db_session: Session, universe):
+        plan = PollingPlanner().plan(db_session, universe, batch_size=50)
+
+        # Only the high tier (1 minute) is due after 5 minutes
+        assert plan.symbols == ["BIG"]
+        assert plan.tier_counts["high"] == 1
+
+    def test_tier_intervals_come_from_active_configs(self, db_session: Session, universe):
+        db_session.add(PollIntervalConfig(interval_minutes=2, tier="normal", reason="test", created_by="admin"))
+        db_session.add(PollIntervalConfig(interval_minutes=30, tier="high", reason="old", created_by="admin", is_active=False))
+        db_session.commit()
+
+        planner = PollingPlanner()
+        intervals = planner.get_tier_intervals(db_session)
+
+        assert intervals["normal"] == 2
+        assert intervals["high"] == DEFAULT_TIER_INTERVALS_MINUTES["high"]
+        assert planner.plan(db_session, universe, batch_size=50).symbols == ["BIG", "SMALL"]
+
+    def test_call_budget_limits_symbols_and_defers_the_rest(self, db_session: Session, universe):
+        db_session.add(PollIntervalConfig(interval_minutes=1, tier="low", reason="test", created_by="admin"))
+        db_session.add(PollIntervalConfig(interval_minutes=1, tier="normal", reason="test", created_by="admin"))
+        db_session.commit()
+
+        plan = PollingPlanner().plan(db_session, universe, batch_size=2, call_budget=1)
+
+        assert len(plan.symbols) == 2
+        assert plan.symbols[0] == "BIG"
+        assert plan.deferred == 1
+        assert plan.next_poll_seconds == 60.0
+
+    def test_never_fetched_symbols_are_due_first(self, db_session: Session, universe):
+        plan = PollingPlanner().plan(db_session, universe + ["NEW"], batch_size=50)
+
+        assert plan.symbols[0] == "NEW"
+
+    def test_closed_market_symbols_with_closing_price_are_not_due(self, db_session: Session, universe, market_open):
+        market_open.needs_refresh.return_value = False
+        market_open.seconds_until_next_open.return_value = 7200.0
+
+        planner = PollingPlanner()
+        plan = planner.plan(db_session, universe, batch_size=50)
+
+        assert plan.symbols == []
+        assert plan.next_poll_seconds == planner.closed_max_poll_seconds
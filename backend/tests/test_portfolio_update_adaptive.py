@@ -0,0 +1,97 @@
+"""
+Tests for adaptive debounce and load-aware batching in the update queue.
+
+Quiet periods debounce for min_debounce_seconds, bursts of requests widen
+the window towards max_debounce_seconds, and dispatch is limited to what the
+workers can take so the remaining due requests keep coalescing.
+"""
+
+import asyncio
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.portfolio_update_metrics import PortfolioQueueMetric
+from src.services.portfolio_update_queue import PortfolioUpdateQueue
+
+
+def force_adjustment(queue: PortfolioUpdateQueue, elapsed: float = 1.0):
+    """Run the load controller as if elapsed seconds had passed."""
+    queue._last_adapt_time -= elapsed
+    queue._adapt_to_load()
+
+
+class TestAdaptiveDebounce:
+    """Test suite for load-driven queue settings."""
+
+    def test_quiet_queue_uses_minimum_debounce(self):
+        queue = PortfolioUpdateQueue(adaptive=True, min_debounce_seconds=0.1, max_debounce_seconds=10.0)
+
+        force_adjustment(queue)
+
+        stats = queue.get_queue_stats()
+        assert stats["debounce_seconds"] == 0.1
+        assert stats["batch_size"] >= queue.max_workers
+
+    def test_burst_widens_debounce_then_narrows(self):
+        queue = PortfolioUpdateQueue(
+            adaptive=True, min_debounce_seconds=0.1, max_debounce_seconds=10.0, max_updates_per_minute=1000
+        )
+        queue._processing_times.extend([0.5] * 10)  # Four workers finish 8 updates a second
+
+        for i in range(200):
+            queue.queue_portfolio_update(f"portfolio-{i}", ["CBA"])
+        force_adjustment(queue)
+        storm_debounce = queue.debounce_seconds
+
+        assert storm_debounce == 10.0
+        assert queue.batch_size == 8
+        assert queue._pending_updates["portfolio-0"].debounce_seconds == 0.1  # Queued before the storm
+        queue.queue_portfolio_update("portfolio-new", ["CBA"])
+        assert queue._pending_updates["portfolio-new"].debounce_seconds == 10.0
+
+        queue._pending_updates.clear()
+        queue._deadlines.clear()
+        for _ in range(15):
+            force_adjustment(queue)
+
+        assert queue.debounce_seconds < 0.5
+
+    def test_fixed_queue_is_not_adjusted(self):
+        queue = PortfolioUpdateQueue(debounce_seconds=2.0)
+
+        stats = queue.get_queue_stats()
+        assert stats["adaptive"] is False
+        assert stats["debounce_seconds"] == 2.0
+        assert stats["batch_size"] is None
+
+
+class TestLoadAwareBatching:
+    """Test suite for dispatch limited by batch size."""
+
+    @pytest.mark.asyncio
+    async def test_dispatch_is_limited_to_batch_size(self):
+        queue = PortfolioUpdateQueue(adaptive=True, min_debounce_seconds=0, max_workers=2)
+        queue._ready_updates = asyncio.Queue()
+        queue.batch_size = 3
+
+        for i in range(10):
+            queue.queue_portfolio_update(f"portfolio-{i}", ["CBA"])
+        await queue._process_batch()
+
+        assert queue._ready_updates.qsize() == 3
+        assert queue.get_queue_stats()["pending_updates"] == 7
+
+        # Nothing more is dispatched until the workers take what is waiting
+        await queue._process_batch()
+        assert queue._ready_updates.qsize() == 3
+
+    def test_queue_metrics_record_adaptive_settings(self, db_session: Session):
+        queue = PortfolioUpdateQueue(adaptive=True, min_debounce_seconds=0.5)
+
+        queue._record_queue_metrics(db_session)
+        db_session.commit()
+
+        metric = db_session.query(PortfolioQueueMetric).one()
+        assert float(metric.debounce_seconds) == 0.5
+        assert metric.extra_data["adaptive"] is True
+        assert metric.extra_data["batch_size"] == queue.max_workers
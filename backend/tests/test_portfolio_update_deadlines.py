@@ -0,0 +1,80 @@
+"""
+Tests for deadline-ordered scheduling in the portfolio update queue.
+
+Pending requests sit in a heap keyed by debounce deadline: coalescing
+supersedes a request's earlier entry, the processor wakes when the next
+request is due rather than polling, and stale entries do not accumulate.
+"""
+
+import asyncio
+import time
+import pytest
+
+from src.services.portfolio_update_queue import PortfolioUpdateQueue
+
+
+class TestDeadlineScheduling:
+    """Test suite for the deadline heap."""
+
+    @pytest.mark.asyncio
+    async def test_coalesced_request_is_dispatched_once_at_new_deadline(self):
+        queue = PortfolioUpdateQueue(debounce_seconds=1.0)
+        queue._ready_updates = asyncio.Queue()
+
+        queue.queue_portfolio_update("portfolio-1", ["CBA"])
+        queue._deadlines[0] = (time.time() - 1, -1, "portfolio-1", queue._deadlines[0][3])
+        queue.queue_portfolio_update("portfolio-1", ["BHP"])
+
+        # The first entry is due but superseded; the coalesced request is not due yet
+        await queue._process_batch()
+        assert queue._ready_updates.empty()
+        assert queue.get_queue_stats()["pending_updates"] == 1
+
+        queue._pending_updates["portfolio-1"].timestamp -= 2
+        queue._schedule(queue._pending_updates["portfolio-1"])
+        await queue._process_batch()
+
+        request = queue._ready_updates.get_nowait()
+        assert request.symbols == {"CBA", "BHP"}
+        assert queue._ready_updates.empty()
+
+    @pytest.mark.asyncio
+    async def test_ready_requests_dispatch_in_deadline_then_priority_order(self):
+        queue = PortfolioUpdateQueue(debounce_seconds=0)
+        queue._ready_updates = asyncio.Queue()
+
+        queue.queue_portfolio_update("routine", ["CBA"], priority=1)
+        queue.queue_portfolio_update("manual", ["BHP"], priority=3)
+        await queue._process_batch()
+
+        assert queue._ready_updates.get_nowait().portfolio_id == "manual"
+        assert queue._ready_updates.get_nowait().portfolio_id == "routine"
+
+    @pytest.mark.asyncio
+    async def test_processor_wakes_when_request_is_due(self, monkeypatch):
+        queue = PortfolioUpdateQueue(debounce_seconds=0.05)
+        executed_at = []
+        monkeypatch.setattr(queue, "_execute_portfolio_update", lambda request: executed_at.append(time.time()))
+
+        await queue.start_processing()
+        try:
+            # Let the processor go idle before queueing
+            await asyncio.sleep(0.1)
+            queued_at = time.time()
+            queue.queue_portfolio_update("portfolio-1", ["CBA"])
+            await asyncio.sleep(0.3)
+        finally:
+            await queue.stop_processing()
+
+        assert len(executed_at) == 1
+        assert 0.05 <= executed_at[0] - queued_at < 0.2
+
+    def test_stale_entries_are_compacted(self):
+        queue = PortfolioUpdateQueue(debounce_seconds=1.0)
+
+        for i in range(1000):
+            queue.queue_portfolio_update("portfolio-1", [f"S{i}"])
+
+        stats = queue.get_queue_stats()
+        assert stats["pending_updates"] == 1
+        assert stats["scheduled_deadlines"] <= 2 + 64 + 1
@@ -0,0 +1,94 @@
+"""
+Tests for deferring rate-limited portfolio updates.
+
+A request over the per-portfolio rate limit is parked instead of dropped,
+merged with later rate-limited requests, and released into the queue once
+the portfolio's one-minute window has room again.
+"""
+
+import asyncio
+import time
+import pytest
+
+from src.services.portfolio_update_queue import PortfolioUpdateQueue
+
+
+def rate_limited_queue(portfolio_id: str) -> PortfolioUpdateQueue:
+    """Queue whose portfolio has used its single update for this minute."""
+    queue = PortfolioUpdateQueue(debounce_seconds=0.1, max_updates_per_minute=1)
+    queue._record_update(portfolio_id)
+    return queue
+
+
+def expire_window(queue: PortfolioUpdateQueue, portfolio_id: str):
+    """Age the portfolio's recorded updates out of the rate limit window."""
+    window = queue._rate_limit_windows[portfolio_id]
+    for i in range(len(window)):
+        window[i] -= 61
+
+
+class TestDeferredUpdates:
+    """Test suite for the deferred lane."""
+
+    def test_rate_limited_requests_are_deferred_and_merged(self):
+        queue = rate_limited_queue("portfolio-1")
+
+        assert queue.queue_portfolio_update("portfolio-1", ["CBA"]) is False
+        assert queue.queue_portfolio_update("portfolio-1", ["BHP"], priority=2) is False
+
+        stats = queue.get_queue_stats()
+        assert stats["pending_updates"] == 0
+        assert stats["deferred_updates"] == 1
+        assert stats["deferred_symbol_counts"] == {"portfolio-1": 2}
+        assert stats["deferred_total"] == 2
+        assert stats["dropped_total"] == 0
+
+        release_time, portfolio_id = queue._deferred_releases[0]
+        assert portfolio_id == "portfolio-1"
+        assert 59 < release_time - time.time() <= 60
+
+    def test_deferred_request_is_released_when_window_opens(self):
+        queue = rate_limited_queue("portfolio-1")
+        queue.queue_portfolio_update("portfolio-1", ["CBA"])
+        queue.queue_portfolio_update("portfolio-1", ["BHP"], priority=2)
+
+        expire_window(queue, "portfolio-1")
+        with queue._update_lock:
+            queue._release_deferred(time.time() + 61)
+
+        request = queue._pending_updates["portfolio-1"]
+        assert request.symbols == {"CBA", "BHP"}
+        assert request.priority == 2
+        assert request.debounce_seconds == 0.0
+        stats = queue.get_queue_stats()
+        assert stats["deferred_updates"] == 0
+        assert stats["released_total"] == 1
+
+    def test_release_waits_while_window_is_still_full(self):
+        queue = rate_limited_queue("portfolio-1")
+        queue.queue_portfolio_update("portfolio-1", ["CBA"])
+
+        with queue._update_lock:
+            queue._release_deferred(time.time() + 61)
+
+        assert "portfolio-1" not in queue._pending_updates
+        assert queue.get_queue_stats()["deferred_updates"] == 1
+        assert len(queue._deferred_releases) == 1
+
+    @pytest.mark.asyncio
+    async def test_processor_executes_released_request(self, monkeypatch):
+        queue = rate_limited_queue("portfolio-1")
+        executed = []
+        monkeypatch.setattr(queue, "_execute_portfolio_update", lambda request: executed.append(set(request.symbols)))
+
+        queue.queue_portfolio_update("portfolio-1", ["CBA"])
+        expire_window(queue, "portfolio-1")
+        queue._deferred_releases = [(time.time(), "portfolio-1")]
+
+        await queue.start_processing()
+        try:
+            await asyncio.sleep(0.3)
+        finally:
+            await queue.stop_processing()
+
+        assert executed == [{"CBA"}]
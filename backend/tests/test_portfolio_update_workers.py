@@ -0,0 +1,154 @@
+"""
+Tests for targeted portfolio updates and the update worker pool.
+
+Each queued request recomputes only its own portfolio, ready requests are
+executed by at most max_workers workers at once, and a portfolio is never
+executed by two workers concurrently.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from decimal import Decimal
+from sqlalchemy.orm import Session
+
+from src.core.exceptions import PortfolioError
+from src.models import Holding, Portfolio, Stock, User
+from src.services.portfolio_update_queue import PortfolioUpdateQueue, UpdateRequest
+from src.services.real_time_portfolio_service import RealTimePortfolioService
+
+
+class TestTargetedPortfolioUpdate:
+    """Test suite for recomputing a single portfolio."""
+
+    def test_only_requested_portfolio_is_updated(self, db_session: Session):
+        user = User(email="target@example.com", password_hash="hashed", first_name="Target", last_name="User")
+        db_session.add(user)
+        db_session.flush()
+        cba = Stock(symbol="CBA", company_name="Commonwealth Bank", current_price=Decimal("100.00"))
+        first = Portfolio(name="First", owner_id=user.id, total_value=Decimal("0.00"))
+        second = Portfolio(name="Second", owner_id=user.id, total_value=Decimal("0.00"))
+        db_session.add_all([cba, first, second])
+        db_session.flush()
+        db_session.add_all([
+            Holding(portfolio_id=first.id, stock_id=cba.id, quantity=10, average_cost=Decimal("90.00")),
+            Holding(portfolio_id=second.id, stock_id=cba.id, quantity=5, average_cost=Decimal("90.00"))
+        ])
+        db_session.commit()
+
+        updated = RealTimePortfolioService(db_session).update_portfolio_for_symbols(str(first.id), ["CBA"])
+
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert updated is not None and updated.id == first.id
+        assert first.total_value > 0
+        assert second.total_value == Decimal("0.00")
+
+    def test_unknown_portfolio_is_ignored(self, db_session: Session):
+        service = RealTimePortfolioService(db_session)
+
+        assert service.update_portfolio_for_symbols("not-a-uuid", ["CBA"]) is None
+
+    def test_failed_update_raises(self, db_session: Session, monkeypatch):
+        user = User(email="failing@example.com", password_hash="hashed", first_name="Failing", last_name="User")
+        db_session.add(user)
+        db_session.flush()
+        portfolio = Portfolio(name="Failing", owner_id=user.id)
+        db_session.add(portfolio)
+        db_session.commit()
+
+        service = RealTimePortfolioService(db_session)
+        monkeypatch.setattr(service, "_update_portfolio_with_all_holdings", lambda portfolio, prices: False)
+
+        with pytest.raises(PortfolioError):
+            service.update_portfolio_for_symbols(str(portfolio.id), ["CBA"])
+
+
+class TestUpdateWorkerPool:
+    """Test suite for concurrent execution of ready updates."""
+
+    @pytest.mark.asyncio
+    async def test_workers_bound_concurrency(self, monkeypatch):
+        queue = PortfolioUpdateQueue(debounce_seconds=0, max_workers=3)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def execute(request):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        monkeypatch.setattr(queue, "_execute_portfolio_update", execute)
+        await queue.start_processing()
+        try:
+            for i in range(9):
+                queue.queue_portfolio_update(f"portfolio-{i}", ["CBA"])
+            await asyncio.sleep(0.8)
+        finally:
+            await queue.stop_processing()
+
+        stats = queue.get_queue_stats()
+        assert peak == 3
+        assert sum(worker["processed"] for worker in stats["workers"]) == 9
+        assert stats["pending_updates"] == 0
+
+    @pytest.mark.asyncio
+    async def test_portfolio_is_not_executed_concurrently(self, monkeypatch):
+        queue = PortfolioUpdateQueue(debounce_seconds=0, max_workers=2)
+        started = threading.Event()
+        executed = []
+
+        def execute(request):
+            executed.append(set(request.symbols))
+            started.set()
+            time.sleep(0.2)
+
+        monkeypatch.setattr(queue, "_execute_portfolio_update", execute)
+        await queue.start_processing()
+        try:
+            queue.queue_portfolio_update("portfolio-1", ["CBA"])
+            await asyncio.to_thread(started.wait, 1)
+
+            # Arrives while the first run is executing: held until it finishes
+            queue.queue_portfolio_update("portfolio-1", ["BHP"])
+            await asyncio.sleep(0.1)
+            assert queue.get_queue_stats()["pending_updates"] == 1
+            assert len(executed) == 1
+
+            await asyncio.sleep(0.8)
+        finally:
+            await queue.stop_processing()
+
+        assert executed == [{"CBA"}, {"BHP"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_update_is_counted_and_not_published(self, monkeypatch):
+        queue = PortfolioUpdateQueue(debounce_seconds=0, max_workers=1)
+        published = []
+
+        def fail(self, portfolio_id, symbols):
+            raise PortfolioError(f"Failed to update portfolio {portfolio_id}")
+
+        monkeypatch.setattr(RealTimePortfolioService, "update_portfolio_for_symbols", fail)
+        monkeypatch.setattr(queue, "_publish_valuation", lambda db, request: published.append(request))
+
+        with pytest.raises(PortfolioError):
+            queue._execute_portfolio_update(UpdateRequest(portfolio_id="portfolio-1", symbols={"CBA"}, timestamp=time.time()))
+
+        await queue.start_processing()
+        try:
+            queue.queue_portfolio_update("portfolio-1", ["CBA"])
+            await asyncio.sleep(0.3)
+        finally:
+            await queue.stop_processing()
+
+        worker = queue.get_queue_stats()["workers"][0]
+        assert worker["failed"] == 1
+        assert worker["processed"] == 0
+        assert published == []
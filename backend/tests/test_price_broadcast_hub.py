@@ -0,0 +1,129 @@
+"""
+Tests for the in-process price broadcast hub.
+
+Stored prices are pushed to the subscriptions interested in each symbol
+through bounded per-connection queues, without any database polling.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy.orm import Session
+
+from src.models import Holding, Portfolio, Stock, User
+from src.services.portfolio_update_queue import PortfolioUpdateQueue, UpdateRequest
+from src.services.price_broadcast_hub import PortfolioValuationUpdate, PriceBroadcastHub, get_price_broadcast_hub
+from src.services.price_snapshot_service import PriceSnapshot
+
+
+def _snapshot(symbol: str, price: str) -> PriceSnapshot:
+    return PriceSnapshot(symbol=symbol, price=Decimal(price), last_updated=datetime(2026, 10, 16, 1, 0))
+
+
+class TestPriceBroadcastHub:
+    """Test suite for the price broadcast hub."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_only_their_symbols(self):
+        hub = PriceBroadcastHub()
+        cba = hub.subscribe(["CBA"])
+        bhp = hub.subscribe(["BHP"])
+
+        hub.publish(_snapshot("CBA", "100.00"))
+
+        assert list((await cba.get(timeout=0.1)).prices) == ["CBA"]
+        assert not await bhp.get(timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_pending_updates_collapse_to_latest_price(self):
+        hub = PriceBroadcastHub()
+        subscription = hub.subscribe(["CBA", "BHP"])
+
+        hub.publish_many([_snapshot("CBA", "100.00"), _snapshot("BHP", "40.00"), _snapshot("CBA", "101.00")])
+
+        updates = (await subscription.get(timeout=0.1)).prices
+        assert updates["CBA"].price == Decimal("101.00")
+        assert updates["BHP"].price == Decimal("40.00")
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_update(self):
+        hub = PriceBroadcastHub(max_queue_size=2)
+        subscription = hub.subscribe(["CBA"])
+
+        for price in ("1.00", "2.00", "3.00"):
+            hub.publish(_snapshot("CBA", price))
+
+        updates = (await subscription.get(timeout=0.1)).prices
+        assert updates["CBA"].price == Decimal("3.00")
+        assert hub.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread_is_delivered(self):
+        hub = PriceBroadcastHub()
+        subscription = hub.subscribe(["CBA"])
+
+        await asyncio.to_thread(hub.publish, _snapshot("CBA", "100.00"))
+
+        assert "CBA" in (await subscription.get(timeout=0.1)).prices
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_delivery(self):
+        hub = PriceBroadcastHub()
+        subscription = hub.subscribe(["CBA"])
+
+        hub.unsubscribe(subscription)
+        hub.publish(_snapshot("CBA", "100.00"))
+
+        assert not await subscription.get(timeout=0.01)
+        assert hub.get_stats()["subscriptions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_portfolio_valuations_reach_portfolio_subscribers(self):
+        hub = PriceBroadcastHub()
+        subscription = hub.subscribe([], portfolio_ids=["p1"])
+        valuation = PortfolioValuationUpdate(
+            portfolio_id="p1",
+            total_value=Decimal("1000.00"),
+            daily_change=Decimal("10.00"),
+            daily_change_percent=Decimal("1.01"),
+            unrealized_gain_loss=Decimal("50.00"),
+            last_updated=datetime(2026, 10, 16, 1, 0)
+        )
+
+        assert hub.has_portfolio_subscribers("p1")
+        assert not hub.has_portfolio_subscribers("p2")
+        hub.publish_portfolio(valuation)
+
+        updates = await subscription.get(timeout=0.1)
+        assert updates.portfolios == {"p1": valuation}
+        assert updates.prices == {}
+
+
+class TestPortfolioValuationPush:
+    """Test suite for valuations pushed after queued portfolio updates."""
+
+    @pytest.mark.asyncio
+    async def test_completed_update_publishes_changed_holdings(self, db_session: Session):
+        user = User(email="push@example.com", password_hash="hashed", first_name="Push", last_name="User")
+        db_session.add(user)
+        db_session.flush()
+        portfolio = Portfolio(name="Push Portfolio", owner_id=user.id)
+        cba = Stock(symbol="CBA", company_name="Commonwealth Bank", current_price=Decimal("100.00"))
+        bhp = Stock(symbol="BHP", company_name="BHP Group", current_price=Decimal("40.00"))
+        db_session.add_all([portfolio, cba, bhp])
+        db_session.flush()
+        db_session.add_all([
+            Holding(portfolio_id=portfolio.id, stock_id=cba.id, quantity=10, average_cost=Decimal("90.00")),
+            Holding(portfolio_id=portfolio.id, stock_id=bhp.id, quantity=5, average_cost=Decimal("40.00"))
+        ])
+        db_session.commit()
+
+        subscription = get_price_broadcast_hub().subscribe([], portfolio_ids=[str(portfolio.id)])
+        request = UpdateRequest(portfolio_id=str(portfolio.id), symbols={"CBA"}, timestamp=0)
+
+        PortfolioUpdateQueue()._publish_valuation(db_session, request)
+
+        valuation = (await subscription.get(timeout=0.1)).portfolios[str(portfolio.id)]
+        assert [holding.symbol for holding in valuation.changed_holdings] == ["CBA"]
+        assert valuation.total_value > 0
@@ -0,0 +1,97 @@
+"""
+Tests for process-wide single-flight price fetching.
+
+Concurrent fetch_price calls for one symbol, even from separate service
+instances, must share a single provider call and its result.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from src.services.market_data_service import MarketDataService
+from src.services.price_fetch_coordinator import PriceFetchCoordinator
+
+
+class TestPriceFetchCoordinator:
+    """Test suite for the single-flight coordinator."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_call(self):
+        coordinator = PriceFetchCoordinator()
+        calls = []
+
+        async def fetcher():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"price": 110.0}
+
+        results = await asyncio.gather(*(coordinator.fetch("CBA", fetcher) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert results == [{"price": 110.0}] * 5
+        stats = coordinator.get_stats()
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_recent_result_is_reused_until_ttl(self, monkeypatch):
+        coordinator = PriceFetchCoordinator(recent_ttl_seconds=10)
+        clock = [100.0]
+        monkeypatch.setattr("src.services.price_fetch_coordinator.time.monotonic", lambda: clock[0])
+        calls = []
+
+        async def fetcher():
+            calls.append(1)
+            return {"price": len(calls)}
+
+        assert await coordinator.fetch("CBA", fetcher) == {"price": 1}
+        assert await coordinator.fetch("CBA", fetcher) == {"price": 1}
+        clock[0] += 11
+        assert await coordinator.fetch("CBA", fetcher) == {"price": 2}
+        assert coordinator.get_stats()["recent_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached_and_reach_waiters(self):
+        coordinator = PriceFetchCoordinator()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+
+        results = await asyncio.gather(
+            coordinator.fetch("CBA", failing),
+            coordinator.fetch("CBA", failing),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await coordinator.fetch("CBA", lambda: asyncio.sleep(0, result=None)) is None
+        assert coordinator.get_stats()["recent_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_recent_cache_is_bounded(self):
+        coordinator = PriceFetchCoordinator(max_recent=2)
+
+        for symbol in ["CBA", "BHP", "CSL"]:
+            await coordinator.fetch(symbol, lambda: asyncio.sleep(0, result={"price": 1.0}))
+
+        assert coordinator.get_stats()["recent_size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_service_instances_share_in_flight_fetch(self, db_session):
+        calls = []
+
+        async def fake_fetch(self, symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            return {"price": 45.2}
+
+        with patch.object(MarketDataService, "_fetch_price_from_providers", fake_fetch):
+            results = await asyncio.gather(
+                MarketDataService(db_session).fetch_price("BHP"),
+                MarketDataService(db_session).fetch_price("BHP")
+            )
+
+        assert calls == ["BHP"]
+        assert results[0] is results[1]
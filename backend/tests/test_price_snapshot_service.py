@@ -0,0 +1,201 @@
+"""
+Tests for the batched price snapshot service.
+
+Snapshots must resolve any set of symbols from the realtime_symbols master
+table in one query per chunk, including previous close and provider name.
+"""
+
+import pytest
+from decimal import Decimal
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models.market_data_provider import MarketDataProvider
+from src.models.realtime_price_history import RealtimePriceHistory
+from src.models.realtime_symbol import RealtimeSymbol
+from src.services.market_data_service import MarketDataService
+from src.services.price_cache import PriceCache, get_price_cache
+from src.services.price_snapshot_service import PriceSnapshot, PriceSnapshotService
+from src.utils.datetime_utils import utc_now
+
+
+class TestPriceSnapshotService:
+    """Test suite for batched master table price lookups."""
+
+    @pytest.fixture
+    def provider(self, db_session: Session):
+        provider = MarketDataProvider(
+            name="yfinance",
+            display_name="Yahoo Finance",
+            is_enabled=True,
+            priority=1
+        )
+        db_session.add(provider)
+        db_session.commit()
+        return provider
+
+    @pytest.fixture
+    def master_symbols(self, db_session: Session, provider):
+        """Create master records for CBA, BHP and CSL; only CBA has a previous close."""
+        now = utc_now()
+        history = RealtimePriceHistory(
+            symbol="CBA",
+            price=Decimal("110.00"),
+            previous_close=Decimal("108.50"),
+            provider_id=provider.id,
+            source_timestamp=now,
+            fetched_at=now
+        )
+        db_session.add(history)
+        db_session.flush()
+
+        for symbol, price in [("CBA", "110.00"), ("BHP", "45.20"), ("CSL", "290.10")]:
+            db_session.add(RealtimeSymbol(
+                symbol=symbol,
+                current_price=Decimal(price),
+                company_name=f"{symbol} Ltd",
+                last_updated=now,
+                provider_id=provider.id,
+                latest_history_id=history.id if symbol == "CBA" else None
+            ))
+        db_session.commit()
+
+    def test_snapshots_include_previous_close_and_provider(self, db_session: Session, master_symbols):
+        snapshots = PriceSnapshotService(db_session).get_snapshots(["CBA", "BHP"])
+
+        assert set(snapshots) == {"CBA", "BHP"}
+        assert snapshots["CBA"].price == Decimal("110.00")
+        assert snapshots["CBA"].previous_close == Decimal("108.50")
+        assert snapshots["CBA"].provider == "Yahoo Finance"
+        assert snapshots["BHP"].previous_close is None
+
+    def test_missing_symbols_are_omitted(self, db_session: Session, master_symbols):
+        snapshots = PriceSnapshotService(db_session).get_snapshots(["CBA", "ZZZ"])
+
+        assert set(snapshots) == {"CBA"}
+        assert PriceSnapshotService(db_session).get_snapshot("ZZZ") is None
+
+    def test_symbols_resolved_with_one_query_per_chunk(self, db_session: Session, master_symbols):
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            single = PriceSnapshotService(db_session, use_cache=False).get_snapshots(["CBA", "BHP", "CSL"])
+            single_count = len(statements)
+            chunked = PriceSnapshotService(db_session, chunk_size=2, use_cache=False).get_snapshots(["CBA", "BHP", "CSL"])
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert single_count == 1
+        assert len(statements) == 3
+        assert set(single) == set(chunked) == {"CBA", "BHP", "CSL"}
+
+    def test_market_data_service_bulk_master_prices(self, db_session: Session, master_symbols):
+        service = MarketDataService(db_session)
+
+        prices = service.get_current_prices_from_master(["CBA", "CSL", "ZZZ"])
+
+        assert set(prices) == {"CBA", "CSL"}
+        assert prices["CSL"]["price"] == Decimal("290.10")
+        assert prices["CSL"]["provider"] == "Yahoo Finance"
+        assert service.get_current_price_from_master("CBA")["company_name"] == "CBA Ltd"
+
+    def test_repeated_lookups_served_from_cache(self, db_session: Session, master_symbols):
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            first = PriceSnapshotService(db_session).get_snapshots(["CBA", "BHP"])
+            second = PriceSnapshotService(db_session).get_snapshots(["CBA", "BHP"])
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert len(statements) == 1
+        assert first == second
+        stats = get_price_cache().get_stats()
+        assert stats["hits"] >= 2
+
+    def test_committed_master_update_invalidates_cache(self, db_session: Session, master_symbols):
+        service = PriceSnapshotService(db_session)
+        assert service.get_snapshot("BHP").price == Decimal("45.20")
+
+        record = db_session.query(RealtimeSymbol).filter_by(symbol="BHP").one()
+        record.current_price = Decimal("46.00")
+        db_session.commit()
+
+        assert service.get_snapshot("BHP").price == Decimal("46.00")
+
+    def test_store_price_to_master_refreshes_cache(self, db_session: Session, master_symbols, provider):
+        service = MarketDataService(db_session)
+        service.store_price_to_master("BHP", {
+            "price": 47.25,
+            "previous_close": 45.20,
+            "volume": 1000,
+            "source_timestamp": utc_now()
+        }, provider)
+
+        cached = get_price_cache().get("BHP")
+        assert cached is not None
+        assert cached.price == Decimal("47.25")
+        assert cached.previous_close == Decimal("45.2")
+        assert cached.provider == "Yahoo Finance"
+        assert cached.last_updated.tzinfo is None
+
+
+class TestPriceCache:
+    """Test suite for the in-process LRU price cache."""
+
+    @staticmethod
+    def _snapshot(symbol: str, price: str = "1.00") -> PriceSnapshot:
+        return PriceSnapshot(symbol=symbol, price=Decimal(price), last_updated=utc_now())
+
+    def test_hits_and_misses_are_counted(self):
+        cache = PriceCache(max_size=10)
+        cache.put(self._snapshot("CBA"))
+
+        assert cache.get("CBA").symbol == "CBA"
+        assert cache.get("BHP") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PriceCache(max_size=2)
+        cache.put(self._snapshot("CBA"))
+        cache.put(self._snapshot("BHP"))
+        cache.get("CBA")
+        cache.put(self._snapshot("CSL"))
+
+        assert set(cache.get_many(["CBA", "BHP", "CSL"])) == {"CBA", "CSL"}
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        cache = PriceCache(max_size=10, ttl_seconds=5)
+        clock = [1000.0]
+        monkeypatch.setattr("src.services.price_cache.time.monotonic", lambda: clock[0])
+
+        cache.put(self._snapshot("CBA"))
+        clock[0] += 6
+
+        assert cache.get("CBA") is None
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["size"] == 0
+
+    def test_invalidate_drops_entries(self):
+        cache = PriceCache(max_size=10)
+        cache.put(self._snapshot("CBA"))
+        cache.invalidate(["CBA", "BHP"])
+
+        assert cache.get("CBA") is None
+        assert cache.get_stats()["invalidations"] == 1
@@ -0,0 +1,91 @@
+"""
+Tests for the dedicated provider I/O thread pool.
+
+Blocking provider calls must run with bounded concurrency and timeouts, and
+independent yfinance chunks must be fetched in parallel.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from src.services.market_data_service import MarketDataService, YFINANCE_BULK_CHUNK_SIZE
+from src.services.provider_executor import ProviderExecutor
+
+
+class TestProviderExecutor:
+    """Test suite for the provider executor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_calls_and_records_latency(self):
+        executor = ProviderExecutor(max_workers=2)
+        try:
+            result = await executor.run(lambda a, b: a + b, 2, 3)
+        finally:
+            executor.shutdown()
+
+        assert result == 5
+        stats = executor.get_stats()
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["avg_latency_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_by_max_workers(self):
+        executor = ProviderExecutor(max_workers=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def blocking():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        try:
+            await asyncio.gather(*(executor.run(blocking) for _ in range(6)))
+        finally:
+            executor.shutdown()
+
+        assert max(peak) == 2
+        assert executor.get_stats()["completed"] == 6
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_is_counted(self):
+        executor = ProviderExecutor(max_workers=1, timeout_seconds=0.05)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run(time.sleep, 0.5)
+        finally:
+            executor.shutdown()
+
+        assert executor.get_stats()["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_yfinance_chunks_are_fetched_in_parallel(self, db_session):
+        service = MarketDataService(db_session)
+        symbols = [f"S{i:03d}" for i in range(YFINANCE_BULK_CHUNK_SIZE * 3)]
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        class FakeTickers:
+            def __init__(self, names):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.pop()
+                self.tickers = {}
+
+        with patch("yfinance.Tickers", FakeTickers):
+            results = await service._bulk_fetch_from_yfinance(symbols)
+
+        assert set(results) == set(symbols)
+        assert max(peak) == 3
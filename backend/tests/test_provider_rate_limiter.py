@@ -0,0 +1,119 @@
+"""
+Tests for the per-provider token bucket rate limiter.
+
+Limits come from the provider's rate_limit_per_minute / rate_limit_per_day
+columns; concurrent callers wait only for their own share of the refill.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from src.services.market_data_service import MarketDataService
+from src.services.provider_rate_limiter import ProviderRateLimiter, TokenBucket
+
+
+def _provider(name: str = "alpha_vantage", per_minute=60, per_day=1000, api_key="key"):
+    return SimpleNamespace(name=name, rate_limit_per_minute=per_minute, rate_limit_per_day=per_day, api_key=api_key)
+
+
+class TestTokenBucket:
+    """Test suite for the token bucket arithmetic."""
+
+    def test_reserve_returns_wait_for_deficit(self):
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0)
+
+        assert bucket.reserve(now=0.0) == 0.0
+        assert bucket.reserve(now=0.0) == 0.0
+        assert bucket.reserve(now=0.0) == pytest.approx(1.0)
+        assert bucket.reserve(now=0.0) == pytest.approx(2.0)
+
+    def test_refill_is_capped_at_capacity(self):
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0)
+        bucket.reserve(now=0.0)
+
+        bucket.refill(now=100.0)
+
+        assert bucket.tokens == 2
+
+
+class TestProviderRateLimiter:
+    """Test suite for provider quota enforcement."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_limit_does_not_wait(self):
+        limiter = ProviderRateLimiter()
+        provider = _provider(per_minute=5)
+
+        with patch("src.services.provider_rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            results = await asyncio.gather(*(limiter.acquire(provider) for _ in range(5)))
+
+        assert all(results)
+        sleep.assert_not_called()
+        assert limiter.get_remaining_quota(provider)["available_now"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_staggered_by_refill_rate(self):
+        clock = [0.0]
+        limiter = ProviderRateLimiter(clock=lambda: clock[0])
+        provider = _provider(per_minute=60)  # One token per second
+
+        for _ in range(60):
+            await limiter.acquire(provider)
+
+        with patch("src.services.provider_rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            await asyncio.gather(*(limiter.acquire(provider) for _ in range(3)))
+
+        waits = sorted(call.args[0] for call in sleep.call_args_list)
+        assert waits == [pytest.approx(1.0), pytest.approx(2.0), pytest.approx(3.0)]
+        assert limiter.get_remaining_quota(provider)["throttled"] == 3
+
+    @pytest.mark.asyncio
+    async def test_daily_quota_rejects_calls(self):
+        limiter = ProviderRateLimiter()
+        provider = _provider(per_minute=None, per_day=2)
+
+        assert await limiter.acquire(provider)
+        assert await limiter.acquire(provider)
+        assert not await limiter.acquire(provider)
+
+        quota = limiter.get_remaining_quota(provider)
+        assert quota["remaining_today"] == 0
+        assert quota["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_beyond_max_is_rejected_and_refunded(self):
+        limiter = ProviderRateLimiter(max_wait_seconds=5, clock=lambda: 0.0)
+        provider = _provider(per_minute=1)
+
+        assert await limiter.acquire(provider)
+        assert not await limiter.acquire(provider)
+
+        assert limiter.get_remaining_quota(provider)["used_today"] == 1
+
+    def test_unconfigured_provider_is_unlimited(self):
+        quota = ProviderRateLimiter().get_remaining_quota(_provider(per_minute=None, per_day=None))
+
+        assert quota["available_now"] is None
+        assert quota["remaining_today"] is None
+
+    @pytest.mark.asyncio
+    async def test_individual_fetches_run_concurrently_without_fixed_sleeps(self, db_session):
+        service = MarketDataService(db_session)
+        provider = _provider(per_minute=500)
+        in_flight = []
+        peak = []
+
+        async def fake_fetch(symbol, api_key):
+            in_flight.append(symbol)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(symbol)
+            return {"price": 1.0}
+
+        with patch.object(service, "_fetch_from_alpha_vantage", side_effect=fake_fetch):
+            results = await service._fetch_individually(provider, ["A", "B", "C"])
+
+        assert set(results) == {"A", "B", "C"}
+        assert max(peak) == 3
@@ -0,0 +1,157 @@
+"""
+Tests for the scheduler engine.
+
+Scheduled fetches run as batch jobs bounded by max_concurrent_jobs, each
+attempt limited to timeout_seconds, symbols without a price retried up to
+retry_attempts times, and overlapping run requests share one cycle.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.scheduler_engine import SchedulerEngine
+from src.services.scheduler_service import SchedulerConfiguration
+from src.services.universe_refresh_scheduler import UniverseRefreshScheduler
+
+
+class TestSchedulerEngine:
+    """Test suite for the scheduler engine."""
+
+    @pytest.mark.asyncio
+    async def test_batch_jobs_respect_max_concurrent_jobs(self):
+        engine = SchedulerEngine()
+        config = SchedulerConfiguration(max_concurrent_jobs=2)
+        active = 0
+        peak = 0
+
+        service = AsyncMock()
+
+        async def fetch_multiple_prices(symbols):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {symbol: {"price": 1} for symbol in symbols}
+
+        service.fetch_multiple_prices.side_effect = fetch_multiple_prices
+
+        async def fetch_batch(batch):
+            return await engine._run_job(service, batch, config)
+
+        results = await UniverseRefreshScheduler().refresh(
+            service,
+            [f"S{i}" for i in range(10)],
+            batch_size=2,
+            max_concurrency=config.max_concurrent_jobs,
+            fetch_batch=fetch_batch
+        )
+
+        assert len(results) == 10
+        assert peak == 2
+        assert engine.get_stats()["peak_in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_out_job_is_retried(self):
+        engine = SchedulerEngine(retry_backoff_seconds=0)
+        config = SchedulerConfiguration(retry_attempts=2, timeout_seconds=0.01)
+        calls = 0
+
+        service = AsyncMock()
+
+        async def fetch_multiple_prices(symbols):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(1)
+            return {symbol: {"price": 1} for symbol in symbols}
+
+        service.fetch_multiple_prices.side_effect = fetch_multiple_prices
+
+        results = await engine._run_job(service, ["CBA"], config)
+
+        assert results == {"CBA": {"price": 1}}
+        stats = engine.get_stats()
+        assert stats["timeouts"] == 1
+        assert stats["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_failed_symbols_are_retried(self):
+        engine = SchedulerEngine(retry_backoff_seconds=0)
+        config = SchedulerConfiguration(retry_attempts=2)
+        requested = []
+
+        service = AsyncMock()
+
+        async def fetch_multiple_prices(symbols):
+            requested.append(list(symbols))
+            # The provider fails for BHP on the first attempt only
+            return {symbol: None if symbol == "BHP" and len(requested) == 1 else {"price": 1} for symbol in symbols}
+
+        service.fetch_multiple_prices.side_effect = fetch_multiple_prices
+
+        results = await engine._run_job(service, ["CBA", "BHP"], config)
+
+        assert results == {"CBA": {"price": 1}, "BHP": {"price": 1}}
+        assert requested == [["CBA", "BHP"], ["BHP"]]
+        assert engine.get_stats()["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_job_fails_after_retry_attempts(self):
+        engine = SchedulerEngine(retry_backoff_seconds=0)
+        config = SchedulerConfiguration(retry_attempts=2)
+
+        # Provider outages come back as an empty result, not an exception
+        service = AsyncMock()
+        service.fetch_multiple_prices.return_value = {}
+
+        results = await engine._run_job(service, ["CBA"], config)
+
+        assert results == {"CBA": None}
+        assert service.fetch_multiple_prices.await_count == 3
+        stats = engine.get_stats()
+        assert stats["retries"] == 2
+        assert stats["jobs_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_overlapping_runs_share_one_cycle(self, monkeypatch):
+        engine = SchedulerEngine()
+        cycles = 0
+
+        async def run_cycle(scheduler, poll_interval_seconds=None):
+            nonlocal cycles
+            cycles += 1
+            await asyncio.sleep(0.01)
+            return {"status": "completed", "cycle": cycles}
+
+        monkeypatch.setattr(engine, "_run_cycle", run_cycle)
+
+        first, second = await asyncio.gather(engine.run_now(object()), engine.run_now(object()))
+
+        assert cycles == 1
+        assert first == second
+        assert engine.get_stats()["coalesced_runs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_call_budget_uses_the_polling_cadence(self, monkeypatch):
+        engine = SchedulerEngine()
+        planner = MagicMock()
+        planner.min_poll_seconds = 60.0
+        planner.plan.return_value = MagicMock(symbols=[], next_poll_seconds=120.0, deferred=0)
+        monkeypatch.setattr("src.services.scheduler_engine.get_polling_planner", lambda: planner)
+        monkeypatch.setattr("src.services.scheduler_engine.MarketDataService", MagicMock())
+        monkeypatch.setattr("src.services.scheduler_engine.log_provider_activity", MagicMock())
+        refresher = MagicMock()
+        refresher.refresh = AsyncMock(return_value={})
+        monkeypatch.setattr("src.services.scheduler_engine.get_universe_refresh_scheduler", lambda: refresher)
+        scheduler = MagicMock(configuration=SchedulerConfiguration(interval_minutes=15), _next_run=None)
+
+        await engine.run_now(scheduler)
+        await engine.run_now(scheduler, poll_interval_seconds=300.0)
+        await engine.run_now(scheduler)
+
+        # Never the 15 minute configured interval: the first plan assumes the
+        # shortest cadence, later ones the cadence the loop actually runs at
+        cycle_seconds = [call.args[1] for call in planner.get_call_budget.call_args_list]
+        assert cycle_seconds == [60.0, 300.0, 120.0]
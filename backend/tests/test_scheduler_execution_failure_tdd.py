@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 
 from src.services.scheduler_service import MarketDataSchedulerService, SchedulerState
 from src.services.market_data_service import MarketDataService
-from src.main import periodic_price_updates, scheduler_paused
+from src.services.scheduler_engine import SchedulerEngine
 
 
 class TestSchedulerExecutionFailure:
@@ -52,52 +52,50 @@ class TestSchedulerExecutionFailure:
         """
         FAILING TEST: Background task execution should be independent of scheduler service.
 
-        The background task in main.py should execute regardless of scheduler service state.
+        The scheduler engine's background loop should execute regardless of scheduler service state.
         This test will expose if there's a missing connection.
         """
-        # Mock the global scheduler_paused flag as False
-        with patch('src.main.scheduler_paused', False):
-            # Mock MarketDataService to avoid actual API calls
-            with patch('src.main.MarketDataService') as mock_service_class:
-                mock_service = AsyncMock()
-                mock_service.get_enabled_providers.return_value = [
-                    MagicMock(name="yfinance", api_key=None)
-                ]
-                mock_service.get_actively_monitored_symbols.return_value = ["CBA", "BHP"]
-                mock_service.fetch_multiple_prices.return_value = {"CBA": 170.0, "BHP": 41.0}
-                mock_service.close_session = AsyncMock()
-                mock_service_class.return_value = mock_service
-
-                # Mock get_db to return our test session
-                with patch('src.main.get_db') as mock_get_db:
-                    mock_get_db.return_value.__next__.return_value = db_session
-
-                    # Mock sleep to speed up test
-                    with patch('asyncio.sleep') as mock_sleep:
-                        mock_sleep.return_value = None
-
-                        # Run one cycle of the background task
-                        # This should fail because background task doesn't update scheduler service
-                        task = asyncio.create_task(periodic_price_updates())
-
-                        # Let it run briefly
-                        await asyncio.sleep(0.1)
-                        task.cancel()
-
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-
-                        # The background task should have attempted to fetch prices
-                        mock_service.fetch_multiple_prices.assert_called()
-
-                        # But scheduler service should still show last_run as None
-                        # This exposes the disconnect
-                        scheduler = MarketDataSchedulerService(db_session, auto_start=False)
-                        status = scheduler.status_info
-                        assert status["last_run"] is None, \
-                            "Background task execution doesn't update scheduler service last_run"
+        # Mock MarketDataService to avoid actual API calls
+        with patch('src.services.scheduler_engine.MarketDataService') as mock_service_class:
+            mock_service = AsyncMock()
+            mock_service.get_enabled_providers.return_value = [
+                MagicMock(name="yfinance", api_key=None)
+            ]
+            mock_service.get_actively_monitored_symbols.return_value = ["CBA", "BHP"]
+            mock_service.fetch_multiple_prices.return_value = {"CBA": 170.0, "BHP": 41.0}
+            mock_service.close_session = AsyncMock()
+            mock_service_class.return_value = mock_service
+
+            # Mock get_db to return our test session
+            with patch('src.services.scheduler_engine.get_db') as mock_get_db:
+                mock_get_db.return_value.__next__.return_value = db_session
+
+                # Mock sleep to speed up test
+                with patch('asyncio.sleep') as mock_sleep:
+                    mock_sleep.return_value = None
+
+                    # Run one cycle of the background task
+                    # This should fail because background task doesn't update scheduler service
+                    task = asyncio.create_task(SchedulerEngine().run_forever())
+
+                    # Let it run briefly
+                    await asyncio.sleep(0.1)
+                    task.cancel()
+
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+
+                    # The background task should have attempted to fetch prices
+                    mock_service.fetch_multiple_prices.assert_called()
+
+                    # But scheduler service should still show last_run as None
+                    # This exposes the disconnect
+                    scheduler = MarketDataSchedulerService(db_session, auto_start=False)
+                    status = scheduler.status_info
+                    assert status["last_run"] is None, \
+                        "Background task execution doesn't update scheduler service last_run"
 
     def test_scheduler_service_and_background_task_are_disconnected(self, db_session: Session):
         """
@@ -139,7 +137,7 @@ class TestSchedulerExecutionFailure:
         # This is currently not happening - they're separate systems
 
         # Mock the background task execution
-        with patch('src.main.MarketDataService') as mock_service_class:
+        with patch('src.services.scheduler_engine.MarketDataService') as mock_service_class:
             mock_service = AsyncMock()
             mock_service.get_enabled_providers.return_value = []
             mock_service.get_actively_monitored_symbols.return_value = ["CBA"]
@@ -148,7 +146,7 @@ class TestSchedulerExecutionFailure:
             mock_service_class.return_value = mock_service
 
             # Mock get_db
-            with patch('src.main.get_db') as mock_get_db:
+            with patch('src.services.scheduler_engine.get_db') as mock_get_db:
                 mock_get_db.return_value.__next__.return_value = db_session
 
                 # The background task should update scheduler service after execution
@@ -0,0 +1,73 @@
+"""
+Tests for the in-memory SSE connection registry.
+
+Heartbeats and message counts must stay in memory, changed connections must
+be written to sse_connections in batches, and admin disconnects must wake the
+stream without any polling.
+"""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models import User
+from src.models.sse_connection import SSEConnection
+from src.services.sse_connection_registry import SSEConnectionRegistry
+
+
+class TestSSEConnectionRegistry:
+    """Test suite for the SSE connection registry."""
+
+    @pytest.fixture
+    def user(self, db_session: Session):
+        user = User(email="stream@example.com", password_hash="hashed", first_name="Stream", last_name="User")
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    def test_heartbeats_are_written_in_one_flush(self, db_session: Session, user):
+        registry = SSEConnectionRegistry()
+        for i in range(3):
+            registry.register(db_session.get_bind(), f"conn-{i}", user.id, subscribed_symbols=["CBA"])
+
+        for _ in range(5):
+            registry.heartbeat("conn-0")
+        registry.record_sent("conn-0", 4)
+
+        # Nothing is written until the registry flushes
+        assert db_session.query(SSEConnection).count() == 0
+
+        assert registry.flush() == 3
+        row = db_session.query(SSEConnection).filter(SSEConnection.connection_id == "conn-0").one()
+        assert row.is_active
+        assert row.messages_sent == 4
+        assert row.subscribed_symbols == ["CBA"]
+
+        # Unchanged connections are not written again
+        assert registry.flush() == 0
+
+    def test_closed_connections_are_written_then_forgotten(self, db_session: Session, user):
+        registry = SSEConnectionRegistry()
+        registry.register(db_session.get_bind(), "conn", user.id)
+        registry.flush()
+
+        registry.unregister("conn")
+        registry.flush()
+
+        db_session.expire_all()
+        row = db_session.query(SSEConnection).one()
+        assert not row.is_active
+        assert row.disconnected_at is not None
+        assert registry.get_connections(active_only=False) == []
+
+    def test_admin_disconnect_wakes_the_stream(self, db_session: Session, user):
+        registry = SSEConnectionRegistry()
+        woken = []
+        registry.register(db_session.get_bind(), "conn", user.id, on_disconnect=lambda: woken.append(True))
+
+        assert registry.disconnect("conn")
+
+        assert woken == [True]
+        assert not registry.is_active("conn")
+        assert not registry.heartbeat("conn")
+        assert not registry.disconnect("missing")
+        assert registry.get_stats()["admin_disconnects"] == 1
@@ -0,0 +1,70 @@
+"""
+Tests for per-connection SSE price payload encoding.
+
+Delta mode must send only changed fields with periodic full snapshots, and
+compact mode must use short keys, integer prices and epoch timestamps.
+"""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from src.services.price_snapshot_service import PriceSnapshot
+from src.services.sse_payload_encoder import PRICE_SCALE, PriceStreamEncoder
+
+FETCHED_AT = datetime(2026, 10, 16, 1, 0)
+
+
+def _snapshot(symbol: str, price: str, volume: int = 1000) -> PriceSnapshot:
+    return PriceSnapshot(symbol=symbol, price=Decimal(price), last_updated=FETCHED_AT, volume=volume)
+
+
+def _event(line: str) -> dict:
+    assert line.startswith("data: ")
+    return json.loads(line[6:])
+
+
+class TestPriceStreamEncoder:
+    """Test suite for the SSE price payload encoder."""
+
+    def test_full_mode_sends_every_field(self):
+        encoder = PriceStreamEncoder()
+
+        encoder.encode_prices({"CBA": _snapshot("CBA", "100.00")})
+        event = _event(encoder.encode_prices({"CBA": _snapshot("CBA", "100.00")}))
+
+        assert event["data"]["CBA"] == {"price": 100.0, "volume": 1000, "fetched_at": "2026-10-16T01:00:00Z"}
+
+    def test_delta_mode_sends_only_changed_fields(self):
+        encoder = PriceStreamEncoder(delta=True)
+
+        first = _event(encoder.encode_prices({"CBA": _snapshot("CBA", "100.00"), "BHP": _snapshot("BHP", "40.00")}))
+        second = _event(encoder.encode_prices({"CBA": _snapshot("CBA", "101.00"), "BHP": _snapshot("BHP", "40.00")}))
+
+        assert set(first["data"]["CBA"]) == {"price", "volume", "fetched_at"}
+        assert second["delta"] is True
+        assert second["data"] == {"CBA": {"price": 101.0}}
+        assert encoder.encode_prices({"BHP": _snapshot("BHP", "40.00")}) is None
+
+    def test_delta_mode_resynchronises_with_full_snapshot(self):
+        encoder = PriceStreamEncoder(delta=True, full_snapshot_seconds=0)
+        encoder.encode_prices({"CBA": _snapshot("CBA", "100.00")})
+        encoder.encode_prices({"CBA": _snapshot("CBA", "101.00")})
+
+        assert encoder.full_snapshot_due()
+        event = _event(encoder.encode_full_snapshot())
+
+        assert event["full"] is True
+        assert event["data"]["CBA"]["price"] == 101.0
+        assert event["data"]["CBA"]["volume"] == 1000
+
+    def test_compact_mode_uses_short_keys_and_integer_prices(self):
+        encoder = PriceStreamEncoder(compact=True)
+
+        line = encoder.encode_prices({"CBA": _snapshot("CBA", "100.1234")})
+        event = _event(line)
+
+        assert " " not in line[6:]
+        assert event["data"]["CBA"] == {"p": 1001234, "v": 1000, "t": 1792112400}
+        assert encoder.describe()["price_scale"] == PRICE_SCALE
+        assert encoder.describe()["keys"]["p"] == "price"
@@ -0,0 +1,120 @@
+"""
+Tests for the symbol -> portfolio reverse index used for update fan-out.
+
+The index must be built from active holdings, kept in step by the transaction
+service, and let bulk price updates find affected portfolios without querying.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models import Holding, Portfolio, Stock
+from src.models.transaction import TransactionType
+from src.schemas.transaction import TransactionCreate
+from src.services.market_data_service import MarketDataService
+from src.services.symbol_portfolio_index import SymbolPortfolioIndex, get_symbol_portfolio_index
+from src.services.transaction_service import delete_transaction, process_transaction, update_transaction
+
+
+def _buy(symbol: str, quantity: int = 10) -> TransactionCreate:
+    return TransactionCreate(
+        stock_symbol=symbol,
+        transaction_type=TransactionType.BUY,
+        quantity=quantity,
+        price_per_share=Decimal("10.00"),
+        transaction_date="2025-09-13"
+    )
+
+
+class TestSymbolPortfolioIndex:
+    """Test suite for the symbol portfolio index."""
+
+    @pytest.fixture
+    def portfolios(self, db_session: Session):
+        """Two active portfolios sharing CBA, plus an inactive one holding BHP."""
+        first = Portfolio(name="First", owner_id=uuid4())
+        second = Portfolio(name="Second", owner_id=uuid4())
+        inactive = Portfolio(name="Closed", owner_id=uuid4(), is_active=False)
+        cba = Stock(symbol="CBA", company_name="CBA Ltd", exchange="ASX")
+        bhp = Stock(symbol="BHP", company_name="BHP Ltd", exchange="ASX")
+        db_session.add_all([first, second, inactive, cba, bhp])
+        db_session.flush()
+
+        db_session.add_all([
+            Holding(portfolio_id=first.id, stock_id=cba.id, quantity=Decimal("10"), average_cost=Decimal("100")),
+            Holding(portfolio_id=first.id, stock_id=bhp.id, quantity=Decimal("0"), average_cost=Decimal("40")),
+            Holding(portfolio_id=second.id, stock_id=cba.id, quantity=Decimal("5"), average_cost=Decimal("100")),
+            Holding(portfolio_id=inactive.id, stock_id=bhp.id, quantity=Decimal("5"), average_cost=Decimal("40")),
+        ])
+        db_session.commit()
+        return first.id, second.id, inactive.id
+
+    def test_build_indexes_active_positive_holdings(self, db_session: Session, portfolios):
+        first, second = str(portfolios[0]), str(portfolios[1])
+        index = SymbolPortfolioIndex()
+        index.build(db_session)
+
+        assert index.get_portfolios_for_symbol("CBA") == {first, second}
+        assert index.get_portfolios_for_symbol("BHP") == set()
+        assert index.get_portfolio_symbols(["BHP", "CBA"]) == {first: ["CBA"], second: ["CBA"]}
+
+    def test_transactions_update_index(self, db_session: Session, portfolios):
+        first_id, _, _ = portfolios
+        first, second = str(first_id), str(portfolios[1])
+        index = get_symbol_portfolio_index()
+        index.build(db_session)
+
+        bought = process_transaction(db_session, first_id, _buy("WBC"))
+        assert index.get_portfolios_for_symbol("WBC") == {first}
+
+        sold = process_transaction(db_session, first_id, _buy("WBC").model_copy(
+            update={"transaction_type": TransactionType.SELL}
+        ))
+        assert index.get_portfolios_for_symbol("WBC") == set()
+
+        delete_transaction(db_session, first_id, sold.id)
+        assert index.get_portfolios_for_symbol("WBC") == {first}
+
+        update_transaction(db_session, first_id, bought.id, {"quantity": Decimal("5")})
+        assert index.get_portfolios_for_symbol("WBC") == {first}
+        assert index.get_portfolios_for_symbol("CBA") == {first, second}
+
+    def test_remove_portfolio(self, db_session: Session, portfolios):
+        first, second = str(portfolios[0]), str(portfolios[1])
+        index = SymbolPortfolioIndex()
+        index.build(db_session)
+
+        index.remove_portfolio(first)
+
+        assert index.get_portfolios_for_symbol("CBA") == {second}
+        assert index.get_stats()["portfolios"] == 1
+
+    def test_bulk_trigger_uses_index_without_queries(self, db_session: Session, portfolios):
+        first, second = str(portfolios[0]), str(portfolios[1])
+        get_symbol_portfolio_index().build(db_session)
+        queue = MagicMock()
+        queue.queue_portfolio_update.return_value = True
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            with patch("src.services.portfolio_update_queue.get_portfolio_update_queue", return_value=queue):
+                MarketDataService(db_session)._trigger_bulk_portfolio_updates(["CBA", "BHP", "ZZZ"])
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert statements == []
+        queued = {
+            call.kwargs["portfolio_id"]: call.kwargs["symbols"]
+            for call in queue.queue_portfolio_update.call_args_list
+        }
+        assert queued == {first: ["CBA"], second: ["CBA"]}
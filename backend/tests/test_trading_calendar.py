@@ -0,0 +1,92 @@
+"""
+Tests for the exchange trading calendar.
+
+Sessions, holidays and timezones for ASX and US exchanges decide when prices
+can change, so fetching and revaluation can be skipped while markets are closed.
+"""
+
+import pytest
+from datetime import date, datetime, timezone
+
+from src.services.portfolio_update_queue import PortfolioUpdateQueue
+from src.services.trading_calendar import TradingCalendar, asx_holidays, us_holidays
+
+
+# Friday 16 October 2026, 12:00 in Sydney and 21:00 the previous evening in New York
+ASX_MIDDAY = datetime(2026, 10, 16, 1, 0, tzinfo=timezone.utc)
+# Saturday 17 October 2026
+WEEKEND = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+class TestHolidays:
+    """Test suite for rule-based holiday generation."""
+
+    def test_asx_holidays_move_weekend_christmas_and_boxing_day(self):
+        holidays = asx_holidays(2026)
+
+        assert date(2026, 4, 3) in holidays  # Good Friday
+        assert date(2026, 4, 6) in holidays  # Easter Monday
+        assert date(2026, 6, 8) in holidays  # King's Birthday
+        assert date(2026, 12, 25) in holidays
+        assert date(2026, 12, 28) in holidays  # Boxing Day (Saturday) observed Monday
+
+    def test_us_holidays_observe_nearest_weekday(self):
+        holidays = us_holidays(2026)
+
+        assert date(2026, 7, 3) in holidays  # Independence Day (Saturday) observed Friday
+        assert date(2026, 11, 26) in holidays  # Thanksgiving
+        assert date(2026, 6, 19) in holidays  # Juneteenth
+
+
+class TestTradingCalendar:
+    """Test suite for market hours queries."""
+
+    def test_symbols_map_to_exchanges(self):
+        calendar = TradingCalendar()
+
+        assert calendar.get_exchange_for_symbol("CBA") == "ASX"
+        assert calendar.get_exchange_for_symbol("XYZW.AX") == "ASX"
+        assert calendar.get_exchange_for_symbol("AAPL") == "NASDAQ"
+
+    def test_sessions_follow_exchange_timezones(self):
+        calendar = TradingCalendar()
+
+        assert calendar.is_open("ASX", ASX_MIDDAY)
+        assert not calendar.is_open("NASDAQ", ASX_MIDDAY)
+        assert calendar.next_open("NASDAQ", ASX_MIDDAY) == datetime(2026, 10, 16, 13, 30, tzinfo=timezone.utc)
+
+    def test_weekend_is_closed_until_next_session(self):
+        calendar = TradingCalendar()
+
+        assert not calendar.any_open(["CBA", "AAPL"], WEEKEND)
+        # ASX opens Monday 10:00 AEDT, which is Sunday 23:00 UTC
+        assert calendar.next_open("ASX", WEEKEND) == datetime(2026, 10, 18, 23, 0, tzinfo=timezone.utc)
+        assert calendar.seconds_until_next_open(["CBA", "AAPL"], WEEKEND) == pytest.approx(35 * 3600)
+
+    def test_closed_market_needs_refresh_only_until_closing_price_is_stored(self):
+        calendar = TradingCalendar()
+        last_close = calendar.last_close("ASX", WEEKEND)
+
+        assert calendar.needs_refresh("CBA", None, WEEKEND)
+        assert calendar.needs_refresh("CBA", datetime(2026, 10, 16, 4, 0), WEEKEND)
+        assert not calendar.needs_refresh("CBA", last_close, WEEKEND)
+        assert calendar.needs_refresh("CBA", datetime(2026, 10, 16, 4, 0), ASX_MIDDAY)
+
+
+class TestClosedMarketDebounce:
+    """Test suite for market-hours aware debouncing in the update queue."""
+
+    def test_routine_updates_wait_longer_when_markets_closed(self, monkeypatch):
+        calendar = TradingCalendar()
+        monkeypatch.setattr(
+            "src.services.portfolio_update_queue.get_trading_calendar",
+            lambda: calendar
+        )
+        monkeypatch.setattr(calendar, "any_open", lambda symbols: False)
+        queue = PortfolioUpdateQueue(debounce_seconds=1.0, closed_market_debounce_seconds=60.0)
+
+        queue.queue_portfolio_update("routine", ["CBA"])
+        queue.queue_portfolio_update("manual", ["CBA"], priority=3)
+
+        assert queue._pending_updates["routine"].debounce_seconds == 60.0
+        assert queue._pending_updates["manual"].debounce_seconds == 1.0
@@ -0,0 +1,94 @@
+"""
+Tests for the full-universe refresh scheduler.
+
+Every monitored symbol must be refreshed each cycle in provider-sized batches,
+stalest first, with per-symbol freshness tracked for coverage reporting.
+"""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from src.services.universe_refresh_scheduler import UniverseRefreshScheduler
+
+
+def _service(failing_symbols=()):
+    service = AsyncMock()
+
+    async def fetch_multiple_prices(symbols):
+        return {
+            symbol: None if symbol in failing_symbols else {"symbol": symbol, "price": Decimal("1.00")}
+            for symbol in symbols
+        }
+
+    service.fetch_multiple_prices.side_effect = fetch_multiple_prices
+    return service
+
+
+class TestUniverseRefreshScheduler:
+    """Test suite for the universe refresh scheduler."""
+
+    def test_plan_batches_covers_whole_universe(self):
+        scheduler = UniverseRefreshScheduler()
+        universe = [f"S{i:03d}" for i in range(120)]
+
+        batches = scheduler.plan_batches(universe, batch_size=50)
+
+        assert [len(batch) for batch in batches] == [50, 50, 20]
+        assert sorted(symbol for batch in batches for symbol in batch) == universe
+
+    @pytest.mark.asyncio
+    async def test_refresh_fetches_every_batch(self):
+        scheduler = UniverseRefreshScheduler()
+        service = _service()
+        universe = [f"S{i:03d}" for i in range(120)]
+
+        results = await scheduler.refresh(service, universe, batch_size=50)
+
+        assert service.fetch_multiple_prices.await_count == 3
+        assert all(results[symbol] is not None for symbol in universe)
+        stats = scheduler.get_stats()
+        assert stats["universe_size"] == 120
+        assert stats["fresh"] == 120
+        assert stats["coverage"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_symbols_are_scheduled_first_next_cycle(self):
+        scheduler = UniverseRefreshScheduler()
+        universe = ["AAA", "BBB", "CCC", "DDD"]
+
+        await scheduler.refresh(_service(failing_symbols={"DDD"}), universe, batch_size=2)
+
+        assert scheduler.get_last_refreshed("DDD") is None
+        assert scheduler.plan_batches(universe, batch_size=2)[0][0] == "DDD"
+        assert scheduler.get_stats()["never_refreshed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_does_not_stop_remaining_batches(self):
+        scheduler = UniverseRefreshScheduler()
+        service = _service()
+        calls = []
+
+        async def flaky_fetch(symbols):
+            calls.append(symbols)
+            if len(calls) == 1:
+                raise RuntimeError("provider down")
+            return {symbol: {"symbol": symbol} for symbol in symbols}
+
+        service.fetch_multiple_prices.side_effect = flaky_fetch
+
+        results = await scheduler.refresh(service, ["AAA", "BBB", "CCC"], batch_size=1)
+
+        assert len(calls) == 3
+        assert sum(1 for result in results.values() if result is not None) == 2
+        assert scheduler.get_stats()["batches_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_symbols_leaving_universe_are_forgotten(self):
+        scheduler = UniverseRefreshScheduler()
+
+        await scheduler.refresh(_service(), ["AAA", "BBB"], batch_size=10)
+        await scheduler.refresh(_service(), ["AAA"], batch_size=10)
+
+        assert scheduler.get_last_refreshed("BBB") is None
+        assert scheduler.get_stats()["universe_size"] == 1